@@ -0,0 +1,158 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Benchmark the timeout of unary calls against an in-process gRPC server.
+
+It compares wrapping each call in `asyncio.wait_for` with passing the timeout
+to gRPC as the deadline of the call. The calls are sent to a local server over
+a real channel, so the timings include the whole client and server stack, both
+for sequential calls and for many calls in flight at the same time.
+"""
+
+import asyncio
+import timeit
+from datetime import timedelta
+from typing import Any, Awaitable, Callable
+
+import grpc
+from frequenz.api.electricity_trading.v1 import (
+    electricity_trading_pb2,
+    electricity_trading_pb2_grpc,
+)
+
+from frequenz.client.electricity_trading._client import grpc_call_with_timeout
+
+CALLS = 2_000
+"""The number of calls to time for each variant."""
+
+ROUNDS = 5
+"""The number of times each variant is timed, alternating them, keeping the best."""
+
+CONCURRENCY = 100
+"""The number of calls in flight at the same time in the concurrent runs."""
+
+TIMEOUT = timedelta(seconds=10)
+"""The timeout of each call."""
+
+_REQUEST = electricity_trading_pb2.CancelAllGridpoolOrdersRequest(gridpool_id=1)
+
+
+_SERVICE = (
+    "frequenz.api.electricity_trading.electricity_trading.v1.ElectricityTradingService"
+)
+"""The full name of the gRPC service."""
+
+
+async def _cancel_all_gridpool_orders(
+    request: electricity_trading_pb2.CancelAllGridpoolOrdersRequest, _: Any
+) -> electricity_trading_pb2.CancelAllGridpoolOrdersResponse:
+    """Answer a request immediately.
+
+    Args:
+        request: The request.
+
+    Returns:
+        The response.
+    """
+    return electricity_trading_pb2.CancelAllGridpoolOrdersResponse(
+        gridpool_id=request.gridpool_id
+    )
+
+
+async def _wait_for_call(
+    stub: Any,
+) -> None:
+    """Send a call with `asyncio.wait_for`, as it was done before.
+
+    Args:
+        stub: The stub to send the call with.
+    """
+    await asyncio.wait_for(
+        stub.CancelAllGridpoolOrders(_REQUEST), timeout=TIMEOUT.total_seconds()
+    )
+
+
+async def _deadline_call(
+    stub: Any,
+) -> None:
+    """Send a call passing the timeout as the gRPC deadline.
+
+    Args:
+        stub: The stub to send the call with.
+    """
+    await grpc_call_with_timeout(
+        stub.CancelAllGridpoolOrders, _REQUEST, timeout=TIMEOUT
+    )
+
+
+async def _time(call: Callable[[], Awaitable[None]], concurrency: int) -> float:
+    """Time a number of calls.
+
+    Args:
+        call: The function sending one call.
+        concurrency: The number of calls in flight at the same time.
+
+    Returns:
+        The average time per call, in microseconds.
+    """
+
+    async def send(calls: int) -> None:
+        for _ in range(calls):
+            await call()
+
+    start = timeit.default_timer()
+    await asyncio.gather(*(send(CALLS // concurrency) for _ in range(concurrency)))
+    return (timeit.default_timer() - start) / CALLS * 1e6
+
+
+async def main() -> None:
+    """Run the benchmark."""
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                _SERVICE,
+                {
+                    "CancelAllGridpoolOrders": grpc.unary_unary_rpc_method_handler(
+                        _cancel_all_gridpool_orders,
+                        request_deserializer=(
+                            electricity_trading_pb2.CancelAllGridpoolOrdersRequest
+                        ).FromString,
+                        response_serializer=(
+                            electricity_trading_pb2.CancelAllGridpoolOrdersResponse
+                        ).SerializeToString,
+                    )
+                },
+            ),
+        )
+    )
+    port = server.add_insecure_port("localhost:0")
+    await server.start()
+    try:
+        async with grpc.aio.insecure_channel(f"localhost:{port}") as channel:
+            stub: Any = electricity_trading_pb2_grpc.ElectricityTradingServiceStub(
+                channel
+            )
+            # Warm up the connection.
+            await _deadline_call(stub)
+            for concurrency in (1, CONCURRENCY):
+                wait_for = deadline = float("inf")
+                for _ in range(ROUNDS):
+                    wait_for = min(
+                        wait_for,
+                        await _time(lambda: _wait_for_call(stub), concurrency),
+                    )
+                    deadline = min(
+                        deadline,
+                        await _time(lambda: _deadline_call(stub), concurrency),
+                    )
+                print(f"{concurrency} call(s) in flight:")
+                print(f"  asyncio.wait_for:   {wait_for:7.2f} µs/call")
+                print(f"  gRPC deadline:      {deadline:7.2f} µs/call")
+                print(f"  Saved per call:     {wait_for - deadline:7.2f} µs")
+    finally:
+        await server.stop(None)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
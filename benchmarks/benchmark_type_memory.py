@@ -0,0 +1,226 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Benchmark the memory used by orders, trades and their fields.
+
+It compares the slotted types with copies storing the same fields in an
+instance dictionary, like the types did before they used slots. The field
+values are shared between both, so only the memory of the objects themselves
+is measured.
+"""
+
+import copy
+import tracemalloc
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from functools import partial
+from typing import Any, Callable
+
+from frequenz.client.electricity_trading import (
+    Currency,
+    DeliveryArea,
+    DeliveryPeriod,
+    EnergyMarketCodeType,
+    MarketActor,
+    MarketSide,
+    Order,
+    OrderDetail,
+    OrderState,
+    OrderType,
+    Power,
+    Price,
+    PublicTrade,
+    StateDetail,
+    StateReason,
+    Trade,
+    TradeState,
+)
+
+OBJECTS = 20_000
+"""The number of orders and trades to create for each variant."""
+
+HOT_TYPES = (
+    DeliveryArea,
+    DeliveryPeriod,
+    Order,
+    OrderDetail,
+    Power,
+    Price,
+    PublicTrade,
+    StateDetail,
+    Trade,
+)
+"""The types stored in slots."""
+
+_START = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+_AREA = DeliveryArea(code="10YDE-EON------1", code_type=EnergyMarketCodeType.EUROPE_EIC)
+_AMOUNT = Decimal("50.25")
+_QUANTITY = Decimal("1.5")
+
+
+_DICT_TYPES: dict[type, type] = {}
+"""Classes storing the fields of each slotted type in an instance dictionary."""
+
+
+def _dict_backed(value: Any, *, deep: bool = True) -> Any:
+    """Copy a slotted object to an object storing its fields in a dictionary.
+
+    Args:
+        value: The object to copy.
+        deep: Whether to also copy the slotted objects in its fields.
+
+    Returns:
+        The copy, or the value itself if it isn't of a slotted type.
+    """
+    if not isinstance(value, HOT_TYPES):
+        return value
+    cls = type(value)
+    backed = _DICT_TYPES.setdefault(cls, type(cls.__name__, (), {}))()
+    for name in cls.__slots__:
+        field = getattr(value, name)
+        setattr(backed, name, _dict_backed(field) if deep else field)
+    return backed
+
+
+def _shallow_dict_backed(value: Any, _: int) -> Any:
+    """Copy a slotted object to a dictionary, sharing its fields.
+
+    Args:
+        value: The object to copy.
+
+    Returns:
+        The copy.
+    """
+    return _dict_backed(value, deep=False)
+
+
+def _indexed_dict_backed(objects: list[Any], index: int) -> Any:
+    """Copy an object of a list, and the slotted objects in its fields, to dictionaries.
+
+    Args:
+        objects: The objects to copy from.
+        index: The index of the object to copy.
+
+    Returns:
+        The copy.
+    """
+    return _dict_backed(objects[index])
+
+
+def _shallow_copy(value: Any, _: int) -> Any:
+    """Copy a slotted object, sharing its fields.
+
+    Args:
+        value: The object to copy.
+
+    Returns:
+        The copy.
+    """
+    return copy.copy(value)
+
+
+def _order_detail(order_id: int) -> OrderDetail:
+    """Create an order with fields shared with the other orders.
+
+    Args:
+        order_id: The ID of the order.
+
+    Returns:
+        The order.
+    """
+    return OrderDetail(
+        order_id=order_id,
+        order=Order(
+            delivery_area=DeliveryArea(code=_AREA.code, code_type=_AREA.code_type),
+            delivery_period=DeliveryPeriod(start=_START, duration=timedelta(hours=1)),
+            type=OrderType.LIMIT,
+            side=MarketSide.BUY,
+            price=Price(amount=_AMOUNT, currency=Currency.EUR),
+            quantity=Power(mw=_QUANTITY),
+        ),
+        state_detail=StateDetail(
+            state=OrderState.ACTIVE,
+            state_reason=StateReason.ADD,
+            market_actor=MarketActor.USER,
+        ),
+        open_quantity=Power(mw=_QUANTITY),
+        filled_quantity=Power(mw=_QUANTITY),
+        create_time=_START,
+        modification_time=_START,
+    )
+
+
+def _trade(trade_id: int) -> Trade:
+    """Create a trade with fields shared with the other trades.
+
+    Args:
+        trade_id: The ID of the trade.
+
+    Returns:
+        The trade.
+    """
+    return Trade(
+        id=trade_id,
+        order_id=trade_id,
+        side=MarketSide.SELL,
+        delivery_area=DeliveryArea(code=_AREA.code, code_type=_AREA.code_type),
+        delivery_period=DeliveryPeriod(start=_START, duration=timedelta(hours=1)),
+        execution_time=_START,
+        price=Price(amount=_AMOUNT, currency=Currency.EUR),
+        quantity=Power(mw=_QUANTITY),
+        state=TradeState.ACTIVE,
+    )
+
+
+def _traced_bytes(create: Callable[[int], Any]) -> float:
+    """Measure the memory allocated by creating objects.
+
+    Args:
+        create: The function creating an object from its index.
+
+    Returns:
+        The allocated bytes per object, including the reference to it in a list.
+    """
+    tracemalloc.start()
+    before, _ = tracemalloc.get_traced_memory()
+    objects = [create(index) for index in range(OBJECTS)]
+    after, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return (after - before) / len(objects)
+
+
+def main() -> None:
+    """Run the benchmark."""
+    order = _order_detail(1)
+    samples = [
+        order,
+        order.order,
+        order.state_detail,
+        order.order.price,
+        order.order.quantity,
+        order.order.delivery_area,
+        order.order.delivery_period,
+        _trade(1),
+    ]
+    print(f"{'Type':<16} {'dict':>8} {'slots':>8}")
+    for sample in samples:
+        dicts = _traced_bytes(partial(_shallow_dict_backed, sample))
+        slots = _traced_bytes(partial(_shallow_copy, sample))
+        print(f"{type(sample).__name__:<16} {dicts:8.0f} {slots:8.0f}")
+
+    orders = [_order_detail(index) for index in range(OBJECTS)]
+    trades = [_trade(index) for index in range(OBJECTS)]
+    for name, create, objects in (
+        ("OrderDetail", _order_detail, orders),
+        ("Trade", _trade, trades),
+    ):
+        slots = _traced_bytes(create)
+        dicts = _traced_bytes(partial(_indexed_dict_backed, objects))
+        print(
+            f"{name} and its nested objects: {dicts:4.0f} B with dicts, "
+            f"{slots:4.0f} B with slots, {1 - slots / dicts:.0%} saved"
+        )
+
+
+if __name__ == "__main__":
+    main()
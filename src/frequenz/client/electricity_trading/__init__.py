@@ -179,6 +179,10 @@ To get real-time updates on market trades, use the following code:
 
 """
 
+from ._batch import ColumnarBatch, OrderDetailBatch, PublicTradeBatch, TradeBatch
+from ._bulk import BulkOutcome, BulkResult
+from ._call_options import CallOptions
+from ._channel_pool import ConnectionLane, ConnectionLanes
 from ._client import (
     MAX_PRICE,
     MIN_PRICE,
@@ -187,6 +191,15 @@ from ._client import (
     PRECISION_DECIMAL_QUANTITY,
     Client,
 )
+from ._hedge import HedgePolicy, HedgeStats
+from ._lazy import LazyOrderDetail, LazyPublicTrade, LazyTrade
+from ._multiplex import FilteredStream
+from ._order_cache import OrderCache
+from ._positions import Position, PositionLedger
+from ._rate_limit import RateLimit, RateLimiterStats, RateLimits
+from ._retry import RetryPolicy
+from ._snapshot import SnapshotOverflowError, SnapshotSubscription
+from ._stream_cache import StreamCachePolicy, StreamCacheStats
 from ._types import (
     Currency,
     DeliveryArea,
@@ -215,29 +228,55 @@ from ._types import (
 from ._utils import quantize_quantity
 
 __all__ = [
+    "BulkOutcome",
+    "BulkResult",
+    "CallOptions",
     "Client",
+    "ColumnarBatch",
+    "ConnectionLane",
+    "ConnectionLanes",
     "Currency",
     "DeliveryArea",
     "DeliveryDuration",
     "DeliveryPeriod",
     "EnergyMarketCodeType",
+    "FilteredStream",
     "GridpoolOrderFilter",
     "GridpoolTradeFilter",
+    "HedgePolicy",
+    "HedgeStats",
+    "LazyOrderDetail",
+    "LazyPublicTrade",
+    "LazyTrade",
     "MarketSide",
     "MarketActor",
     "Order",
+    "OrderCache",
     "OrderDetail",
+    "OrderDetailBatch",
     "OrderExecutionOption",
     "OrderState",
     "OrderType",
+    "Position",
+    "PositionLedger",
     "Power",
     "Price",
     "PublicTrade",
+    "PublicTradeBatch",
     "PublicTradeFilter",
+    "RateLimit",
+    "RateLimiterStats",
+    "RateLimits",
+    "RetryPolicy",
+    "SnapshotOverflowError",
+    "SnapshotSubscription",
+    "StreamCachePolicy",
+    "StreamCacheStats",
     "UpdateOrder",
     "StateDetail",
     "StateReason",
     "Trade",
+    "TradeBatch",
     "TradeState",
     "MAX_PRICE",
     "MIN_PRICE",
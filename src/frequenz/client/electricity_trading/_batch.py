@@ -0,0 +1,516 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Columnar batches decoded straight from protobuf list responses."""
+
+from __future__ import annotations
+
+import dataclasses
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any, ClassVar, Iterable, Sequence, TypeVar, cast
+
+import numpy as np
+import numpy.typing as npt
+
+# pylint: disable=no-member
+from frequenz.api.common.v1.grid import delivery_area_pb2
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+from google.protobuf import timestamp_pb2
+
+from ._types import DeliveryArea, EnergyMarketCodeType
+
+if TYPE_CHECKING:
+    import pandas as pd
+    import pyarrow as pa
+
+BatchT = TypeVar("BatchT", bound="ColumnarBatch")
+"""The type of a columnar batch."""
+
+
+def _timestamps_ns(
+    timestamps: Sequence[timestamp_pb2.Timestamp],
+) -> npt.NDArray[np.int64]:
+    """Convert protobuf timestamps to nanoseconds since the epoch.
+
+    Args:
+        timestamps: The timestamps to convert.
+
+    Returns:
+        The nanoseconds since the UNIX epoch.
+    """
+    count = len(timestamps)
+    seconds = np.fromiter((ts.seconds for ts in timestamps), np.int64, count)
+    nanos = np.fromiter((ts.nanos for ts in timestamps), np.int64, count)
+    return seconds * 1_000_000_000 + nanos
+
+
+def _decimals(values: Iterable[str], count: int) -> npt.NDArray[np.float64]:
+    """Convert decimal strings to floats.
+
+    Args:
+        values: The decimal strings, empty for unset values.
+        count: The number of values.
+
+    Returns:
+        The values, `NaN` for unset values.
+    """
+    return np.fromiter((float(value or "nan") for value in values), np.float64, count)
+
+
+def _codes(values: Iterable[int], count: int) -> npt.NDArray[np.int32]:
+    """Convert protobuf enum values to an array.
+
+    Args:
+        values: The protobuf enum values.
+        count: The number of values.
+
+    Returns:
+        The enum values.
+    """
+    return np.fromiter(values, np.int32, count)
+
+
+class _AreaCategories:
+    """The delivery areas of a batch, with a code for each of them."""
+
+    def __init__(self) -> None:
+        """Initialize the categories."""
+        self._codes: dict[str, int] = {}
+        self.areas: list[DeliveryArea] = []
+        """The delivery areas, by code."""
+
+    def code(self, code: str, code_type: int) -> int:
+        """Get the code of a delivery area, adding it if needed.
+
+        Args:
+            code: The code identifying the delivery area.
+            code_type: The protobuf type of the code.
+
+        Returns:
+            The index of the delivery area.
+        """
+        index = self._codes.get(code)
+        if index is None:
+            index = self._codes[code] = len(self.areas)
+            self.areas.append(
+                DeliveryArea(code=code, code_type=EnergyMarketCodeType(code_type))
+            )
+        return index
+
+    def codes(
+        self, areas: Sequence[delivery_area_pb2.DeliveryArea]
+    ) -> npt.NDArray[np.int32]:
+        """Get the codes of protobuf delivery areas, adding the new ones.
+
+        Args:
+            areas: The protobuf delivery areas.
+
+        Returns:
+            The indexes of the delivery areas.
+        """
+        return np.fromiter(
+            (self.code(area.code, area.code_type) for area in areas),
+            np.int32,
+            len(areas),
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class ColumnarBatch:
+    """A batch of items stored as one NumPy array per field.
+
+    Times are stored as nanoseconds since the UNIX epoch, delivery areas as
+    indexes into `areas`, and enums as their protobuf values. Delivery areas are
+    identified by their code, which is unique across code types.
+    """
+
+    _TIME_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    """The columns holding times."""
+
+    _AREA_COLUMNS: ClassVar[tuple[str, ...]] = ()
+    """The columns holding delivery area indexes."""
+
+    areas: tuple[DeliveryArea, ...]
+    """The delivery areas referenced by the area columns."""
+
+    def __len__(self) -> int:
+        """Get the number of items in the batch.
+
+        Returns:
+            The number of items in the batch.
+        """
+        return len(next(iter(self.to_numpy().values())))
+
+    @classmethod
+    def concat(cls: type[BatchT], batches: Sequence[BatchT]) -> BatchT:
+        """Concatenate batches, merging their delivery areas.
+
+        Args:
+            batches: The batches to concatenate.
+
+        Returns:
+            A batch with the items of all the batches.
+
+        Raises:
+            ValueError: If there are no batches to concatenate.
+        """
+        if not batches:
+            raise ValueError("At least one batch is needed to concatenate.")
+        categories = _AreaCategories()
+        remaps = [
+            np.array(
+                [
+                    categories.code(area.code, area.code_type.value)
+                    for area in batch.areas
+                ],
+                dtype=np.int32,
+            )
+            for batch in batches
+        ]
+        columns: dict[str, Any] = {}
+        for field in dataclasses.fields(cls):
+            if field.name == "areas":
+                continue
+            arrays = [getattr(batch, field.name) for batch in batches]
+            if field.name in cls._AREA_COLUMNS:
+                arrays = [remap[codes] for remap, codes in zip(remaps, arrays)]
+            columns[field.name] = np.concatenate(arrays)
+        return cls(areas=tuple(categories.areas), **columns)
+
+    def to_numpy(self) -> dict[str, npt.NDArray[Any]]:
+        """Get the columns of the batch, without copying them.
+
+        Returns:
+            The arrays of the batch, by field name.
+        """
+        return {
+            field.name: getattr(self, field.name)
+            for field in dataclasses.fields(self)
+            if field.name != "areas"
+        }
+
+    def to_pandas(self) -> pd.DataFrame:
+        """Convert the batch to a pandas data frame, without copying the columns.
+
+        Times are converted to `datetime64[ns]` in UTC, without a timezone, as
+        adding one copies the column. Delivery areas are converted to
+        categoricals of their codes.
+
+        Returns:
+            The data frame, with a column per field.
+        """
+        # pylint: disable-next=import-outside-toplevel
+        import pandas as pd
+
+        area_codes = pd.Index([area.code for area in self.areas])
+        columns: dict[str, Any] = {}
+        for name, values in self.to_numpy().items():
+            if name in self._TIME_COLUMNS:
+                columns[name] = pd.Series(values.view("datetime64[ns]"), copy=False)
+            elif name in self._AREA_COLUMNS:
+                columns[name] = pd.Categorical.from_codes(
+                    cast(Sequence[int], values), area_codes
+                )
+            else:
+                columns[name] = values
+        return pd.DataFrame(columns, copy=False)
+
+    def to_arrow(self) -> pa.Table:
+        """Convert the batch to an Arrow table, without copying the columns.
+
+        Times are converted to UTC timestamps and delivery areas to dictionary
+        arrays of their codes.
+
+        Returns:
+            The table, with a column per field.
+
+        Raises:
+            ImportError: If `pyarrow` is not installed.
+        """
+        try:
+            # pylint: disable-next=import-outside-toplevel
+            import pyarrow as pa
+        except ImportError as exc:
+            raise ImportError(
+                "Converting batches to Arrow tables requires pyarrow, install it "
+                "with the `arrow` extra of frequenz-client-electricity-trading."
+            ) from exc
+
+        area_codes = pa.array([area.code for area in self.areas], pa.string())
+        columns: dict[str, Any] = {}
+        for name, values in self.to_numpy().items():
+            if name in self._TIME_COLUMNS:
+                columns[name] = pa.array(values, pa.timestamp("ns", tz="UTC"))
+            elif name in self._AREA_COLUMNS:
+                columns[name] = pa.DictionaryArray.from_arrays(values, area_codes)
+            else:
+                columns[name] = pa.array(values)
+        return pa.table(columns)
+
+
+@dataclass(frozen=True, eq=False)
+class PublicTradeBatch(ColumnarBatch):  # pylint: disable=too-many-instance-attributes
+    """A batch of public trades, stored as one NumPy array per field."""
+
+    _TIME_COLUMNS = ("execution_time", "delivery_start")
+    _AREA_COLUMNS = ("buy_delivery_area", "sell_delivery_area")
+
+    public_trade_id: npt.NDArray[np.int64]
+    """The IDs of the trades."""
+
+    buy_delivery_area: npt.NDArray[np.int32]
+    """The indexes of the delivery areas of the buy side in `areas`."""
+
+    sell_delivery_area: npt.NDArray[np.int32]
+    """The indexes of the delivery areas of the sell side in `areas`."""
+
+    delivery_start: npt.NDArray[np.int64]
+    """The starts of the delivery periods, in nanoseconds since the UNIX epoch."""
+
+    delivery_duration: npt.NDArray[np.int32]
+    """The durations of the delivery periods, as `DeliveryDuration` values."""
+
+    execution_time: npt.NDArray[np.int64]
+    """The execution times, in nanoseconds since the UNIX epoch."""
+
+    price: npt.NDArray[np.float64]
+    """The prices of the trades."""
+
+    currency: npt.NDArray[np.int32]
+    """The currencies of the prices, as `Currency` values."""
+
+    quantity: npt.NDArray[np.float64]
+    """The quantities of the trades, in MW."""
+
+    state: npt.NDArray[np.int32]
+    """The states of the trades, as `TradeState` values."""
+
+    @classmethod
+    def from_pb(
+        cls, public_trades: Sequence[electricity_trading_pb2.PublicTrade]
+    ) -> PublicTradeBatch:
+        """Decode protobuf public trades into a batch.
+
+        Args:
+            public_trades: The protobuf public trades, like the ones of a page of
+                a list response.
+
+        Returns:
+            The batch of public trades.
+        """
+        count = len(public_trades)
+        areas = _AreaCategories()
+        return cls(
+            public_trade_id=np.fromiter(
+                (trade.id for trade in public_trades), np.int64, count
+            ),
+            buy_delivery_area=areas.codes(
+                [trade.buy_delivery_area for trade in public_trades]
+            ),
+            sell_delivery_area=areas.codes(
+                [trade.sell_delivery_area for trade in public_trades]
+            ),
+            delivery_start=_timestamps_ns(
+                [trade.delivery_period.start for trade in public_trades]
+            ),
+            delivery_duration=_codes(
+                (trade.delivery_period.duration for trade in public_trades), count
+            ),
+            execution_time=_timestamps_ns(
+                [trade.execution_time for trade in public_trades]
+            ),
+            price=_decimals(
+                (trade.price.amount.value for trade in public_trades), count
+            ),
+            currency=_codes((trade.price.currency for trade in public_trades), count),
+            quantity=_decimals(
+                (trade.quantity.mw.value for trade in public_trades), count
+            ),
+            state=_codes((trade.state for trade in public_trades), count),
+            areas=tuple(areas.areas),
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class TradeBatch(ColumnarBatch):  # pylint: disable=too-many-instance-attributes
+    """A batch of gridpool trades, stored as one NumPy array per field."""
+
+    _TIME_COLUMNS = ("execution_time", "delivery_start")
+    _AREA_COLUMNS = ("delivery_area",)
+
+    id: npt.NDArray[np.int64]
+    """The IDs of the trades."""
+
+    order_id: npt.NDArray[np.int64]
+    """The IDs of the orders of the trades."""
+
+    side: npt.NDArray[np.int32]
+    """The market sides of the trades, as `MarketSide` values."""
+
+    delivery_area: npt.NDArray[np.int32]
+    """The indexes of the delivery areas of the trades in `areas`."""
+
+    delivery_start: npt.NDArray[np.int64]
+    """The starts of the delivery periods, in nanoseconds since the UNIX epoch."""
+
+    delivery_duration: npt.NDArray[np.int32]
+    """The durations of the delivery periods, as `DeliveryDuration` values."""
+
+    execution_time: npt.NDArray[np.int64]
+    """The execution times, in nanoseconds since the UNIX epoch."""
+
+    price: npt.NDArray[np.float64]
+    """The prices of the trades."""
+
+    currency: npt.NDArray[np.int32]
+    """The currencies of the prices, as `Currency` values."""
+
+    quantity: npt.NDArray[np.float64]
+    """The quantities of the trades, in MW."""
+
+    state: npt.NDArray[np.int32]
+    """The states of the trades, as `TradeState` values."""
+
+    @classmethod
+    def from_pb(cls, trades: Sequence[electricity_trading_pb2.Trade]) -> TradeBatch:
+        """Decode protobuf gridpool trades into a batch.
+
+        Args:
+            trades: The protobuf trades, like the ones of a page of a list
+                response.
+
+        Returns:
+            The batch of trades.
+        """
+        count = len(trades)
+        areas = _AreaCategories()
+        return cls(
+            id=np.fromiter((trade.id for trade in trades), np.int64, count),
+            order_id=np.fromiter((trade.order_id for trade in trades), np.int64, count),
+            side=_codes((trade.side for trade in trades), count),
+            delivery_area=areas.codes([trade.delivery_area for trade in trades]),
+            delivery_start=_timestamps_ns(
+                [trade.delivery_period.start for trade in trades]
+            ),
+            delivery_duration=_codes(
+                (trade.delivery_period.duration for trade in trades), count
+            ),
+            execution_time=_timestamps_ns([trade.execution_time for trade in trades]),
+            price=_decimals((trade.price.amount.value for trade in trades), count),
+            currency=_codes((trade.price.currency for trade in trades), count),
+            quantity=_decimals((trade.quantity.mw.value for trade in trades), count),
+            state=_codes((trade.state for trade in trades), count),
+            areas=tuple(areas.areas),
+        )
+
+
+@dataclass(frozen=True, eq=False)
+class OrderDetailBatch(ColumnarBatch):  # pylint: disable=too-many-instance-attributes
+    """A batch of gridpool orders, stored as one NumPy array per field.
+
+    Only the fields set for every order are included. The optional fields of
+    orders, like their stop price, validity or tag, can be read from the
+    protobuf messages listed with `Client.list_gridpool_orders_raw()`.
+    """
+
+    _TIME_COLUMNS = ("delivery_start", "create_time", "modification_time")
+    _AREA_COLUMNS = ("delivery_area",)
+
+    order_id: npt.NDArray[np.int64]
+    """The IDs of the orders."""
+
+    delivery_area: npt.NDArray[np.int32]
+    """The indexes of the delivery areas of the orders in `areas`."""
+
+    delivery_start: npt.NDArray[np.int64]
+    """The starts of the delivery periods, in nanoseconds since the UNIX epoch."""
+
+    delivery_duration: npt.NDArray[np.int32]
+    """The durations of the delivery periods, as `DeliveryDuration` values."""
+
+    type: npt.NDArray[np.int32]
+    """The types of the orders, as `OrderType` values."""
+
+    side: npt.NDArray[np.int32]
+    """The market sides of the orders, as `MarketSide` values."""
+
+    price: npt.NDArray[np.float64]
+    """The limit prices of the orders, `NaN` if not specified."""
+
+    currency: npt.NDArray[np.int32]
+    """The currencies of the prices, as `Currency` values."""
+
+    quantity: npt.NDArray[np.float64]
+    """The quantities of the orders, in MW, `NaN` if not specified."""
+
+    open_quantity: npt.NDArray[np.float64]
+    """The remaining open quantities of the orders, in MW."""
+
+    filled_quantity: npt.NDArray[np.float64]
+    """The filled quantities of the orders, in MW."""
+
+    state: npt.NDArray[np.int32]
+    """The states of the orders, as `OrderState` values."""
+
+    state_reason: npt.NDArray[np.int32]
+    """The reasons of the states, as `StateReason` values."""
+
+    market_actor: npt.NDArray[np.int32]
+    """The actors that caused the states, as `MarketActor` values."""
+
+    create_time: npt.NDArray[np.int64]
+    """The creation times, in nanoseconds since the UNIX epoch."""
+
+    modification_time: npt.NDArray[np.int64]
+    """The last modification times, in nanoseconds since the UNIX epoch."""
+
+    @classmethod
+    def from_pb(
+        cls, order_details: Sequence[electricity_trading_pb2.OrderDetail]
+    ) -> OrderDetailBatch:
+        """Decode protobuf gridpool orders into a batch.
+
+        Args:
+            order_details: The protobuf orders, like the ones of a page of a list
+                response.
+
+        Returns:
+            The batch of orders.
+        """
+        count = len(order_details)
+        orders = [detail.order for detail in order_details]
+        states = [detail.state_detail for detail in order_details]
+        areas = _AreaCategories()
+        return cls(
+            order_id=np.fromiter(
+                (detail.order_id for detail in order_details), np.int64, count
+            ),
+            delivery_area=areas.codes([order.delivery_area for order in orders]),
+            delivery_start=_timestamps_ns(
+                [order.delivery_period.start for order in orders]
+            ),
+            delivery_duration=_codes(
+                (order.delivery_period.duration for order in orders), count
+            ),
+            type=_codes((order.type for order in orders), count),
+            side=_codes((order.side for order in orders), count),
+            price=_decimals((order.price.amount.value for order in orders), count),
+            currency=_codes((order.price.currency for order in orders), count),
+            quantity=_decimals((order.quantity.mw.value for order in orders), count),
+            open_quantity=_decimals(
+                (detail.open_quantity.mw.value for detail in order_details), count
+            ),
+            filled_quantity=_decimals(
+                (detail.filled_quantity.mw.value for detail in order_details), count
+            ),
+            state=_codes((state.state for state in states), count),
+            state_reason=_codes((state.state_reason for state in states), count),
+            market_actor=_codes((state.market_actor for state in states), count),
+            create_time=_timestamps_ns(
+                [detail.create_time for detail in order_details]
+            ),
+            modification_time=_timestamps_ns(
+                [detail.modification_time for detail in order_details]
+            ),
+            areas=tuple(areas.areas),
+        )
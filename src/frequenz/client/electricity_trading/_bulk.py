@@ -0,0 +1,129 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Types and helpers for bulk requests."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Awaitable, Callable, Generic, Sequence, TypeVar
+
+RequestT = TypeVar("RequestT")
+"""The type of the individual requests of a bulk request."""
+
+ResultT = TypeVar("ResultT")
+"""The type of the result of the individual requests."""
+
+
+@dataclass(frozen=True)
+class BulkOutcome(Generic[RequestT, ResultT]):
+    """The outcome of a single request of a bulk request."""
+
+    request: RequestT
+    """The request this outcome belongs to."""
+
+    result: ResultT | None
+    """The result of the request, or `None` if it failed."""
+
+    error: Exception | None
+    """The error raised by the request, or `None` if it succeeded."""
+
+    latency: timedelta
+    """The time it took for the request to complete."""
+
+    @property
+    def succeeded(self) -> bool:
+        """Whether the request succeeded.
+
+        Returns:
+            `True` if the request succeeded, `False` otherwise.
+        """
+        return self.error is None
+
+
+@dataclass(frozen=True)
+class BulkResult(Generic[RequestT, ResultT]):
+    """The result of a bulk request."""
+
+    outcomes: list[BulkOutcome[RequestT, ResultT]]
+    """The outcome of every request, in the order they were given."""
+
+    elapsed: timedelta
+    """The time it took for the whole bulk request to complete."""
+
+    @property
+    def results(self) -> list[ResultT]:
+        """The results of the requests that succeeded.
+
+        Returns:
+            The results of the successful requests, in the order they were given.
+        """
+        return [
+            outcome.result
+            for outcome in self.outcomes
+            if outcome.error is None and outcome.result is not None
+        ]
+
+    @property
+    def failed(self) -> list[BulkOutcome[RequestT, ResultT]]:
+        """The outcomes of the requests that failed.
+
+        Returns:
+            The outcomes of the failed requests, in the order they were given.
+        """
+        return [outcome for outcome in self.outcomes if outcome.error is not None]
+
+
+async def run_bulk(
+    requests: Sequence[RequestT],
+    call: Callable[[RequestT], Awaitable[ResultT]],
+    *,
+    max_concurrency: int,
+) -> BulkResult[RequestT, ResultT]:
+    """Run many requests concurrently, collecting the outcome of each of them.
+
+    A failing request doesn't affect the others.
+
+    Args:
+        requests: The requests to run.
+        call: The function running a single request.
+        max_concurrency: The maximum number of requests in flight at the same time.
+
+    Returns:
+        The outcome of every request and the total elapsed time.
+
+    Raises:
+        ValueError: If `max_concurrency` is not positive.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer.")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(request: RequestT) -> BulkOutcome[RequestT, ResultT]:
+        async with semaphore:
+            start = time.monotonic()
+            try:
+                result = await call(request)
+            except Exception as exc:  # pylint: disable=broad-except
+                return BulkOutcome(
+                    request=request,
+                    result=None,
+                    error=exc,
+                    latency=timedelta(seconds=time.monotonic() - start),
+                )
+            return BulkOutcome(
+                request=request,
+                result=result,
+                error=None,
+                latency=timedelta(seconds=time.monotonic() - start),
+            )
+
+    start = time.monotonic()
+    outcomes = await asyncio.gather(*(run(request) for request in requests))
+    return BulkResult(
+        outcomes=list(outcomes), elapsed=timedelta(seconds=time.monotonic() - start)
+    )
@@ -0,0 +1,79 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Options of the gRPC calls sent by the client."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any
+
+import grpc
+
+
+@dataclass(frozen=True)
+class CallOptions:
+    """Options of the gRPC calls sent by the client.
+
+    Options that are `None` are left to their gRPC defaults, or to the options
+    they are merged into.
+    """
+
+    timeout: timedelta | None = None
+    """The timeout of unary calls.
+
+    It is sent to the server as the deadline of the call, so the server can stop
+    working on calls the client has already given up on. Ignored for streams.
+    """
+
+    compression: grpc.Compression | None = None
+    """The compression algorithm to use for the call."""
+
+    wait_for_ready: bool | None = None
+    """Whether to wait for the channel to be ready instead of failing fast."""
+
+    metadata: tuple[tuple[str, str], ...] = ()
+    """Additional metadata to send with the call."""
+
+    def merge(self, other: CallOptions | None) -> CallOptions:
+        """Override these options with the ones set in other options.
+
+        Args:
+            other: The options taking precedence, if any.
+
+        Returns:
+            The merged options. The metadata of both options is sent.
+        """
+        if other is None:
+            return self
+        return CallOptions(
+            timeout=other.timeout if other.timeout is not None else self.timeout,
+            compression=(
+                other.compression if other.compression is not None else self.compression
+            ),
+            wait_for_ready=(
+                other.wait_for_ready
+                if other.wait_for_ready is not None
+                else self.wait_for_ready
+            ),
+            metadata=self.metadata + other.metadata,
+        )
+
+    def to_kwargs(self, metadata: tuple[tuple[str, str], ...] = ()) -> dict[str, Any]:
+        """Get the keyword arguments to pass to a gRPC call.
+
+        The timeout is not included, as it is handled separately for unary calls.
+
+        Args:
+            metadata: The metadata to send before the metadata of these options.
+
+        Returns:
+            The keyword arguments of the options that are set.
+        """
+        kwargs: dict[str, Any] = {"metadata": metadata + self.metadata}
+        if self.compression is not None:
+            kwargs["compression"] = self.compression
+        if self.wait_for_ready is not None:
+            kwargs["wait_for_ready"] = self.wait_for_ready
+        return kwargs
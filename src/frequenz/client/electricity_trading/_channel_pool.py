@@ -0,0 +1,267 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""A pool of gRPC channels to spread the requests over several connections."""
+
+from __future__ import annotations
+
+import contextlib
+import itertools
+from dataclasses import dataclass, field
+from typing import Any, Callable, Generic, Iterator, TypeVar
+from urllib.parse import urlparse
+
+import grpc
+from frequenz.client.base.channel import (
+    ChannelOptions,
+    _get_contents,
+    _parse_query_params,
+)
+
+StubT = TypeVar("StubT")
+"""The type of the gRPC stub."""
+
+
+@dataclass(frozen=True)
+class ConnectionLane:
+    """A set of channels dedicated to a kind of requests."""
+
+    channels: int = 1
+    """The number of channels, each with its own connection, of the lane."""
+
+    channel_options: ChannelOptions = field(default_factory=ChannelOptions)
+    """The options of the channels of the lane, like the keep-alive settings.
+
+    Options given in the URL of the server take precedence.
+    """
+
+    max_concurrency: int | None = None
+    """The maximum number of unary calls in flight in the lane, if any.
+
+    Calls over the limit wait for others to finish before being sent.
+    """
+
+    def __post_init__(self) -> None:
+        """Validate the lane.
+
+        Raises:
+            ValueError: If the number of channels or the concurrency limit are not
+                positive.
+        """
+        if self.channels < 1:
+            raise ValueError("A lane needs at least one channel.")
+        if self.max_concurrency is not None and self.max_concurrency < 1:
+            raise ValueError("The concurrency limit of a lane must be positive.")
+
+
+@dataclass(frozen=True)
+class ConnectionLanes:
+    """Separate connections for the different kinds of requests sent by the client.
+
+    Requests of a kind without a lane use the shared channels of the client.
+    """
+
+    order_entry: ConnectionLane | None = None
+    """The lane for creating, updating and cancelling orders, if any."""
+
+    market_data: ConnectionLane | None = None
+    """The lane for getting and listing orders and trades, and for streams, if any."""
+
+
+def create_channel(server_url: str, defaults: ChannelOptions) -> grpc.aio.Channel:
+    """Create a channel of a pool from a URI, with its own connection.
+
+    The URI is parsed like `frequenz.client.base.channel.parse_grpc_uri()` does,
+    but the channel uses its own subchannel pool, as gRPC otherwise shares the
+    connection of the channels to the same target with the same options.
+
+    Args:
+        server_url: The gRPC URI of the server, in the format accepted by
+            `frequenz.client.base.channel.parse_grpc_uri()`.
+        defaults: The default options of the channel.
+
+    Returns:
+        A channel with its own connection to the server.
+
+    Raises:
+        ValueError: If the URI is invalid or contains unexpected components.
+    """
+    parsed_uri = urlparse(server_url)
+    if parsed_uri.scheme != "grpc":
+        raise ValueError(
+            f"Invalid scheme '{parsed_uri.scheme}' in the URI, expected 'grpc'",
+            server_url,
+        )
+    if not parsed_uri.hostname:
+        raise ValueError(f"Host name is missing in URI '{server_url}'", server_url)
+    for attr in ("path", "fragment", "params", "username", "password"):
+        if getattr(parsed_uri, attr):
+            raise ValueError(
+                f"Unexpected {attr} '{getattr(parsed_uri, attr)}' in the URI "
+                f"'{server_url}'",
+                server_url,
+            )
+    params = _parse_query_params(server_url, parsed_uri.query)
+    if parsed_uri.port is None and defaults.port is None:
+        raise ValueError(
+            f"The gRPC URI '{server_url}' doesn't specify a port and there is no "
+            "default."
+        )
+    target = (
+        parsed_uri.netloc if parsed_uri.port else f"{parsed_uri.netloc}:{defaults.port}"
+    )
+
+    options: list[tuple[str, Any]] = [("grpc.use_local_subchannel_pool", 1)]
+    if defaults.keep_alive.enabled if params.keep_alive is None else params.keep_alive:
+        interval = (
+            defaults.keep_alive.interval
+            if params.keep_alive_interval is None
+            else params.keep_alive_interval
+        )
+        timeout = (
+            defaults.keep_alive.timeout
+            if params.keep_alive_timeout is None
+            else params.keep_alive_timeout
+        )
+        options += [
+            ("grpc.http2.max_pings_without_data", 0),
+            ("grpc.keepalive_permit_without_calls", 1),
+            ("grpc.keepalive_time_ms", interval.total_seconds() * 1000),
+            ("grpc.keepalive_timeout_ms", timeout.total_seconds() * 1000),
+        ]
+
+    if defaults.ssl.enabled if params.ssl is None else params.ssl:
+        credentials = grpc.ssl_channel_credentials(
+            root_certificates=_get_contents(
+                "root certificates",
+                params.ssl_root_certificates_path,
+                defaults.ssl.root_certificates,
+            ),
+            private_key=_get_contents(
+                "private key", params.ssl_private_key_path, defaults.ssl.private_key
+            ),
+            certificate_chain=_get_contents(
+                "certificate chain",
+                params.ssl_certificate_chain_path,
+                defaults.ssl.certificate_chain,
+            ),
+        )
+        return grpc.aio.secure_channel(target, credentials, options)
+    return grpc.aio.insecure_channel(target, options)
+
+
+class ChannelPool(Generic[StubT]):  # pylint: disable=too-many-instance-attributes
+    """A pool of gRPC channels to the same server, each with its own connection.
+
+    Unary calls are spread over the unary channels, picking the channel with the
+    fewest calls in flight (round-robin between equally loaded channels).
+    Long-lived streams are pinned to separate stream channels, assigned
+    round-robin, so they don't compete with unary calls for the HTTP/2 streams of
+    a connection.
+    """
+
+    def __init__(
+        self,
+        create_stub: Callable[[grpc.aio.Channel], StubT],
+        *,
+        channels: int,
+        stream_channels: int = 0,
+        channel_defaults: ChannelOptions = ChannelOptions(),
+    ) -> None:
+        """Initialize the pool, without connecting it.
+
+        Args:
+            create_stub: A function creating a stub from a channel.
+            channels: The number of channels for unary calls.
+            stream_channels: The number of channels dedicated to streams. If `0`,
+                streams are spread over the unary channels.
+            channel_defaults: The default options of the channels.
+
+        Raises:
+            ValueError: If the number of channels is invalid.
+        """
+        if channels < 1:
+            raise ValueError("The channel pool needs at least one channel.")
+        if stream_channels < 0:
+            raise ValueError("The number of stream channels must not be negative.")
+        self._create_stub = create_stub
+        self._size = channels
+        self._stream_size = stream_channels
+        self._channel_defaults = channel_defaults
+        self._server_url: str | None = None
+        self._channels: list[grpc.aio.Channel] = []
+        self._stubs: list[StubT] = []
+        self._stream_stubs: list[StubT] = []
+        self._in_flight: list[int] = []
+        self._next_unary = 0
+        self._next_stream: Iterator[int] = iter(())
+
+    @property
+    def is_connected(self) -> bool:
+        """Whether the channels of the pool have been created."""
+        return bool(self._channels)
+
+    @property
+    def in_flight(self) -> list[int]:
+        """The number of unary calls in flight on each unary channel."""
+        return list(self._in_flight)
+
+    def connect(self, server_url: str) -> None:
+        """Create the channels of the pool, if not created yet for this URI.
+
+        Channels connect lazily, on their first call. Like for
+        `BaseApiClient.connect()`, if the URI changed the previous channels are
+        replaced without closing them.
+
+        Args:
+            server_url: The gRPC URI of the server.
+        """
+        if self.is_connected and server_url == self._server_url:
+            return
+        self._server_url = server_url
+        self._channels = [
+            create_channel(server_url, self._channel_defaults)
+            for _ in range(self._size + self._stream_size)
+        ]
+        stubs = [self._create_stub(channel) for channel in self._channels]
+        self._stubs = stubs[: self._size]
+        self._stream_stubs = stubs[self._size :] or self._stubs
+        self._in_flight = [0] * self._size
+        self._next_stream = itertools.cycle(range(len(self._stream_stubs)))
+
+    async def close(self) -> None:
+        """Close all the channels of the pool."""
+        channels, self._channels = self._channels, []
+        self._stubs = []
+        self._stream_stubs = []
+        self._in_flight = []
+        for channel in channels:
+            await channel.close(None)
+
+    @contextlib.contextmanager
+    def lease(self) -> Iterator[StubT]:
+        """Get the stub of the least loaded unary channel for the duration of a call.
+
+        Yields:
+            The stub to send the call with.
+        """
+        index = min(
+            ((self._next_unary + offset) % self._size for offset in range(self._size)),
+            key=self._in_flight.__getitem__,
+        )
+        self._next_unary = (index + 1) % self._size
+        self._in_flight[index] += 1
+        try:
+            yield self._stubs[index]
+        finally:
+            # The pool might have been closed while the call was in flight.
+            if index < len(self._in_flight):
+                self._in_flight[index] -= 1
+
+    def stream_stub(self) -> StubT:
+        """Get the stub of the channel to pin a new stream to.
+
+        Returns:
+            The stub to start the stream with.
+        """
+        return self._stream_stubs[next(self._next_stream)]
@@ -3,18 +3,31 @@
 
 """Module to define the client class."""
 
-# pylint: disable=too-many-lines
+# pylint: disable=too-many-lines, too-many-public-methods, too-many-instance-attributes
 
 from __future__ import annotations
 
 import asyncio
+import contextlib
+import enum
+import functools
 import logging
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal, InvalidOperation
-from typing import Any, AsyncIterator, Awaitable, Callable, cast
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    Self,
+    Sequence,
+    TypeVar,
+    cast,
+)
 
 import grpc
-from frequenz.api.common.v1.pagination.pagination_params_pb2 import PaginationParams
 
 # pylint: disable=no-member
 from frequenz.api.electricity_trading.v1 import (
@@ -30,6 +43,38 @@ from frequenz.client.base.streaming import GrpcStreamBroadcaster
 from frequenz.client.common.pagination import Params
 from google.protobuf import field_mask_pb2, struct_pb2
 
+from ._batch import OrderDetailBatch, PublicTradeBatch, TradeBatch
+from ._bulk import BulkResult, run_bulk
+from ._call_options import CallOptions
+from ._channel_pool import ChannelPool, ConnectionLanes
+from ._deadline import Deadline
+from ._fan_out import delivery_periods, merge_iterators
+from ._hedge import HedgePolicy, Hedger, HedgeStats
+from ._lazy import LazyOrderDetail, LazyPublicTrade, LazyTrade
+from ._multiplex import (
+    FilteredStream,
+    PublicTradesMultiplexer,
+    StreamMultiplexer,
+    order_filter_keys,
+    order_keys,
+    order_matches,
+)
+from ._pagination import RequestT, ResponseT, iter_pages
+from ._rate_limit import RateLimiterStats, RateLimits, TokenBucket
+from ._registry import ClientRegistry
+from ._resume import ResumableStream
+from ._retry import RetryPolicy, call_with_retry
+from ._snapshot import (
+    DEFAULT_BUFFER_SIZE,
+    SnapshotSubscription,
+    subscribe_when_streaming,
+)
+from ._stream_cache import (
+    CachedStreamBroadcaster,
+    StreamCache,
+    StreamCachePolicy,
+    StreamCacheStats,
+)
 from ._types import (
     DeliveryArea,
     DeliveryPeriod,
@@ -52,6 +97,9 @@ from ._types import (
 
 _logger = logging.getLogger(__name__)
 
+PageT = TypeVar("PageT")
+"""The type of the decoded pages of a list request."""
+
 
 class _Sentinel:
     """A unique object to signify 'no value passed'."""
@@ -65,6 +113,22 @@ MIN_QUANTITY_MW = Decimal("0.1")
 MIN_PRICE = Decimal(-9999.0)
 MAX_PRICE = Decimal(9999.0)
 
+_DEFAULT_OPTIONS: dict[str, Any] = {
+    "rate_limits": None,
+    "retry_policy": None,
+    "hedge_policy": None,
+    "call_options": None,
+    "channels": 1,
+    "stream_channels": 0,
+    "lanes": None,
+    "idle_timeout": timedelta(),
+    "stream_cache_policy": None,
+}
+"""The default options of the client, which don't conflict with existing clients."""
+
+_OPEN_ORDER_STATES = [OrderState.PENDING, OrderState.ACTIVE, OrderState.HIBERNATE]
+"""The states of orders that can still be executed or cancelled."""
+
 
 def validate_decimal_places(value: Decimal, decimal_places: int, name: str) -> None:
     """
@@ -94,6 +158,36 @@ def validate_decimal_places(value: Decimal, decimal_places: int, name: str) -> N
         ) from exc
 
 
+_UPDATABLE_ORDER_FIELDS = frozenset(
+    (
+        "price",
+        "quantity",
+        "stop_price",
+        "peak_price_delta",
+        "display_quantity",
+        "execution_option",
+        "valid_until",
+        "payload",
+        "tag",
+    )
+)
+
+
+def _update_mask(changes: dict[str, Any]) -> field_mask_pb2.FieldMask:
+    """Create the field mask for an order update.
+
+    The field mask specifies which fields should be updated, so that fields can
+    also be updated to `None`.
+
+    Args:
+        changes: The new values of the fields to update.
+
+    Returns:
+        The field mask with the names of the fields to update.
+    """
+    return field_mask_pb2.FieldMask(paths=list(changes))
+
+
 async def grpc_call_with_timeout(
     call: Callable[..., Awaitable[Any]],
     *args: Any,
@@ -103,6 +197,9 @@ async def grpc_call_with_timeout(
     """
     Call a gRPC function with a timeout (in seconds).
 
+    The timeout is passed to gRPC, which sends it to the server as the deadline
+    of the call.
+
     Args:
         call: The gRPC method to be called.
         *args: Positional arguments for the gRPC call.
@@ -114,49 +211,125 @@ async def grpc_call_with_timeout(
 
     Raises:
         asyncio.TimeoutError: If the call exceeds the timeout.
+        grpc.aio.AioRpcError: If the call fails for any other reason.
     """
     if timeout is None:
         return await call(*args, **kwargs)
     try:
-        return await asyncio.wait_for(
-            call(*args, **kwargs), timeout=timeout.total_seconds()
-        )
-    except asyncio.TimeoutError:
+        return await call(*args, timeout=timeout.total_seconds(), **kwargs)
+    except grpc.aio.AioRpcError as e:
+        if e.code() != grpc.StatusCode.DEADLINE_EXCEEDED:
+            raise
         _logger.exception("Timeout while calling %s", call)
-        raise
+        raise asyncio.TimeoutError(f"Timeout while calling {call}") from e
+
+
+class _RpcKind(enum.Enum):
+    """The kind of a unary RPC, used to pick the rate limiter to apply."""
+
+    ORDER_ENTRY = "order_entry"
+    """Creating, updating and cancelling orders."""
+
+    READ = "reads"
+    """Getting and listing orders and trades."""
 
 
 class Client(BaseApiClient[ElectricityTradingServiceStub]):
     """Electricity trading client."""
 
-    _instances: dict[tuple[str, str | None], "Client"] = {}
-
-    def __new__(
-        cls, server_url: str, connect: bool = True, auth_key: str | None = None
+    _registry: ClientRegistry["Client"] = ClientRegistry(
+        lambda client: client._shutdown()  # pylint: disable=protected-access
+    )
+    """The clients shared by all the users of the same server and API key."""
+
+    _given_options: dict[str, Any]
+    """The options the client was created with, by name."""
+
+    def __new__(  # pylint: disable=too-many-arguments, too-many-locals
+        cls,
+        server_url: str,
+        connect: bool = True,
+        auth_key: str | None = None,
+        *,
+        rate_limits: RateLimits | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        call_options: CallOptions | None = None,
+        channels: int = 1,
+        stream_channels: int = 0,
+        lanes: ConnectionLanes | None = None,
+        idle_timeout: timedelta = timedelta(),
+        stream_cache_policy: StreamCachePolicy | None = None,
     ) -> "Client":
         """
         Create a new instance of the client or return an existing one if it already exists.
 
+        Getting the client doesn't take a reference to it, see `__aenter__()`.
+
         Args:
             server_url: The URL of the Electricity Trading service.
             connect: Whether to connect to the server immediately.
             auth_key: The API key for the authorization.
+            rate_limits: The client-side rate limits to apply to the requests.
+            retry_policy: The policy to retry the idempotent requests with.
+            hedge_policy: The policy to hedge the read requests with.
+            call_options: The default options of the gRPC calls.
+            channels: The number of channels to spread the unary calls over.
+            stream_channels: The number of channels dedicated to streams.
+            lanes: Separate connections for order entry and market data.
+            idle_timeout: The time to keep the client once it has no users left.
+            stream_cache_policy: The policy limiting the streams kept open.
 
         Returns:
             The client instance.
-        """
-        key = (server_url, auth_key)
 
-        # Check if an instance already exists for this key
-        if key not in cls._instances:
-            # If not, create a new instance and store it in the cache
-            instance = super(Client, cls).__new__(cls)
-            cls._instances[key] = instance
+        Raises:
+            ValueError: If the client already exists with different options than
+                the ones given. Options left to their default are not checked.
+        """
+        options = {
+            "rate_limits": rate_limits,
+            "retry_policy": retry_policy,
+            "hedge_policy": hedge_policy,
+            "call_options": call_options,
+            "channels": channels,
+            "stream_channels": stream_channels,
+            "lanes": lanes,
+            "idle_timeout": idle_timeout,
+            "stream_cache_policy": stream_cache_policy,
+        }
+        client = cls._registry.get(
+            (server_url, auth_key),
+            functools.partial(super(Client, cls).__new__, cls),
+            idle_timeout,
+        )
+        if not hasattr(client, "_given_options"):
+            client._given_options = options
+            return client
 
-        return cls._instances[key]
+        conflicts = client._conflicting_options(options)
+        if conflicts:
+            raise ValueError(
+                f"The client for {server_url} already exists with different "
+                f"{', '.join(conflicts)}."
+            )
+        return client
 
-    def __init__(
-        self, server_url: str, connect: bool = True, auth_key: str | None = None
+    def __init__(  # pylint: disable=too-many-arguments, unused-argument
+        self,
+        server_url: str,
+        connect: bool = True,
+        auth_key: str | None = None,
+        *,
+        rate_limits: RateLimits | None = None,
+        retry_policy: RetryPolicy | None = None,
+        hedge_policy: HedgePolicy | None = None,
+        call_options: CallOptions | None = None,
+        channels: int = 1,
+        stream_channels: int = 0,
+        lanes: ConnectionLanes | None = None,
+        idle_timeout: timedelta = timedelta(),
+        stream_cache_policy: StreamCachePolicy | None = None,
     ) -> None:
         """Initialize the client.
 
@@ -164,39 +337,130 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             server_url: The URL of the Electricity Trading service.
             connect: Whether to connect to the server immediately.
             auth_key: The API key for the authorization.
+            rate_limits: The client-side rate limits to apply to the requests.
+                Requests exceeding a limit are queued until they are allowed to
+                be sent. Only used when the client is first created, instances
+                returned from the cache keep their original rate limits.
+            retry_policy: The policy to retry the idempotent requests (getting and
+                listing orders and trades) with when they fail with a transient
+                error. Paginated listings resume from the page that failed. If
+                `None`, requests are not retried. Like `rate_limits`, only used
+                when the client is first created.
+            hedge_policy: The policy to hedge the read requests with. A read
+                request not answered within the delay of the policy is sent a
+                second time, and the first response received is used. If `None`,
+                requests are not hedged. Like `rate_limits`, only used when the
+                client is first created.
+            call_options: The default options of all the gRPC calls, which can be
+                overridden by the options given to each method. Like
+                `rate_limits`, only used when the client is first created.
+            channels: The number of channels, each with its own connection, to
+                spread the unary calls over. Each call is sent over the channel
+                with the fewest calls in flight.
+            stream_channels: The number of channels, each with its own
+                connection, dedicated to streams. Each stream is pinned to one of
+                them, round-robin. If `0`, streams are sent over the channels
+                of the unary calls. Like `rate_limits`, the channels are only
+                configured when the client is first created.
+            lanes: Separate connections, with their own channel options and
+                concurrency limits, for order entry (creating, updating and
+                cancelling orders) and market data (getting and listing orders
+                and trades, and streams), so that heavy market data traffic
+                doesn't delay order entry. Kinds of requests without a lane use
+                the channels above. Like `rate_limits`, only used when the client
+                is first created.
+            idle_timeout: The time to keep the client, with its connections and
+                streams, once all its users have closed it, or after it is got
+                if it is never used in an `async with` block, so it can be
+                reused by new users. When it expires, the client is disconnected
+                and removed from the cache. Like `rate_limits`, only used when the
+                client is first created.
+            stream_cache_policy: The policy limiting the streams kept open, to
+                stop the streams without receivers after an idle timeout and to
+                cap the number of streams. If `None`, streams are kept open
+                until they end or the client is closed. Like `rate_limits`, only
+                used when the client is first created.
         """
         if not hasattr(
             self, "_initialized"
         ):  # Prevent re-initialization of existing instances
+            # The pool must exist before connecting, which the base class does.
+            self._channel_pool: ChannelPool[ElectricityTradingServiceStub] | None = (
+                ChannelPool(
+                    ElectricityTradingServiceStub,
+                    channels=channels,
+                    stream_channels=stream_channels,
+                )
+                if channels > 1 or stream_channels > 0
+                else None
+            )
+            lanes = lanes or ConnectionLanes()
+            self._lane_pools: dict[
+                _RpcKind, ChannelPool[ElectricityTradingServiceStub]
+            ] = {}
+            self._lane_limits: dict[_RpcKind, asyncio.Semaphore] = {}
+            for kind, lane in (
+                (_RpcKind.ORDER_ENTRY, lanes.order_entry),
+                (_RpcKind.READ, lanes.market_data),
+            ):
+                if lane is None:
+                    continue
+                self._lane_pools[kind] = ChannelPool(
+                    ElectricityTradingServiceStub,
+                    channels=lane.channels,
+                    channel_defaults=lane.channel_options,
+                )
+                if lane.max_concurrency is not None:
+                    self._lane_limits[kind] = asyncio.Semaphore(lane.max_concurrency)
             super().__init__(
                 server_url,
                 connect=connect,
                 create_stub=ElectricityTradingServiceStub,
             )
-            self._initialized = True
+            rate_limits = rate_limits or RateLimits()
+            self._rate_limiters: dict[_RpcKind, TokenBucket] = {
+                kind: TokenBucket(limit)
+                for kind, limit in (
+                    (_RpcKind.ORDER_ENTRY, rate_limits.order_entry),
+                    (_RpcKind.READ, rate_limits.reads),
+                )
+                if limit is not None
+            }
+            self._retry_policy = retry_policy
+            self._hedger = Hedger(hedge_policy) if hedge_policy is not None else None
+            self._call_options = call_options or CallOptions()
+            self._registry_key = (server_url, auth_key)
+
+            # The streams are kept by new users of the client getting it from
+            # the cache. The keys of the different kinds of streams never clash,
+            # as their filters have different types.
+            self._streams = StreamCache(stream_cache_policy)
+            self._order_multiplexers: dict[
+                int, StreamMultiplexer[GridpoolOrderFilter, OrderDetail]
+            ] = {}
+            self._public_trades_multiplexer = PublicTradesMultiplexer(
+                self._new_public_trades_stream
+            )
 
-        self._gridpool_orders_streams: dict[
-            tuple[int, GridpoolOrderFilter],
-            GrpcStreamBroadcaster[
-                electricity_trading_pb2.ReceiveGridpoolOrdersStreamResponse, OrderDetail
-            ],
-        ] = {}
+            self._metadata = (("key", auth_key),) if auth_key else ()
+            self._initialized = True
 
-        self._gridpool_trades_streams: dict[
-            tuple[int, GridpoolTradeFilter],
-            GrpcStreamBroadcaster[
-                electricity_trading_pb2.ReceiveGridpoolTradesStreamResponse, Trade
-            ],
-        ] = {}
+    def _conflicting_options(self, options: dict[str, Any]) -> list[str]:
+        """
+        Get the options differing from the ones the client was created with.
 
-        self._public_trades_streams: dict[
-            PublicTradeFilter,
-            GrpcStreamBroadcaster[
-                electricity_trading_pb2.ReceivePublicTradesStreamResponse, PublicTrade
-            ],
-        ] = {}
+        Args:
+            options: The options given to get the client.
 
-        self._metadata = (("key", auth_key),) if auth_key else ()
+        Returns:
+            The names of the given options that are not left to their default and
+                differ from the options of the client.
+        """
+        return [
+            name
+            for name, value in options.items()
+            if value not in (_DEFAULT_OPTIONS[name], self._given_options[name])
+        ]
 
     @property
     def stub(self) -> electricity_trading_pb2_grpc.ElectricityTradingServiceAsyncStub:
@@ -207,7 +471,9 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             The gRPC stub.
 
         Raises:
-            ClientNotConnected: If the client is not connected to the server.
+            ClientNotConnected: If the client is not connected to the server, or if
+                all the requests go through channel pools or lanes, so the client
+                has no shared channel.
         """
         if self._stub is None:
             raise ClientNotConnected(server_url=self.server_url, operation="stub")
@@ -217,8 +483,358 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         # type-checker, so it can only be used for type hints.
         return self._stub  # type: ignore
 
+    @property
+    def is_connected(self) -> bool:
+        """Whether the client is connected to the server."""
+        return (not self._uses_shared_channel or super().is_connected) and all(
+            pool.is_connected for pool in self._pools()
+        )
+
+    def connect(self, server_url: str | None = None) -> None:
+        """
+        Connect to the server, possibly using a new URL.
+
+        The channels of the pool and the lanes, if any, are connected too. The
+        shared channel of the client is only connected if some requests don't go
+        through a pool or a lane.
+
+        Args:
+            server_url: The URL of the server to connect to. If not provided, the
+                previously used URL is used.
+        """
+        if self._uses_shared_channel:
+            super().connect(server_url)
+        elif server_url is not None:
+            self._server_url = server_url
+        for pool in self._pools():
+            pool.connect(self.server_url)
+
+    async def disconnect(self) -> None:
+        """
+        Disconnect from the server, closing all the channels.
+
+        The client is disconnected even if it has other users, and stays in the
+        cache. Use `close()` to also stop its streams and remove it from the
+        cache.
+        """
+        for pool in self._pools():
+            await pool.close()
+        await super().__aexit__(None, None, None)
+
+    async def close(self) -> None:
+        """
+        Close the client for all its users.
+
+        Its streams are stopped, it is disconnected and it is removed from the
+        cache, even if it is being used in an `async with` block.
+        """
+        await self._registry.close(self._registry_key, self)
+
+    async def __aenter__(self) -> Self:
+        """
+        Enter a context manager, taking a reference to the client.
+
+        The client is connected, if it isn't yet. Once all the `async with` blocks
+        using the client have exited, and after the idle timeout of the client,
+        it is closed.
+
+        Returns:
+            The client.
+        """
+        self._registry.acquire(
+            self._registry_key, self, self._given_options["idle_timeout"]
+        )
+        self.connect()
+        return self
+
+    async def __aexit__(
+        self,
+        _exc_type: type[BaseException] | None,
+        _exc_val: BaseException | None,
+        _exc_tb: Any | None,
+    ) -> bool | None:
+        """
+        Exit a context manager, releasing the reference to the client.
+
+        Args:
+            _exc_type: The type of the exception raised in the context, if any.
+            _exc_val: The exception raised in the context, if any.
+            _exc_tb: The traceback of the exception, if any.
+
+        Returns:
+            `None`, so exceptions raised in the context are propagated.
+        """
+        await self._registry.release(self._registry_key, self)
+        return None
+
+    async def _shutdown(self) -> None:
+        """Stop all the streams and disconnect, once the client has no users left."""
+        multiplexers = list(self._order_multiplexers.values())
+        self._order_multiplexers.clear()
+        for multiplexer in multiplexers:
+            await multiplexer.stop()
+        await self._public_trades_multiplexer.stop()
+        await self._streams.close()
+        await self.disconnect()
+
+    @property
+    def _uses_shared_channel(self) -> bool:
+        """Whether some requests are sent over the shared channel of the client."""
+        return self._channel_pool is None and len(self._lane_pools) < len(_RpcKind)
+
+    def _pools(self) -> list[ChannelPool[ElectricityTradingServiceStub]]:
+        """
+        Get all the channel pools of the client.
+
+        Returns:
+            The shared channel pool, if any, and the pools of the lanes.
+        """
+        pools = list(self._lane_pools.values())
+        if self._channel_pool is not None:
+            pools.append(self._channel_pool)
+        return pools
+
+    def _pool(
+        self, kind: _RpcKind
+    ) -> ChannelPool[ElectricityTradingServiceStub] | None:
+        """
+        Get the channel pool to send a kind of requests over.
+
+        Args:
+            kind: The kind of the requests.
+
+        Returns:
+            The pool of the lane of the requests, or the shared pool if they have no
+                lane, or `None` if the client has no pools.
+
+        Raises:
+            ClientNotConnected: If the pool is not connected to the server.
+        """
+        pool = self._lane_pools.get(kind, self._channel_pool)
+        if pool is not None and not pool.is_connected:
+            raise ClientNotConnected(server_url=self.server_url, operation="stub")
+        return pool
+
+    @contextlib.contextmanager
+    def _unary_stub(
+        self, kind: _RpcKind
+    ) -> Iterator[electricity_trading_pb2_grpc.ElectricityTradingServiceAsyncStub]:
+        """
+        Get the stub to send a unary call with, for the duration of the call.
+
+        Args:
+            kind: The kind of the request.
+
+        Yields:
+            The stub of the least loaded channel of the pool for the kind of
+                request, or the stub of the client if there is no pool.
+        """
+        pool = self._pool(kind)
+        if pool is None:
+            yield self.stub
+        else:
+            with pool.lease() as stub:
+                yield stub  # type: ignore
+
+    def _stream_stub(
+        self,
+    ) -> electricity_trading_pb2_grpc.ElectricityTradingServiceAsyncStub:
+        """
+        Get the stub to start a stream with.
+
+        Streams are market data, so they use the market data lane, if any.
+
+        Returns:
+            The stub of the channel of the pool to pin the stream to, or the stub
+                of the client if there is no pool.
+        """
+        pool = self._pool(_RpcKind.READ)
+        if pool is None:
+            return self.stub
+        return pool.stream_stub()  # type: ignore
+
+    @property
+    def rate_limiter_stats(self) -> dict[str, RateLimiterStats]:
+        """
+        Get the statistics of the client-side rate limiters.
+
+        Returns:
+            The statistics of each configured rate limiter, keyed by the name of
+                the corresponding `RateLimits` field.
+        """
+        return {
+            kind.value: limiter.stats for kind, limiter in self._rate_limiters.items()
+        }
+
+    @property
+    def hedge_stats(self) -> HedgeStats | None:
+        """
+        Get the statistics of the hedged read requests.
+
+        Returns:
+            The statistics of the hedged requests, or `None` if hedging is not
+                enabled.
+        """
+        return self._hedger.stats if self._hedger is not None else None
+
+    @property
+    def stream_cache_stats(self) -> StreamCacheStats:
+        """
+        Get the statistics of the streams kept open by the client.
+
+        Returns:
+            The number of open streams, their receivers and buffered messages,
+                and the number of streams stopped by the stream cache policy.
+        """
+        return self._streams.stats
+
+    async def _call_unary(
+        # pylint: disable=too-many-arguments
+        self,
+        kind: _RpcKind,
+        method: Callable[
+            [electricity_trading_pb2_grpc.ElectricityTradingServiceAsyncStub],
+            Callable[..., Awaitable[Any]],
+        ],
+        request: Any,
+        *,
+        timeout: timedelta | None = None,
+        deadline: Deadline | None = None,
+        call_options: CallOptions | None = None,
+    ) -> Any:
+        """
+        Send a unary request, waiting for the rate limiter of its kind first.
+
+        The request is sent over the lane of its kind, if any, waiting for its
+        concurrency limit. The time spent waiting for the rate limiter and the
+        concurrency limit doesn't count towards the timeout, but it is bounded by
+        the deadline, if any. Read requests are
+        hedged and retried according to the hedge and retry policies of the
+        client. Every retry goes through the rate limiter again, while the
+        duplicate of a hedged request is sent within the rate limit and the
+        concurrency slot of the request it duplicates, so it is never delayed
+        by them.
+
+        Args:
+            kind: The kind of the request.
+            method: A function getting the gRPC method to be called from a stub.
+            request: The request message.
+            timeout: Timeout duration, defaults to None.
+            deadline: The deadline of the operation the request is part of, if
+                any. The timeout of every request sent is capped to the time left
+                before the deadline.
+            call_options: The options of the call, overriding the default options
+                of the client. The `timeout` argument takes precedence over the
+                timeout of the options.
+
+        Returns:
+            The result of the gRPC call.
+        """
+        options = self._call_options.merge(call_options)
+        if timeout is None:
+            timeout = options.timeout
+        call_kwargs = options.to_kwargs(self._metadata)
+
+        async def call() -> Any:
+            with self._unary_stub(kind) as stub:
+                return await grpc_call_with_timeout(
+                    method(stub),
+                    request,
+                    timeout=(
+                        deadline.timeout(timeout) if deadline is not None else timeout
+                    ),
+                    **call_kwargs,
+                )
+
+        async def send() -> Any:
+            limiter = self._rate_limiters.get(kind)
+            lane = self._lane_limits.get(kind)
+            async with asyncio.timeout_at(
+                deadline.expires_at if deadline is not None else None
+            ):
+                if limiter is not None:
+                    await limiter.acquire()
+                if lane is not None:
+                    await lane.acquire()
+            try:
+                if kind is _RpcKind.READ and self._hedger is not None:
+                    return await self._hedger.call(call)
+                return await call()
+            finally:
+                if lane is not None:
+                    lane.release()
+
+        if kind is not _RpcKind.READ or self._retry_policy is None:
+            return await send()
+        return await call_with_retry(
+            send, self._retry_policy, type(request).__name__, deadline
+        )
+
+    async def _iter_pages(
+        # pylint: disable=too-many-arguments
+        self,
+        method: Callable[
+            [electricity_trading_pb2_grpc.ElectricityTradingServiceAsyncStub],
+            Callable[..., Awaitable[ResponseT]],
+        ],
+        request: RequestT,
+        *,
+        timeout: timedelta | None,
+        deadline: timedelta | None,
+        partial: bool,
+        prefetch: int,
+        call_options: CallOptions | None,
+    ) -> AsyncIterator[ResponseT]:
+        """
+        Iterate over the pages of a list request.
+
+        Args:
+            method: A function getting the gRPC method to be called for each page
+                from a stub.
+            request: The request for the first page.
+            timeout: Timeout duration of each page request.
+            deadline: The time allowed to receive all the pages, if any.
+            partial: Whether to stop without an error if the deadline expires.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed.
+            call_options: The options of each page request.
+
+        Yields:
+            The response for each page, in order.
+
+        Raises:
+            asyncio.TimeoutError: If the deadline expires before all the pages are
+                received and `partial` is `False`.
+        """
+        budget = Deadline(deadline) if deadline is not None else None
+        try:
+            async for response in iter_pages(
+                lambda page_request: cast(
+                    Awaitable[ResponseT],
+                    self._call_unary(
+                        _RpcKind.READ,
+                        method,
+                        page_request,
+                        timeout=timeout,
+                        deadline=budget,
+                        call_options=call_options,
+                    ),
+                ),
+                request,
+                prefetch=prefetch,
+            ):
+                yield response
+        except asyncio.TimeoutError:
+            if not partial or budget is None or not budget.expired:
+                raise
+            _logger.warning(
+                "Deadline of %s expired while listing with %s, returning partial results",
+                deadline,
+                type(request).__name__,
+            )
+
     def gridpool_orders_stream(
-        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
         self,
         gridpool_id: int,
         order_states: list[OrderState] | None = None,
@@ -226,9 +842,10 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         delivery_area: DeliveryArea | None = None,
         delivery_period: DeliveryPeriod | None = None,
         tag: str | None = None,
-    ) -> GrpcStreamBroadcaster[
-        electricity_trading_pb2.ReceiveGridpoolOrdersStreamResponse, OrderDetail
-    ]:
+        *,
+        resumable: bool = False,
+        lazy: bool = False,
+    ) -> GrpcStreamBroadcaster[Any, OrderDetail]:
         """
         Stream gridpool orders.
 
@@ -239,6 +856,19 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             delivery_area: Delivery area to filter for.
             delivery_period: Delivery period to filter for.
             tag: Tag to filter for.
+            resumable: Whether to send the order updates missed while the stream
+                was reconnecting. They are listed with `list_gridpool_orders()`
+                after reconnecting, keeping the ones modified since the last
+                update received, or since the stream was first opened, and
+                duplicated updates (same order ID and
+                modification time) are dropped. Resumable streams are separate
+                from the other streams with the same filters.
+            lazy: Whether to send views of the received messages, decoding each
+                field on first access, which is cheaper if only some fields are
+                read. Assigning a field of a view only changes that field, and
+                `dataclasses.replace()` returns a fully decoded instance. Lazy
+                streams share the server stream of the other streams with the
+                same filters, but decode its messages separately.
 
         Returns:
             Async generator of orders.
@@ -246,6 +876,17 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         Raises:
             grpc.RpcError: If an error occurs while streaming the orders.
         """
+        decode = LazyOrderDetail.from_pb if lazy else OrderDetail.from_pb
+        if not resumable:
+            return self.gridpool_orders_stream_raw(
+                gridpool_id,
+                order_states,
+                market_side,
+                delivery_area,
+                delivery_period,
+                tag,
+            ).derive("lazy" if lazy else "decoded", decode)
+
         self.validate_params(delivery_period=delivery_period)
 
         gridpool_order_filter = GridpoolOrderFilter(
@@ -256,150 +897,708 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             tag=tag,
         )
 
-        stream_key = (gridpool_id, gridpool_order_filter)
+        stream_key: tuple[Any, ...] = (gridpool_id, gridpool_order_filter, "resumable")
+        if lazy:
+            stream_key += ("lazy",)
+
+        stream = self._streams.get(stream_key)
+        if stream is None:
+            name = f"electricity-trading-{stream_key}"
+
+            def transform(
+                response: electricity_trading_pb2.ReceiveGridpoolOrdersStreamResponse,
+            ) -> OrderDetail:
+                return decode(response.order_detail)
 
-        if (
-            stream_key not in self._gridpool_orders_streams
-            or not self._gridpool_orders_streams[stream_key].is_running
-        ):
             try:
-                self._gridpool_orders_streams[stream_key] = GrpcStreamBroadcaster(
-                    f"electricity-trading-{stream_key}",
-                    lambda: self.stub.ReceiveGridpoolOrdersStream(
-                        electricity_trading_pb2.ReceiveGridpoolOrdersStreamRequest(
-                            gridpool_id=gridpool_id,
-                            filter=gridpool_order_filter.to_pb(),
+                stream = CachedStreamBroadcaster(
+                    name,
+                    ResumableStream(
+                        name,
+                        open_stream=functools.partial(
+                            self._open_gridpool_orders_stream,
+                            gridpool_id,
+                            gridpool_order_filter,
                         ),
-                        metadata=self._metadata,
+                        transform=transform,
+                        backfill=lambda: self.list_gridpool_orders(
+                            gridpool_id,
+                            order_states=order_states,
+                            side=market_side,
+                            delivery_period=delivery_period,
+                            delivery_area=delivery_area,
+                            tag=tag,
+                            lazy=lazy,
+                        ),
+                        key=lambda order: (order.order_id, order.modification_time),
+                        time=lambda order: order.modification_time,
                     ),
-                    lambda response: OrderDetail.from_pb(response.order_detail),
+                    lambda order: order,
                 )
             except grpc.RpcError as e:
                 _logger.exception(
                     "Error occurred while streaming gridpool orders: %s", e
                 )
                 raise
-        return self._gridpool_orders_streams[stream_key]
+            self._streams.add(stream_key, stream)
+        return stream
 
-    def gridpool_trades_stream(
+    def gridpool_orders_stream_raw(
         # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
         gridpool_id: int,
-        trade_states: list[TradeState] | None = None,
-        trade_ids: list[int] | None = None,
+        order_states: list[OrderState] | None = None,
         market_side: MarketSide | None = None,
-        delivery_period: DeliveryPeriod | None = None,
         delivery_area: DeliveryArea | None = None,
-    ) -> GrpcStreamBroadcaster[
-        electricity_trading_pb2.ReceiveGridpoolTradesStreamResponse, Trade
-    ]:
+        delivery_period: DeliveryPeriod | None = None,
+        tag: str | None = None,
+    ) -> CachedStreamBroadcaster[Any, electricity_trading_pb2.OrderDetail]:
         """
-        Stream gridpool trades.
+        Stream gridpool orders as the received protobuf messages, without converting them.
+
+        The server stream is shared with the not resumable streams of
+        `gridpool_orders_stream()` with the same filters.
 
         Args:
-            gridpool_id: The ID of the gridpool to stream trades for.
-            trade_states: List of trade states to filter for.
-            trade_ids: List of trade IDs to filter for.
-            market_side: The market side to filter for.
-            delivery_period: The delivery period to filter for.
-            delivery_area: The delivery area to filter for.
+            gridpool_id: ID of the gridpool to stream orders for.
+            order_states: List of order states to filter for.
+            market_side: Market side to filter for.
+            delivery_area: Delivery area to filter for.
+            delivery_period: Delivery period to filter for.
+            tag: Tag to filter for.
 
         Returns:
-            The gridpool trades streamer.
+            The gridpool orders streamer.
 
         Raises:
-            grpc.RpcError: If an error occurs while streaming gridpool trades.
+            grpc.RpcError: If an error occurs while streaming the orders.
         """
         self.validate_params(delivery_period=delivery_period)
 
-        gridpool_trade_filter = GridpoolTradeFilter(
-            trade_states=trade_states,
-            trade_ids=trade_ids,
+        gridpool_order_filter = GridpoolOrderFilter(
+            order_states=order_states,
             side=market_side,
-            delivery_period=delivery_period,
             delivery_area=delivery_area,
+            delivery_period=delivery_period,
+            tag=tag,
         )
 
-        stream_key = (gridpool_id, gridpool_trade_filter)
-
-        if (
-            stream_key not in self._gridpool_trades_streams
-            or not self._gridpool_trades_streams[stream_key].is_running
-        ):
+        stream_key = (gridpool_id, gridpool_order_filter, "raw")
+        stream = self._streams.get(stream_key)
+        if stream is None:
             try:
-                self._gridpool_trades_streams[stream_key] = GrpcStreamBroadcaster(
+                stream = CachedStreamBroadcaster(
                     f"electricity-trading-{stream_key}",
-                    lambda: self.stub.ReceiveGridpoolTradesStream(
-                        electricity_trading_pb2.ReceiveGridpoolTradesStreamRequest(
-                            gridpool_id=gridpool_id,
-                            filter=gridpool_trade_filter.to_pb(),
-                        ),
-                        metadata=self._metadata,
+                    functools.partial(
+                        self._open_gridpool_orders_stream,
+                        gridpool_id,
+                        gridpool_order_filter,
                     ),
-                    lambda response: Trade.from_pb(response.trade),
+                    lambda response: response.order_detail,
                 )
             except grpc.RpcError as e:
                 _logger.exception(
-                    "Error occurred while streaming gridpool trades: %s", e
+                    "Error occurred while streaming gridpool orders: %s", e
                 )
                 raise
-        return self._gridpool_trades_streams[stream_key]
+            self._streams.add(stream_key, stream)
+        return stream
 
-    def public_trades_stream(
+    def _open_gridpool_orders_stream(
+        self, gridpool_id: int, gridpool_order_filter: GridpoolOrderFilter
+    ) -> AsyncIterable[electricity_trading_pb2.ReceiveGridpoolOrdersStreamResponse]:
+        """
+        Open a server stream of gridpool orders.
+
+        Args:
+            gridpool_id: ID of the gridpool to stream orders for.
+            gridpool_order_filter: The filter of the orders to stream.
+
+        Returns:
+            The server stream.
+        """
+        return self._stream_stub().ReceiveGridpoolOrdersStream(
+            electricity_trading_pb2.ReceiveGridpoolOrdersStreamRequest(
+                gridpool_id=gridpool_id,
+                filter=gridpool_order_filter.to_pb(),
+            ),
+            **self._call_options.to_kwargs(self._metadata),
+        )
+
+    def multiplexed_gridpool_orders_stream(
         # pylint: disable=too-many-arguments, too-many-positional-arguments
         self,
-        states: list[TradeState] | None = None,
+        gridpool_id: int,
+        order_states: list[OrderState] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_area: DeliveryArea | None = None,
         delivery_period: DeliveryPeriod | None = None,
-        buy_delivery_area: DeliveryArea | None = None,
-        sell_delivery_area: DeliveryArea | None = None,
-    ) -> GrpcStreamBroadcaster[
-        electricity_trading_pb2.ReceivePublicTradesStreamResponse, PublicTrade
-    ]:
+        tag: str | None = None,
+    ) -> FilteredStream[OrderDetail]:
         """
-        Stream public trades.
+        Stream gridpool orders, filtered locally from a single stream per gridpool.
+
+        Unlike `gridpool_orders_stream()`, which opens a server stream for every
+        distinct filter, all the subscribers of a gridpool share one unfiltered
+        server stream, and the orders are routed to the subscribers through an
+        index on their delivery period, delivery area and order states. The
+        shared stream is only received from while the gridpool has subscribers,
+        so it can be evicted from the stream cache once they are gone.
 
         Args:
-            states: List of order states to filter for.
+            gridpool_id: ID of the gridpool to stream orders for.
+            order_states: List of order states to filter for.
+            market_side: Market side to filter for.
+            delivery_area: Delivery area to filter for.
             delivery_period: Delivery period to filter for.
-            buy_delivery_area: Buy delivery area to filter for.
-            sell_delivery_area: Sell delivery area to filter for.
+            tag: Tag to filter for.
 
         Returns:
-            Async generator of orders.
-
-        Raises:
-            grpc.RpcError: If an error occurs while streaming public trades.
+            The stream of the orders matching the filter. Stopping it, or
+                dropping all its receivers, only unsubscribes from the shared
+                stream.
         """
         self.validate_params(delivery_period=delivery_period)
 
-        public_trade_filter = PublicTradeFilter(
-            states=states,
+        gridpool_order_filter = GridpoolOrderFilter(
+            order_states=order_states,
+            side=market_side,
+            delivery_area=delivery_area,
             delivery_period=delivery_period,
-            buy_delivery_area=buy_delivery_area,
-            sell_delivery_area=sell_delivery_area,
+            tag=tag,
         )
 
-        if (
-            public_trade_filter not in self._public_trades_streams
-            or not self._public_trades_streams[public_trade_filter].is_running
-        ):
-            try:
-                self._public_trades_streams[public_trade_filter] = (
-                    GrpcStreamBroadcaster(
-                        f"electricity-trading-{public_trade_filter}",
-                        lambda: self.stub.ReceivePublicTradesStream(
-                            electricity_trading_pb2.ReceivePublicTradesStreamRequest(
-                                filter=public_trade_filter.to_pb(),
-                            ),
-                            metadata=self._metadata,
-                        ),
-                        lambda response: PublicTrade.from_pb(response.public_trade),
-                    )
+        multiplexer = self._order_multiplexers.get(gridpool_id)
+        if multiplexer is None:
+            multiplexer = StreamMultiplexer(
+                f"electricity-trading-gridpool-orders-{gridpool_id}",
+                lambda: self.gridpool_orders_stream(gridpool_id).new_receiver(),
+                filter_keys=order_filter_keys,
+                message_keys=order_keys,
+                matches=order_matches,
+            )
+            self._order_multiplexers[gridpool_id] = multiplexer
+        return multiplexer.subscribe(gridpool_order_filter)
+
+    def gridpool_trades_stream(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        gridpool_id: int,
+        trade_states: list[TradeState] | None = None,
+        trade_ids: list[int] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        *,
+        resumable: bool = False,
+        lazy: bool = False,
+    ) -> GrpcStreamBroadcaster[Any, Trade]:
+        """
+        Stream gridpool trades.
+
+        Args:
+            gridpool_id: The ID of the gridpool to stream trades for.
+            trade_states: List of trade states to filter for.
+            trade_ids: List of trade IDs to filter for.
+            market_side: The market side to filter for.
+            delivery_period: The delivery period to filter for.
+            delivery_area: The delivery area to filter for.
+            resumable: Whether to send the trades missed while the stream was
+                reconnecting. They are listed with `list_gridpool_trades()` after
+                reconnecting, keeping the ones executed since the last trade
+                received, or since the stream was first opened, and duplicated
+                trades (same trade ID and state) are
+                dropped. State changes of trades executed before the
+                disconnection are not recovered. Resumable streams are separate
+                from the other streams with the same filters.
+            lazy: Whether to send views of the received messages, decoding each
+                field on first access, which is cheaper if only some fields are
+                read. Assigning a field of a view only changes that field, and
+                `dataclasses.replace()` returns a fully decoded instance. Lazy
+                streams share the server stream of the other streams with the
+                same filters, but decode its messages separately.
+
+        Returns:
+            The gridpool trades streamer.
+
+        Raises:
+            grpc.RpcError: If an error occurs while streaming gridpool trades.
+        """
+        decode = LazyTrade.from_pb if lazy else Trade.from_pb
+        if not resumable:
+            return self.gridpool_trades_stream_raw(
+                gridpool_id,
+                trade_states,
+                trade_ids,
+                market_side,
+                delivery_period,
+                delivery_area,
+            ).derive("lazy" if lazy else "decoded", decode)
+
+        self.validate_params(delivery_period=delivery_period)
+
+        gridpool_trade_filter = GridpoolTradeFilter(
+            trade_states=trade_states,
+            trade_ids=trade_ids,
+            side=market_side,
+            delivery_period=delivery_period,
+            delivery_area=delivery_area,
+        )
+
+        stream_key: tuple[Any, ...] = (gridpool_id, gridpool_trade_filter, "resumable")
+        if lazy:
+            stream_key += ("lazy",)
+
+        stream = self._streams.get(stream_key)
+        if stream is None:
+            name = f"electricity-trading-{stream_key}"
+
+            def transform(
+                response: electricity_trading_pb2.ReceiveGridpoolTradesStreamResponse,
+            ) -> Trade:
+                return decode(response.trade)
+
+            try:
+                stream = CachedStreamBroadcaster(
+                    name,
+                    ResumableStream(
+                        name,
+                        open_stream=functools.partial(
+                            self._open_gridpool_trades_stream,
+                            gridpool_id,
+                            gridpool_trade_filter,
+                        ),
+                        transform=transform,
+                        backfill=lambda: self.list_gridpool_trades(
+                            gridpool_id,
+                            trade_states=trade_states,
+                            trade_ids=trade_ids,
+                            market_side=market_side,
+                            delivery_period=delivery_period,
+                            delivery_area=delivery_area,
+                            lazy=lazy,
+                        ),
+                        key=lambda trade: (trade.id, trade.state),
+                        time=lambda trade: trade.execution_time,
+                    ),
+                    lambda trade: trade,
+                )
+            except grpc.RpcError as e:
+                _logger.exception(
+                    "Error occurred while streaming gridpool trades: %s", e
+                )
+                raise
+            self._streams.add(stream_key, stream)
+        return stream
+
+    def gridpool_trades_stream_raw(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        gridpool_id: int,
+        trade_states: list[TradeState] | None = None,
+        trade_ids: list[int] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+    ) -> CachedStreamBroadcaster[Any, electricity_trading_pb2.Trade]:
+        """
+        Stream gridpool trades as the received protobuf messages, without converting them.
+
+        The server stream is shared with the not resumable streams of
+        `gridpool_trades_stream()` with the same filters.
+
+        Args:
+            gridpool_id: The ID of the gridpool to stream trades for.
+            trade_states: List of trade states to filter for.
+            trade_ids: List of trade IDs to filter for.
+            market_side: The market side to filter for.
+            delivery_period: The delivery period to filter for.
+            delivery_area: The delivery area to filter for.
+
+        Returns:
+            The gridpool trades streamer.
+
+        Raises:
+            grpc.RpcError: If an error occurs while streaming gridpool trades.
+        """
+        self.validate_params(delivery_period=delivery_period)
+
+        gridpool_trade_filter = GridpoolTradeFilter(
+            trade_states=trade_states,
+            trade_ids=trade_ids,
+            side=market_side,
+            delivery_period=delivery_period,
+            delivery_area=delivery_area,
+        )
+
+        stream_key = (gridpool_id, gridpool_trade_filter, "raw")
+        stream = self._streams.get(stream_key)
+        if stream is None:
+            try:
+                stream = CachedStreamBroadcaster(
+                    f"electricity-trading-{stream_key}",
+                    functools.partial(
+                        self._open_gridpool_trades_stream,
+                        gridpool_id,
+                        gridpool_trade_filter,
+                    ),
+                    lambda response: response.trade,
+                )
+            except grpc.RpcError as e:
+                _logger.exception(
+                    "Error occurred while streaming gridpool trades: %s", e
+                )
+                raise
+            self._streams.add(stream_key, stream)
+        return stream
+
+    def _open_gridpool_trades_stream(
+        self, gridpool_id: int, gridpool_trade_filter: GridpoolTradeFilter
+    ) -> AsyncIterable[electricity_trading_pb2.ReceiveGridpoolTradesStreamResponse]:
+        """
+        Open a server stream of gridpool trades.
+
+        Args:
+            gridpool_id: The ID of the gridpool to stream trades for.
+            gridpool_trade_filter: The filter of the trades to stream.
+
+        Returns:
+            The server stream.
+        """
+        return self._stream_stub().ReceiveGridpoolTradesStream(
+            electricity_trading_pb2.ReceiveGridpoolTradesStreamRequest(
+                gridpool_id=gridpool_id,
+                filter=gridpool_trade_filter.to_pb(),
+            ),
+            **self._call_options.to_kwargs(self._metadata),
+        )
+
+    def public_trades_stream(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        states: list[TradeState] | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+        *,
+        lazy: bool = False,
+    ) -> GrpcStreamBroadcaster[Any, PublicTrade]:
+        """
+        Stream public trades.
+
+        Args:
+            states: List of order states to filter for.
+            delivery_period: Delivery period to filter for.
+            buy_delivery_area: Buy delivery area to filter for.
+            sell_delivery_area: Sell delivery area to filter for.
+            lazy: Whether to send views of the received messages, decoding each
+                field on first access, which is cheaper if only some fields are
+                read. Assigning a field of a view only changes that field, and
+                `dataclasses.replace()` returns a fully decoded instance. Lazy
+                streams share the server stream of the other streams with the
+                same filters, but decode its messages separately.
+
+        Returns:
+            Async generator of orders.
+        """
+        return self.public_trades_stream_raw(
+            states, delivery_period, buy_delivery_area, sell_delivery_area
+        ).derive(
+            "lazy" if lazy else "decoded",
+            LazyPublicTrade.from_pb if lazy else PublicTrade.from_pb,
+        )
+
+    def public_trades_stream_raw(
+        self,
+        states: list[TradeState] | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+    ) -> CachedStreamBroadcaster[
+        electricity_trading_pb2.ReceivePublicTradesStreamResponse,
+        electricity_trading_pb2.PublicTrade,
+    ]:
+        """
+        Stream public trades as the received protobuf messages, without converting them.
+
+        The server stream is shared with the streams of `public_trades_stream()`
+        with the same filters.
+
+        Args:
+            states: List of order states to filter for.
+            delivery_period: Delivery period to filter for.
+            buy_delivery_area: Buy delivery area to filter for.
+            sell_delivery_area: Sell delivery area to filter for.
+
+        Returns:
+            The public trades streamer.
+
+        Raises:
+            grpc.RpcError: If an error occurs while streaming public trades.
+        """
+        self.validate_params(delivery_period=delivery_period)
+
+        public_trade_filter = PublicTradeFilter(
+            states=states,
+            delivery_period=delivery_period,
+            buy_delivery_area=buy_delivery_area,
+            sell_delivery_area=sell_delivery_area,
+        )
+
+        stream_key = (public_trade_filter, "raw")
+        stream = self._streams.get(stream_key)
+        if stream is None:
+            try:
+                stream = self._new_public_trades_stream(
+                    public_trade_filter, lambda public_trade: public_trade
                 )
             except grpc.RpcError as e:
                 _logger.exception("Error occurred while streaming public trades: %s", e)
                 raise
-        return self._public_trades_streams[public_trade_filter]
+            self._streams.add(stream_key, stream)
+        return stream
+
+    def multiplexed_public_trades_stream(
+        self,
+        states: list[TradeState] | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+    ) -> FilteredStream[PublicTrade]:
+        """
+        Stream public trades, sharing the server streams between subscribers.
+
+        Unlike `public_trades_stream()`, which opens a server stream for every
+        distinct filter, subscribers are served by an open server stream
+        covering their filter, if any, and the trades are routed to them through
+        an index on their delivery period and delivery areas. Server streams are
+        stopped when their last subscriber stops or when their delivery period
+        ends, so subscribing to the upcoming periods as time goes by keeps only
+        the streams of the periods still traded.
+
+        Args:
+            states: List of trade states to filter for.
+            delivery_period: Delivery period to filter for.
+            buy_delivery_area: Buy delivery area to filter for.
+            sell_delivery_area: Sell delivery area to filter for.
+
+        Returns:
+            The stream of the trades matching the filter. Stopping it only
+                unsubscribes from the shared stream.
+        """
+        self.validate_params(delivery_period=delivery_period)
+
+        return self._public_trades_multiplexer.subscribe(
+            PublicTradeFilter(
+                states=states,
+                delivery_period=delivery_period,
+                buy_delivery_area=buy_delivery_area,
+                sell_delivery_area=sell_delivery_area,
+            )
+        )
+
+    def snapshot_and_stream_gridpool_orders(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        gridpool_id: int,
+        order_states: list[OrderState] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_area: DeliveryArea | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        tag: str | None = None,
+        *,
+        resumable: bool = False,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> SnapshotSubscription[OrderDetail]:
+        """
+        List gridpool orders and then stream their updates, without gaps.
+
+        When iterating, the stream is subscribed to, and the orders are listed
+        once the stream has been requested from the server. The updates received
+        meanwhile are buffered and sent after the listed orders, dropping the ones
+        not newer than an order already sent (by modification time).
+
+        Args:
+            gridpool_id: ID of the gridpool to get the orders for.
+            order_states: List of order states to filter for.
+            market_side: Market side to filter for.
+            delivery_area: Delivery area to filter for.
+            delivery_period: Delivery period to filter for.
+            tag: Tag to filter for.
+            resumable: Whether to follow a resumable stream, which also sends the
+                updates missed while it was reconnecting, see
+                `gridpool_orders_stream()`.
+            buffer_size: The maximum number of updates buffered while listing.
+                Iterating raises a `SnapshotOverflowError` if more updates are
+                received meanwhile.
+
+        Returns:
+            The listed orders followed by their updates.
+        """
+        return SnapshotSubscription(
+            lambda maxsize: subscribe_when_streaming(
+                self.gridpool_orders_stream(
+                    gridpool_id,
+                    order_states=order_states,
+                    market_side=market_side,
+                    delivery_area=delivery_area,
+                    delivery_period=delivery_period,
+                    tag=tag,
+                    resumable=resumable,
+                ),
+                maxsize,
+            ),
+            lambda: self.list_gridpool_orders(
+                gridpool_id,
+                order_states=order_states,
+                side=market_side,
+                delivery_period=delivery_period,
+                delivery_area=delivery_area,
+                tag=tag,
+            ),
+            key=lambda order: order.order_id,
+            version=lambda order: order.modification_time,
+            buffer_size=buffer_size,
+        )
+
+    def snapshot_and_stream_gridpool_trades(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        gridpool_id: int,
+        trade_states: list[TradeState] | None = None,
+        trade_ids: list[int] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> SnapshotSubscription[Trade]:
+        """
+        List gridpool trades and then stream the new ones, without gaps.
+
+        When iterating, the stream is subscribed to, and the trades are listed
+        once the stream has been requested from the server. The trades received
+        meanwhile are buffered and sent after the listed ones, dropping the ones
+        already sent with the same state.
+
+        Args:
+            gridpool_id: The ID of the gridpool to get the trades for.
+            trade_states: List of trade states to filter for.
+            trade_ids: List of trade IDs to filter for.
+            market_side: The market side to filter for.
+            delivery_period: The delivery period to filter for.
+            delivery_area: The delivery area to filter for.
+            buffer_size: The maximum number of trades buffered while listing.
+                Iterating raises a `SnapshotOverflowError` if more trades are
+                received meanwhile.
+
+        Returns:
+            The listed trades followed by the new ones.
+        """
+        return SnapshotSubscription(
+            lambda maxsize: subscribe_when_streaming(
+                self.gridpool_trades_stream(
+                    gridpool_id,
+                    trade_states=trade_states,
+                    trade_ids=trade_ids,
+                    market_side=market_side,
+                    delivery_period=delivery_period,
+                    delivery_area=delivery_area,
+                ),
+                maxsize,
+            ),
+            lambda: self.list_gridpool_trades(
+                gridpool_id,
+                trade_states=trade_states,
+                trade_ids=trade_ids,
+                market_side=market_side,
+                delivery_period=delivery_period,
+                delivery_area=delivery_area,
+            ),
+            key=lambda trade: (trade.id, trade.state),
+            version=lambda trade: trade.execution_time,
+            buffer_size=buffer_size,
+        )
+
+    def snapshot_and_stream_public_trades(
+        self,
+        states: list[TradeState] | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> SnapshotSubscription[PublicTrade]:
+        """
+        List public trades and then stream the new ones, without gaps.
+
+        When iterating, the stream is subscribed to, and the trades are listed
+        once the stream has been requested from the server. The trades received
+        meanwhile are buffered and sent after the listed ones, dropping the ones
+        already sent with the same state.
+
+        Args:
+            states: List of trade states to filter for.
+            delivery_period: Delivery period to filter for.
+            buy_delivery_area: Buy delivery area to filter for.
+            sell_delivery_area: Sell delivery area to filter for.
+            buffer_size: The maximum number of trades buffered while listing.
+                Iterating raises a `SnapshotOverflowError` if more trades are
+                received meanwhile.
+
+        Returns:
+            The listed trades followed by the new ones.
+        """
+        return SnapshotSubscription(
+            lambda maxsize: subscribe_when_streaming(
+                self.public_trades_stream(
+                    states=states,
+                    delivery_period=delivery_period,
+                    buy_delivery_area=buy_delivery_area,
+                    sell_delivery_area=sell_delivery_area,
+                ),
+                maxsize,
+            ),
+            lambda: self.list_public_trades(
+                states=states,
+                delivery_period=delivery_period,
+                buy_delivery_area=buy_delivery_area,
+                sell_delivery_area=sell_delivery_area,
+            ),
+            key=lambda trade: (trade.public_trade_id, trade.state),
+            version=lambda trade: trade.execution_time,
+            buffer_size=buffer_size,
+        )
+
+    def _new_public_trades_stream(
+        self,
+        public_trade_filter: PublicTradeFilter,
+        decode: Callable[[electricity_trading_pb2.PublicTrade], Any] = (
+            PublicTrade.from_pb
+        ),
+    ) -> CachedStreamBroadcaster[
+        electricity_trading_pb2.ReceivePublicTradesStreamResponse, Any
+    ]:
+        """
+        Open a new server stream of public trades.
+
+        Args:
+            public_trade_filter: The filter of the trades to stream.
+            decode: The function converting the received protobuf trades.
+
+        Returns:
+            The broadcaster of the new stream.
+        """
+        return CachedStreamBroadcaster(
+            f"electricity-trading-{public_trade_filter}",
+            lambda: self._stream_stub().ReceivePublicTradesStream(
+                electricity_trading_pb2.ReceivePublicTradesStreamRequest(
+                    filter=public_trade_filter.to_pb(),
+                ),
+                **self._call_options.to_kwargs(self._metadata),
+            ),
+            lambda response: decode(response.public_trade),
+        )
 
     def validate_params(
         # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-branches
@@ -499,6 +1698,8 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         payload: dict[str, struct_pb2.Value] | None = None,
         tag: str | None = None,
         timeout: timedelta | None = None,
+        *,
+        call_options: CallOptions | None = None,
     ) -> OrderDetail:
         """
         Create a gridpool order.
@@ -519,6 +1720,8 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             payload: Payload of the order.
             tag: Tag of the order.
             timeout: Timeout duration, defaults to None.
+            call_options: The options of the gRPC call, overriding the default
+                options of the client.
 
         Returns:
             The created order.
@@ -554,21 +1757,102 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         )
 
         try:
-            response = await cast(
-                Awaitable[electricity_trading_pb2.CreateGridpoolOrderResponse],
-                grpc_call_with_timeout(
-                    self.stub.CreateGridpoolOrder,
-                    electricity_trading_pb2.CreateGridpoolOrderRequest(
-                        gridpool_id=gridpool_id, order=order.to_pb()
-                    ),
-                    metadata=self._metadata,
-                    timeout=timeout,
-                ),
+            return await self._create_gridpool_order(
+                gridpool_id, order, timeout, call_options
             )
         except grpc.RpcError as e:
             _logger.exception("Error occurred while creating gridpool order: %s", e)
             raise
 
+    async def create_gridpool_orders(
+        self,
+        gridpool_id: int,
+        orders: list[Order],
+        *,
+        max_concurrency: int = 10,
+        timeout: timedelta | None = None,
+        call_options: CallOptions | None = None,
+    ) -> BulkResult[Order, OrderDetail]:
+        """
+        Create many gridpool orders concurrently.
+
+        All the orders are validated before any of them is submitted. Once
+        submitted, a failing order doesn't prevent the others from being created.
+
+        Args:
+            gridpool_id: ID of the gridpool to create the orders for.
+            orders: The orders to create.
+            max_concurrency: The maximum number of orders being created at the
+                same time.
+            timeout: Timeout duration of each request, defaults to None.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Returns:
+            The outcome of every order, in the given order, with the created order
+                or the error raised while creating it.
+
+        Raises:
+            ValueError: If any of the orders has invalid parameters.
+            NotImplementedError: If any of the orders uses unsupported features.
+        """
+        for index, order in enumerate(orders):
+            try:
+                self.validate_params(
+                    price=order.price,
+                    quantity=order.quantity,
+                    stop_price=order.stop_price,
+                    peak_price_delta=order.peak_price_delta,
+                    display_quantity=order.display_quantity,
+                    delivery_period=order.delivery_period,
+                    valid_until=order.valid_until,
+                    execution_option=order.execution_option,
+                    order_type=order.type,
+                )
+            except (ValueError, NotImplementedError) as e:
+                e.add_note(f"Invalid order at index {index}: {order}")
+                raise
+
+        return await run_bulk(
+            orders,
+            lambda order: self._create_gridpool_order(
+                gridpool_id, order, timeout, call_options
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+    async def _create_gridpool_order(
+        self,
+        gridpool_id: int,
+        order: Order,
+        timeout: timedelta | None,
+        call_options: CallOptions | None,
+    ) -> OrderDetail:
+        """
+        Send an already validated order to the service.
+
+        Args:
+            gridpool_id: ID of the gridpool to create the order for.
+            order: The order to create.
+            timeout: Timeout duration, defaults to None.
+            call_options: The options of the gRPC call, overriding the default
+                options of the client.
+
+        Returns:
+            The created order.
+        """
+        response = await cast(
+            Awaitable[electricity_trading_pb2.CreateGridpoolOrderResponse],
+            self._call_unary(
+                _RpcKind.ORDER_ENTRY,
+                lambda stub: stub.CreateGridpoolOrder,
+                electricity_trading_pb2.CreateGridpoolOrderRequest(
+                    gridpool_id=gridpool_id, order=order.to_pb()
+                ),
+                timeout=timeout,
+                call_options=call_options,
+            ),
+        )
         return OrderDetail.from_pb(response.order_detail)
 
     async def update_gridpool_order(
@@ -586,6 +1870,8 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         payload: dict[str, struct_pb2.Value] | None | _Sentinel = NO_VALUE,
         tag: str | None | _Sentinel = NO_VALUE,
         timeout: timedelta | None = None,
+        *,
+        call_options: CallOptions | None = None,
     ) -> OrderDetail:
         """
         Update an existing order for a given Gridpool.
@@ -609,6 +1895,8 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
                 data that the user wants to associate with the order.
             tag: Updated user-defined tag to group related orders.
             timeout: Timeout duration, defaults to None.
+            call_options: The options of the gRPC call, overriding the default
+                options of the client.
 
         Returns:
             The updated order.
@@ -638,59 +1926,145 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             "payload": payload,
             "tag": tag,
         }
+        changes = {
+            param: value for param, value in params.items() if value is not NO_VALUE
+        }
 
-        if all(value is NO_VALUE for value in params.values()):
+        if not changes:
             raise ValueError("At least one field to update must be provided.")
 
-        paths = [param for param, value in params.items() if value is not NO_VALUE]
+        try:
+            return await self._update_gridpool_order(
+                gridpool_id,
+                order_id,
+                changes,
+                _update_mask(changes),
+                timeout,
+                call_options,
+            )
+        except grpc.RpcError as e:
+            _logger.exception("Error occurred while updating gridpool order: %s", e)
+            raise
+
+    async def update_gridpool_orders(
+        self,
+        gridpool_id: int,
+        updates: list[tuple[int, dict[str, Any]]],
+        *,
+        max_concurrency: int = 10,
+        timeout: timedelta | None = None,
+        call_options: CallOptions | None = None,
+    ) -> BulkResult[tuple[int, dict[str, Any]], OrderDetail]:
+        """
+        Update many orders for a given Gridpool concurrently.
+
+        Each update is a pair of the order ID and a dictionary with the fields to
+        update, using the names of the `update_gridpool_order` arguments (for example
+        `{"price": Price(...), "valid_until": None}`). All the updates are validated
+        before any of them is sent, and updates changing the same set of fields
+        share a single field mask.
+
+        Args:
+            gridpool_id: ID of the Gridpool the orders belong to.
+            updates: The order IDs and the fields to update for each of them.
+            max_concurrency: The maximum number of orders being updated at the
+                same time.
+            timeout: Timeout duration of each request, defaults to None.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Returns:
+            The outcome of every update, in the given order, with the updated order
+                or the error raised while updating it.
+
+        Raises:
+            ValueError: If any of the updates is empty, has unknown fields or has
+                invalid values.
+            NotImplementedError: If any of the updates uses unsupported features.
+        """
+        update_masks: dict[frozenset[str], field_mask_pb2.FieldMask] = {}
+        for index, (order_id, changes) in enumerate(updates):
+            try:
+                if not changes:
+                    raise ValueError("At least one field to update must be provided.")
+                if unknown := changes.keys() - _UPDATABLE_ORDER_FIELDS:
+                    raise ValueError(f"Unknown order fields to update: {unknown}")
+                self.validate_params(
+                    **{
+                        param: value
+                        for param, value in changes.items()
+                        if param not in ("payload", "tag")
+                    }
+                )
+            except (ValueError, NotImplementedError) as e:
+                e.add_note(f"Invalid update at index {index} (order {order_id})")
+                raise
+            fields = frozenset(changes)
+            if fields not in update_masks:
+                update_masks[fields] = _update_mask(changes)
+
+        return await run_bulk(
+            updates,
+            lambda update: self._update_gridpool_order(
+                gridpool_id,
+                update[0],
+                update[1],
+                update_masks[frozenset(update[1])],
+                timeout,
+                call_options,
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+    async def _update_gridpool_order(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        self,
+        gridpool_id: int,
+        order_id: int,
+        changes: dict[str, Any],
+        update_mask: field_mask_pb2.FieldMask,
+        timeout: timedelta | None,
+        call_options: CallOptions | None,
+    ) -> OrderDetail:
+        """
+        Send an already validated order update to the service.
 
-        # Field mask specifying which fields should be updated
-        # This is used so that we can update parameters with None values
-        update_mask = field_mask_pb2.FieldMask(paths=paths)
+        Args:
+            gridpool_id: ID of the Gridpool the order belongs to.
+            order_id: Order ID.
+            changes: The new values of the fields to update.
+            update_mask: The field mask with the names of the fields to update.
+            timeout: Timeout duration, defaults to None.
+            call_options: The options of the gRPC call, overriding the default
+                options of the client.
 
-        update_order_fields = UpdateOrder(
-            price=None if price is NO_VALUE else price,  # type: ignore
-            quantity=None if quantity is NO_VALUE else quantity,  # type: ignore
-            stop_price=None if stop_price is NO_VALUE else stop_price,  # type: ignore
-            peak_price_delta=(
-                None if peak_price_delta is NO_VALUE else peak_price_delta  # type: ignore
-            ),
-            display_quantity=(
-                None if display_quantity is NO_VALUE else display_quantity  # type: ignore
-            ),
-            execution_option=(
-                None if execution_option is NO_VALUE else execution_option  # type: ignore
-            ),
-            valid_until=(
-                None if valid_until is NO_VALUE else valid_until  # type: ignore
+        Returns:
+            The updated order.
+        """
+        response = await cast(
+            Awaitable[electricity_trading_pb2.UpdateGridpoolOrderResponse],
+            self._call_unary(
+                _RpcKind.ORDER_ENTRY,
+                lambda stub: stub.UpdateGridpoolOrder,
+                electricity_trading_pb2.UpdateGridpoolOrderRequest(
+                    gridpool_id=gridpool_id,
+                    order_id=order_id,
+                    update_order_fields=UpdateOrder(**changes).to_pb(),
+                    update_mask=update_mask,
+                ),
+                timeout=timeout,
+                call_options=call_options,
             ),
-            payload=None if payload is NO_VALUE else payload,  # type: ignore
-            tag=None if tag is NO_VALUE else tag,  # type: ignore
         )
-
-        try:
-            response = await cast(
-                Awaitable[electricity_trading_pb2.UpdateGridpoolOrderResponse],
-                grpc_call_with_timeout(
-                    self.stub.UpdateGridpoolOrder,
-                    electricity_trading_pb2.UpdateGridpoolOrderRequest(
-                        gridpool_id=gridpool_id,
-                        order_id=order_id,
-                        update_order_fields=update_order_fields.to_pb(),
-                        update_mask=update_mask,
-                    ),
-                    metadata=self._metadata,
-                    timeout=timeout,
-                ),
-            )
-            return OrderDetail.from_pb(response.order_detail)
-
-        except grpc.RpcError as e:
-            _logger.exception("Error occurred while updating gridpool order: %s", e)
-            raise
+        return OrderDetail.from_pb(response.order_detail)
 
     async def cancel_gridpool_order(
-        self, gridpool_id: int, order_id: int, timeout: timedelta | None = None
+        self,
+        gridpool_id: int,
+        order_id: int,
+        timeout: timedelta | None = None,
+        *,
+        call_options: CallOptions | None = None,
     ) -> OrderDetail:
         """
         Cancel a single order for a given Gridpool.
@@ -699,6 +2073,8 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             gridpool_id: The Gridpool to cancel the order for.
             order_id: The order to cancel.
             timeout: Timeout duration, defaults to None.
+            call_options: The options of the gRPC call, overriding the default
+                options of the client.
 
         Returns:
             The cancelled order.
@@ -707,24 +2083,150 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             grpc.RpcError: If an error occurs while cancelling the gridpool order.
         """
         try:
-            response = await cast(
-                Awaitable[electricity_trading_pb2.CancelGridpoolOrderResponse],
-                grpc_call_with_timeout(
-                    self.stub.CancelGridpoolOrder,
-                    electricity_trading_pb2.CancelGridpoolOrderRequest(
-                        gridpool_id=gridpool_id, order_id=order_id
-                    ),
-                    metadata=self._metadata,
-                    timeout=timeout,
-                ),
+            return await self._cancel_gridpool_order(
+                gridpool_id, order_id, timeout, call_options
             )
-            return OrderDetail.from_pb(response.order_detail)
         except grpc.RpcError as e:
             _logger.exception("Error occurred while cancelling gridpool order: %s", e)
             raise
 
+    async def _cancel_gridpool_order(
+        self,
+        gridpool_id: int,
+        order_id: int,
+        timeout: timedelta | None,
+        call_options: CallOptions | None,
+    ) -> OrderDetail:
+        """
+        Send the cancellation of an order to the service.
+
+        Args:
+            gridpool_id: The Gridpool to cancel the order for.
+            order_id: The order to cancel.
+            timeout: Timeout duration, defaults to None.
+            call_options: The options of the gRPC call, overriding the default
+                options of the client.
+
+        Returns:
+            The cancelled order.
+        """
+        response = await cast(
+            Awaitable[electricity_trading_pb2.CancelGridpoolOrderResponse],
+            self._call_unary(
+                _RpcKind.ORDER_ENTRY,
+                lambda stub: stub.CancelGridpoolOrder,
+                electricity_trading_pb2.CancelGridpoolOrderRequest(
+                    gridpool_id=gridpool_id, order_id=order_id
+                ),
+                timeout=timeout,
+                call_options=call_options,
+            ),
+        )
+        return OrderDetail.from_pb(response.order_detail)
+
+    async def cancel_gridpool_orders(
+        self,
+        gridpool_id: int,
+        order_ids: list[int],
+        *,
+        max_concurrency: int = 10,
+        timeout: timedelta | None = None,
+        call_options: CallOptions | None = None,
+    ) -> BulkResult[int, OrderDetail]:
+        """
+        Cancel many orders for a given Gridpool concurrently.
+
+        A failing cancellation doesn't prevent the other orders from being cancelled.
+
+        Args:
+            gridpool_id: The Gridpool to cancel the orders for.
+            order_ids: The orders to cancel.
+            max_concurrency: The maximum number of orders being cancelled at the
+                same time.
+            timeout: Timeout duration of each request, defaults to None.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Returns:
+            The outcome of every cancellation, in the given order, with the
+                cancelled order or the error raised while cancelling it.
+        """
+        return await run_bulk(
+            order_ids,
+            lambda order_id: self._cancel_gridpool_order(
+                gridpool_id, order_id, timeout, call_options
+            ),
+            max_concurrency=max_concurrency,
+        )
+
+    async def cancel_gridpool_orders_by_filter(
+        # pylint: disable=too-many-arguments
+        self,
+        gridpool_id: int,
+        *,
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+        max_concurrency: int = 10,
+        timeout: timedelta | None = None,
+        call_options: CallOptions | None = None,
+    ) -> BulkResult[int, OrderDetail]:
+        """
+        Cancel all the orders of a Gridpool matching the given filters.
+
+        The IDs of the matching orders are read from the protobuf messages
+        returned by `list_gridpool_orders_raw`, without converting them, and the
+        orders are then cancelled concurrently.
+
+        Args:
+            gridpool_id: The Gridpool to cancel the orders for.
+            order_states: List of order states to filter by. Defaults to the states
+                of open orders (pending, active and hibernated).
+            side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            tag: The tag to filter by.
+            max_concurrency: The maximum number of orders being cancelled at the
+                same time.
+            timeout: Timeout duration of each request, defaults to None.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Returns:
+            The outcome of every cancellation, with the cancelled order or the
+                error raised while cancelling it.
+        """
+        order_ids = [
+            order_detail.order_id
+            async for order_detail in self.list_gridpool_orders_raw(
+                gridpool_id,
+                order_states=(
+                    _OPEN_ORDER_STATES if order_states is None else order_states
+                ),
+                side=side,
+                delivery_period=delivery_period,
+                delivery_area=delivery_area,
+                tag=tag,
+                timeout=timeout,
+                call_options=call_options,
+            )
+        ]
+        return await self.cancel_gridpool_orders(
+            gridpool_id,
+            order_ids,
+            max_concurrency=max_concurrency,
+            timeout=timeout,
+            call_options=call_options,
+        )
+
     async def cancel_all_gridpool_orders(
-        self, gridpool_id: int, timeout: timedelta | None = None
+        self,
+        gridpool_id: int,
+        timeout: timedelta | None = None,
+        *,
+        call_options: CallOptions | None = None,
     ) -> int:
         """
         Cancel all orders for a specific Gridpool.
@@ -732,6 +2234,8 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         Args:
             gridpool_id: The Gridpool to cancel the orders for.
             timeout: Timeout duration, defaults to None.
+            call_options: The options of the gRPC call, overriding the default
+                options of the client.
 
         Returns:
             The ID of the Gridpool for which the orders were cancelled.
@@ -742,13 +2246,14 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         try:
             response = await cast(
                 Awaitable[electricity_trading_pb2.CancelAllGridpoolOrdersResponse],
-                grpc_call_with_timeout(
-                    self.stub.CancelAllGridpoolOrders,
+                self._call_unary(
+                    _RpcKind.ORDER_ENTRY,
+                    lambda stub: stub.CancelAllGridpoolOrders,
                     electricity_trading_pb2.CancelAllGridpoolOrdersRequest(
                         gridpool_id=gridpool_id
                     ),
-                    metadata=self._metadata,
                     timeout=timeout,
+                    call_options=call_options,
                 ),
             )
 
@@ -760,7 +2265,12 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             raise
 
     async def get_gridpool_order(
-        self, gridpool_id: int, order_id: int, timeout: timedelta | None = None
+        self,
+        gridpool_id: int,
+        order_id: int,
+        timeout: timedelta | None = None,
+        *,
+        call_options: CallOptions | None = None,
     ) -> OrderDetail:
         """
         Get a single order from a given gridpool.
@@ -769,6 +2279,8 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             gridpool_id: The Gridpool to retrieve the order for.
             order_id: The order to retrieve.
             timeout: Timeout duration, defaults to None.
+            call_options: The options of the gRPC call, overriding the default
+                options of the client.
 
         Returns:
             The order.
@@ -779,97 +2291,520 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         try:
             response = await cast(
                 Awaitable[electricity_trading_pb2.GetGridpoolOrderResponse],
-                grpc_call_with_timeout(
-                    self.stub.GetGridpoolOrder,
+                self._call_unary(
+                    _RpcKind.READ,
+                    lambda stub: stub.GetGridpoolOrder,
                     electricity_trading_pb2.GetGridpoolOrderRequest(
                         gridpool_id=gridpool_id, order_id=order_id
                     ),
-                    metadata=self._metadata,
                     timeout=timeout,
+                    call_options=call_options,
                 ),
             )
 
-            return OrderDetail.from_pb(response.order_detail)
-        except grpc.RpcError as e:
-            _logger.exception("Error occurred while getting gridpool order: %s", e)
-            raise
+            return OrderDetail.from_pb(response.order_detail)
+        except grpc.RpcError as e:
+            _logger.exception("Error occurred while getting gridpool order: %s", e)
+            raise
+
+    async def list_gridpool_orders(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        gridpool_id: int,
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[OrderDetail]:
+        """
+        List orders for a specific Gridpool with optional filters.
+
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the orders for.
+            order_states: List of order states to filter by.
+            side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            tag: The tag to filter by.
+            page_size: The number of orders to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+            lazy: Whether to yield views of the received messages, decoding each
+                field on first access, which is cheaper if only some fields are
+                read. Assigning a field of a view only changes that field, and
+                `dataclasses.replace()` returns a fully decoded instance.
+
+        Yields:
+            The list of orders for the given gridpool.
+        """
+        decode = LazyOrderDetail.from_pb if lazy else OrderDetail.from_pb
+        async for page in self._list_gridpool_orders_pages(
+            gridpool_id,
+            order_states,
+            side,
+            delivery_period,
+            delivery_area,
+            tag,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=lambda page: map(decode, page),
+        ):
+            for order_detail in page:
+                yield order_detail
+
+    async def list_gridpool_orders_raw(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        gridpool_id: int,
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[electricity_trading_pb2.OrderDetail]:
+        """
+        List gridpool orders as the received protobuf messages, without converting them.
+
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the orders for.
+            order_states: List of order states to filter by.
+            side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            tag: The tag to filter by.
+            page_size: The number of orders to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Yields:
+            The list of orders for the given gridpool.
+        """
+        async for page in self._list_gridpool_orders_pages(
+            gridpool_id,
+            order_states,
+            side,
+            delivery_period,
+            delivery_area,
+            tag,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=lambda page: page,
+        ):
+            for order_detail in page:
+                yield order_detail
+
+    async def list_gridpool_orders_batches(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        gridpool_id: int,
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[OrderDetailBatch]:
+        """
+        List gridpool orders as columnar batches, one per page.
+
+        The orders of each page are decoded straight into NumPy arrays,
+        without creating objects for each of them, which is much faster and
+        smaller when analyzing many orders. Use `OrderDetailBatch.concat()` to
+        merge the batches.
+
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the orders for.
+            order_states: List of order states to filter by.
+            side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            tag: The tag to filter by.
+            page_size: The number of orders to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Yields:
+            The batch of gridpool orders of each page.
+        """
+        async for page in self._list_gridpool_orders_pages(
+            gridpool_id,
+            order_states,
+            side,
+            delivery_period,
+            delivery_area,
+            tag,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=OrderDetailBatch.from_pb,
+        ):
+            yield page
+
+    async def _list_gridpool_orders_pages(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        gridpool_id: int,
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+        decode: Callable[[Sequence[electricity_trading_pb2.OrderDetail]], PageT],
+    ) -> AsyncIterator[PageT]:
+        """
+        List the pages of gridpool orders, decoding each of them.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the orders for.
+            order_states: List of order states to filter by.
+            side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            tag: The tag to filter by.
+            page_size: The number of orders to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+            decode: The function decoding the protobuf orders of each page.
+
+        Yields:
+            The decoded pages.
+
+        Raises:
+            grpc.RpcError: If an error occurs while listing the orders.
+        """
+        gridpool_order_filter = GridpoolOrderFilter(
+            order_states=order_states,
+            side=side,
+            delivery_period=delivery_period,
+            delivery_area=delivery_area,
+            tag=tag,
+        )
+
+        request = electricity_trading_pb2.ListGridpoolOrdersRequest(
+            gridpool_id=gridpool_id,
+            filter=gridpool_order_filter.to_pb(),
+            pagination_params=(
+                Params(page_size=page_size).to_proto() if page_size else None
+            ),
+        )
+        try:
+            async for response in self._iter_pages(
+                lambda stub: stub.ListGridpoolOrders,
+                request,
+                timeout=timeout,
+                deadline=deadline,
+                partial=partial,
+                prefetch=prefetch,
+                call_options=call_options,
+            ):
+                yield decode(response.order_details)
+
+        except grpc.RpcError as e:
+            _logger.exception("Error occurred while listing gridpool orders: %s", e)
+            raise
+
+    async def list_gridpool_trades(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        gridpool_id: int,
+        trade_states: list[TradeState] | None = None,
+        trade_ids: list[int] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+        lazy: bool = False,
+    ) -> AsyncIterator[Trade]:
+        """
+        List trades for a specific Gridpool with optional filters.
+
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the trades for.
+            trade_states: List of trade states to filter by.
+            trade_ids: List of trade IDs to filter by.
+            market_side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            page_size: The number of trades to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+            lazy: Whether to yield views of the received messages, decoding each
+                field on first access, which is cheaper if only some fields are
+                read. Assigning a field of a view only changes that field, and
+                `dataclasses.replace()` returns a fully decoded instance.
+
+        Yields:
+            The list of trades for the given gridpool.
+        """
+        decode = LazyTrade.from_pb if lazy else Trade.from_pb
+        async for page in self._list_gridpool_trades_pages(
+            gridpool_id,
+            trade_states,
+            trade_ids,
+            market_side,
+            delivery_period,
+            delivery_area,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=lambda page: map(decode, page),
+        ):
+            for trade in page:
+                yield trade
 
-    async def list_gridpool_orders(
+    async def list_gridpool_trades_raw(
         # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
         self,
         gridpool_id: int,
-        order_states: list[OrderState] | None = None,
-        side: MarketSide | None = None,
+        trade_states: list[TradeState] | None = None,
+        trade_ids: list[int] | None = None,
+        market_side: MarketSide | None = None,
         delivery_period: DeliveryPeriod | None = None,
         delivery_area: DeliveryArea | None = None,
-        tag: str | None = None,
         page_size: int | None = None,
         timeout: timedelta | None = None,
-    ) -> AsyncIterator[OrderDetail]:
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[electricity_trading_pb2.Trade]:
         """
-        List orders for a specific Gridpool with optional filters.
+        List gridpool trades as the received protobuf messages, without converting them.
+
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
 
         Args:
-            gridpool_id: The Gridpool to retrieve the orders for.
-            order_states: List of order states to filter by.
-            side: The side of the market to filter by.
+            gridpool_id: The Gridpool to retrieve the trades for.
+            trade_states: List of trade states to filter by.
+            trade_ids: List of trade IDs to filter by.
+            market_side: The side of the market to filter by.
             delivery_period: The delivery period to filter by.
             delivery_area: The delivery area to filter by.
-            tag: The tag to filter by.
-            page_size: The number of orders to return per page.
-            timeout: Timeout duration, defaults to None.
+            page_size: The number of trades to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
 
         Yields:
-            The list of orders for the given gridpool.
+            The list of trades for the given gridpool.
+        """
+        async for page in self._list_gridpool_trades_pages(
+            gridpool_id,
+            trade_states,
+            trade_ids,
+            market_side,
+            delivery_period,
+            delivery_area,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=lambda page: page,
+        ):
+            for trade in page:
+                yield trade
 
-        Raises:
-            grpc.RpcError: If an error occurs while listing the orders.
+    async def list_gridpool_trades_batches(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        gridpool_id: int,
+        trade_states: list[TradeState] | None = None,
+        trade_ids: list[int] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[TradeBatch]:
         """
-        gridpool_order_filter = GridpoolOrderFilter(
-            order_states=order_states,
-            side=side,
-            delivery_period=delivery_period,
-            delivery_area=delivery_area,
-            tag=tag,
-        )
+        List gridpool trades as columnar batches, one per page.
 
-        request = electricity_trading_pb2.ListGridpoolOrdersRequest(
-            gridpool_id=gridpool_id,
-            filter=gridpool_order_filter.to_pb(),
-            pagination_params=(
-                Params(page_size=page_size).to_proto() if page_size else None
-            ),
-        )
-        while True:
-            try:
-                response = await cast(
-                    Awaitable[electricity_trading_pb2.ListGridpoolOrdersResponse],
-                    grpc_call_with_timeout(
-                        self.stub.ListGridpoolOrders,
-                        request,
-                        metadata=self._metadata,
-                        timeout=timeout,
-                    ),
-                )
+        The trades of each page are decoded straight into NumPy arrays,
+        without creating objects for each of them, which is much faster and
+        smaller when analyzing many trades. Use `TradeBatch.concat()` to
+        merge the batches.
 
-                for order_detail in response.order_details:
-                    yield OrderDetail.from_pb(order_detail)
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
 
-                if response.pagination_info.next_page_token:
-                    request.pagination_params.CopyFrom(
-                        PaginationParams(
-                            page_token=response.pagination_info.next_page_token
-                        )
-                    )
-                else:
-                    break
+        Args:
+            gridpool_id: The Gridpool to retrieve the trades for.
+            trade_states: List of trade states to filter by.
+            trade_ids: List of trade IDs to filter by.
+            market_side: The side of the market to filter by.
+            delivery_period: The delivery period to filter by.
+            delivery_area: The delivery area to filter by.
+            page_size: The number of trades to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
 
-            except grpc.RpcError as e:
-                _logger.exception("Error occurred while listing gridpool orders: %s", e)
-                raise
+        Yields:
+            The batch of gridpool trades of each page.
+        """
+        async for page in self._list_gridpool_trades_pages(
+            gridpool_id,
+            trade_states,
+            trade_ids,
+            market_side,
+            delivery_period,
+            delivery_area,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=TradeBatch.from_pb,
+        ):
+            yield page
 
-    async def list_gridpool_trades(
-        # pylint: disable=too-many-arguments, too-many-positional-arguments
+    async def _list_gridpool_trades_pages(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
         self,
         gridpool_id: int,
         trade_states: list[TradeState] | None = None,
@@ -879,9 +2814,15 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         delivery_area: DeliveryArea | None = None,
         page_size: int | None = None,
         timeout: timedelta | None = None,
-    ) -> AsyncIterator[Trade]:
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+        decode: Callable[[Sequence[electricity_trading_pb2.Trade]], PageT],
+    ) -> AsyncIterator[PageT]:
         """
-        List trades for a specific Gridpool with optional filters.
+        List the pages of gridpool trades, decoding each of them.
 
         Args:
             gridpool_id: The Gridpool to retrieve the trades for.
@@ -891,10 +2832,22 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             delivery_period: The delivery period to filter by.
             delivery_area: The delivery area to filter by.
             page_size: The number of trades to return per page.
-            timeout: Timeout duration, defaults to None.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+            decode: The function decoding the protobuf trades of each page.
 
         Yields:
-            The list of trades for the given gridpool.
+            The decoded pages.
 
         Raises:
             grpc.RpcError: If an error occurs while listing gridpool trades.
@@ -915,36 +2868,24 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             ),
         )
 
-        while True:
-            try:
-                response = await cast(
-                    Awaitable[electricity_trading_pb2.ListGridpoolTradesResponse],
-                    grpc_call_with_timeout(
-                        self.stub.ListGridpoolTrades,
-                        request,
-                        metadata=self._metadata,
-                        timeout=timeout,
-                    ),
-                )
-
-                for trade in response.trades:
-                    yield Trade.from_pb(trade)
-
-                if response.pagination_info.next_page_token:
-                    request.pagination_params.CopyFrom(
-                        PaginationParams(
-                            page_token=response.pagination_info.next_page_token
-                        )
-                    )
-                else:
-                    break
+        try:
+            async for response in self._iter_pages(
+                lambda stub: stub.ListGridpoolTrades,
+                request,
+                timeout=timeout,
+                deadline=deadline,
+                partial=partial,
+                prefetch=prefetch,
+                call_options=call_options,
+            ):
+                yield decode(response.trades)
 
-            except grpc.RpcError as e:
-                _logger.exception("Error occurred while listing gridpool trades: %s", e)
-                raise
+        except grpc.RpcError as e:
+            _logger.exception("Error occurred while listing gridpool trades: %s", e)
+            raise
 
     async def list_public_trades(
-        # pylint: disable=too-many-arguments, too-many-positional-arguments
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
         self,
         states: list[TradeState] | None = None,
         delivery_period: DeliveryPeriod | None = None,
@@ -952,20 +2893,227 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
         sell_delivery_area: DeliveryArea | None = None,
         page_size: int | None = None,
         timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+        lazy: bool = False,
     ) -> AsyncIterator[PublicTrade]:
         """
         List all executed public orders with optional filters and pagination.
 
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
+
         Args:
             states: List of order states to filter by.
             delivery_period: The delivery period to filter by.
             buy_delivery_area: The buy delivery area to filter by.
             sell_delivery_area: The sell delivery area to filter by.
             page_size: The number of public trades to return per page.
-            timeout: Timeout duration, defaults to None.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+            lazy: Whether to yield views of the received messages, decoding each
+                field on first access, which is cheaper if only some fields are
+                read. Assigning a field of a view only changes that field, and
+                `dataclasses.replace()` returns a fully decoded instance.
+
+        Yields:
+            The list of public trades for each page.
+        """
+        decode = LazyPublicTrade.from_pb if lazy else PublicTrade.from_pb
+        async for page in self._list_public_trades_pages(
+            states,
+            delivery_period,
+            buy_delivery_area,
+            sell_delivery_area,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=lambda page: map(decode, page),
+        ):
+            for public_trade in page:
+                yield public_trade
+
+    async def list_public_trades_raw(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        states: list[TradeState] | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[electricity_trading_pb2.PublicTrade]:
+        """
+        List public trades as the received protobuf messages, without converting them.
+
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
+
+        Args:
+            states: List of order states to filter by.
+            delivery_period: The delivery period to filter by.
+            buy_delivery_area: The buy delivery area to filter by.
+            sell_delivery_area: The sell delivery area to filter by.
+            page_size: The number of public trades to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
 
         Yields:
             The list of public trades for each page.
+        """
+        async for page in self._list_public_trades_pages(
+            states,
+            delivery_period,
+            buy_delivery_area,
+            sell_delivery_area,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=lambda page: page,
+        ):
+            for public_trade in page:
+                yield public_trade
+
+    async def list_public_trades_batches(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        states: list[TradeState] | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[PublicTradeBatch]:
+        """
+        List public trades as columnar batches, one per page.
+
+        The trades of each page are decoded straight into NumPy arrays, without
+        creating an object per trade, which is much faster when analyzing many
+        trades. Use `PublicTradeBatch.concat()` to merge the batches.
+
+        A `grpc.RpcError` is raised if a page request fails, and an
+        `asyncio.TimeoutError` if it times out, or if the deadline expires
+        and `partial` is `False`.
+
+        Args:
+            states: List of order states to filter by.
+            delivery_period: The delivery period to filter by.
+            buy_delivery_area: The buy delivery area to filter by.
+            sell_delivery_area: The sell delivery area to filter by.
+            page_size: The number of public trades to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Yields:
+            The batch of public trades of each page.
+        """
+        async for page in self._list_public_trades_pages(
+            states,
+            delivery_period,
+            buy_delivery_area,
+            sell_delivery_area,
+            page_size,
+            timeout,
+            prefetch=prefetch,
+            deadline=deadline,
+            partial=partial,
+            call_options=call_options,
+            decode=PublicTradeBatch.from_pb,
+        ):
+            yield page
+
+    async def _list_public_trades_pages(
+        # pylint: disable=too-many-arguments, too-many-positional-arguments, too-many-locals
+        self,
+        states: list[TradeState] | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        *,
+        prefetch: int = 0,
+        deadline: timedelta | None = None,
+        partial: bool = False,
+        call_options: CallOptions | None = None,
+        decode: Callable[[Sequence[electricity_trading_pb2.PublicTrade]], PageT],
+    ) -> AsyncIterator[PageT]:
+        """
+        List the pages of public trades, decoding each of them.
+
+        Args:
+            states: List of order states to filter by.
+            delivery_period: The delivery period to filter by.
+            buy_delivery_area: The buy delivery area to filter by.
+            sell_delivery_area: The sell delivery area to filter by.
+            page_size: The number of public trades to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            prefetch: Number of pages to fetch ahead while the current page is
+                being consumed. Defaults to 0, which disables prefetching.
+            deadline: The time allowed to receive all the pages, counted from
+                the start of the iteration. It is only checked when a page is
+                requested: the waits for the rate limiter and the timeout of each
+                page request are capped to the time left. Defaults to None, for no
+                limit.
+            partial: If `True`, the iteration stops without an error when the
+                deadline expires, after yielding all the items received so far.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+            decode: The function decoding the protobuf public trades of each page.
+
+        Yields:
+            The decoded pages.
 
         Raises:
             grpc.RpcError: If an error occurs while listing public trades.
@@ -984,30 +3132,213 @@ class Client(BaseApiClient[ElectricityTradingServiceStub]):
             ),
         )
 
-        while True:
-            try:
-                response = await cast(
-                    Awaitable[electricity_trading_pb2.ListPublicTradesResponse],
-                    grpc_call_with_timeout(
-                        self.stub.ListPublicTrades,
-                        request,
-                        metadata=self._metadata,
-                        timeout=timeout,
-                    ),
+        try:
+            async for response in self._iter_pages(
+                lambda stub: stub.ListPublicTrades,
+                request,
+                timeout=timeout,
+                deadline=deadline,
+                partial=partial,
+                prefetch=prefetch,
+                call_options=call_options,
+            ):
+                yield decode(response.public_trades)
+
+        except grpc.RpcError as e:
+            _logger.exception("Error occurred while listing public trades: %s", e)
+            raise
+
+    async def list_gridpool_orders_in_range(
+        # pylint: disable=too-many-arguments
+        self,
+        gridpool_id: int,
+        start: datetime,
+        end: datetime,
+        *,
+        duration: timedelta = timedelta(minutes=15),
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[OrderDetail]:
+        """
+        List orders for all the delivery periods in a time range.
+
+        The range is split into delivery periods of the given duration, which are
+        listed concurrently.
+
+        Args:
+            gridpool_id: The Gridpool to retrieve the orders for.
+            start: Start of the first delivery period.
+            end: End of the time range (exclusive).
+            duration: The duration of each delivery period.
+            order_states: List of order states to filter by.
+            side: The side of the market to filter by.
+            delivery_area: The delivery area to filter by.
+            tag: The tag to filter by.
+            page_size: The number of orders to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            max_concurrency: The maximum number of delivery periods listed at the
+                same time.
+            ordered: If `True`, the orders are yielded grouped by delivery period in
+                chronological order. If `False`, they are yielded as soon as they
+                are received.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Yields:
+            The orders for all the delivery periods in the range.
+        """
+        async for order_detail in merge_iterators(
+            [
+                functools.partial(
+                    self.list_gridpool_orders,
+                    gridpool_id,
+                    order_states=order_states,
+                    side=side,
+                    delivery_period=delivery_period,
+                    delivery_area=delivery_area,
+                    tag=tag,
+                    page_size=page_size,
+                    timeout=timeout,
+                    call_options=call_options,
                 )
+                for delivery_period in delivery_periods(start, end, duration)
+            ],
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        ):
+            yield order_detail
 
-                for public_trade in response.public_trades:
-                    yield PublicTrade.from_pb(public_trade)
+    async def list_gridpool_trades_in_range(
+        # pylint: disable=too-many-arguments
+        self,
+        gridpool_id: int,
+        start: datetime,
+        end: datetime,
+        *,
+        duration: timedelta = timedelta(minutes=15),
+        trade_states: list[TradeState] | None = None,
+        trade_ids: list[int] | None = None,
+        market_side: MarketSide | None = None,
+        delivery_area: DeliveryArea | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[Trade]:
+        """
+        List trades for all the delivery periods in a time range.
 
-                if response.pagination_info.next_page_token:
-                    request.pagination_params.CopyFrom(
-                        PaginationParams(
-                            page_token=response.pagination_info.next_page_token
-                        )
-                    )
-                else:
-                    break
+        The range is split into delivery periods of the given duration, which are
+        listed concurrently.
 
-            except grpc.RpcError as e:
-                _logger.exception("Error occurred while listing public trades: %s", e)
-                raise
+        Args:
+            gridpool_id: The Gridpool to retrieve the trades for.
+            start: Start of the first delivery period.
+            end: End of the time range (exclusive).
+            duration: The duration of each delivery period.
+            trade_states: List of trade states to filter by.
+            trade_ids: List of trade IDs to filter by.
+            market_side: The side of the market to filter by.
+            delivery_area: The delivery area to filter by.
+            page_size: The number of trades to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            max_concurrency: The maximum number of delivery periods listed at the
+                same time.
+            ordered: If `True`, the trades are yielded grouped by delivery period in
+                chronological order. If `False`, they are yielded as soon as they
+                are received.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Yields:
+            The trades for all the delivery periods in the range.
+        """
+        async for trade in merge_iterators(
+            [
+                functools.partial(
+                    self.list_gridpool_trades,
+                    gridpool_id,
+                    trade_states=trade_states,
+                    trade_ids=trade_ids,
+                    market_side=market_side,
+                    delivery_period=delivery_period,
+                    delivery_area=delivery_area,
+                    page_size=page_size,
+                    timeout=timeout,
+                    call_options=call_options,
+                )
+                for delivery_period in delivery_periods(start, end, duration)
+            ],
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        ):
+            yield trade
+
+    async def list_public_trades_in_range(
+        # pylint: disable=too-many-arguments
+        self,
+        start: datetime,
+        end: datetime,
+        *,
+        duration: timedelta = timedelta(minutes=15),
+        states: list[TradeState] | None = None,
+        buy_delivery_area: DeliveryArea | None = None,
+        sell_delivery_area: DeliveryArea | None = None,
+        page_size: int | None = None,
+        timeout: timedelta | None = None,
+        max_concurrency: int = 8,
+        ordered: bool = True,
+        call_options: CallOptions | None = None,
+    ) -> AsyncIterator[PublicTrade]:
+        """
+        List public trades for all the delivery periods in a time range.
+
+        The range is split into delivery periods of the given duration, which are
+        listed concurrently.
+
+        Args:
+            start: Start of the first delivery period.
+            end: End of the time range (exclusive).
+            duration: The duration of each delivery period.
+            states: List of trade states to filter by.
+            buy_delivery_area: The buy delivery area to filter by.
+            sell_delivery_area: The sell delivery area to filter by.
+            page_size: The number of public trades to return per page.
+            timeout: Timeout duration of each page request, defaults to None.
+            max_concurrency: The maximum number of delivery periods listed at the
+                same time.
+            ordered: If `True`, the trades are yielded grouped by delivery period in
+                chronological order. If `False`, they are yielded as soon as they
+                are received.
+            call_options: The options of each gRPC call, overriding the default
+                options of the client.
+
+        Yields:
+            The public trades for all the delivery periods in the range.
+        """
+        async for public_trade in merge_iterators(
+            [
+                functools.partial(
+                    self.list_public_trades,
+                    states=states,
+                    delivery_period=delivery_period,
+                    buy_delivery_area=buy_delivery_area,
+                    sell_delivery_area=sell_delivery_area,
+                    page_size=page_size,
+                    timeout=timeout,
+                    call_options=call_options,
+                )
+                for delivery_period in delivery_periods(start, end, duration)
+            ],
+            max_concurrency=max_concurrency,
+            ordered=ordered,
+        ):
+            yield public_trade
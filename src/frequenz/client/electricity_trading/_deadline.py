@@ -0,0 +1,66 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Time budgets shared by several requests."""
+
+from __future__ import annotations
+
+import asyncio
+from datetime import timedelta
+
+
+class Deadline:
+    """A time budget for an operation sending several requests.
+
+    The budget starts running when the deadline is created, so it must be
+    created from within the event loop.
+    """
+
+    def __init__(self, budget: timedelta) -> None:
+        """Initialize the deadline.
+
+        Args:
+            budget: The total time allowed for the operation.
+
+        Raises:
+            ValueError: If the budget is not positive.
+        """
+        if budget <= timedelta():
+            raise ValueError("The deadline budget must be positive.")
+        self._loop = asyncio.get_running_loop()
+        self._expires_at = self._loop.time() + budget.total_seconds()
+
+    @property
+    def expires_at(self) -> float:
+        """The event loop time at which the deadline expires.
+
+        It can be given to `asyncio.timeout_at()` to bound a wait by the deadline.
+        """
+        return self._expires_at
+
+    @property
+    def remaining(self) -> timedelta:
+        """The time left before the deadline expires."""
+        return timedelta(seconds=max(0.0, self._expires_at - self._loop.time()))
+
+    @property
+    def expired(self) -> bool:
+        """Whether the deadline has expired."""
+        return self._loop.time() >= self._expires_at
+
+    def timeout(self, timeout: timedelta | None = None) -> timedelta:
+        """Get the timeout of the next request.
+
+        Args:
+            timeout: The timeout of a single request, if any.
+
+        Returns:
+            The given timeout, capped to the time left before the deadline.
+
+        Raises:
+            asyncio.TimeoutError: If the deadline has already expired.
+        """
+        remaining = self.remaining
+        if remaining <= timedelta():
+            raise asyncio.TimeoutError("The deadline has expired.")
+        return remaining if timeout is None else min(timeout, remaining)
@@ -0,0 +1,145 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Helpers to fan out requests over many delivery periods."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from datetime import datetime, timedelta
+from typing import AsyncIterator, Callable, Sequence, TypeVar
+
+from ._types import DeliveryPeriod
+
+T = TypeVar("T")
+"""The type of the merged items."""
+
+
+def delivery_periods(
+    start: datetime, end: datetime, duration: timedelta
+) -> list[DeliveryPeriod]:
+    """Split a time range into consecutive delivery periods.
+
+    Args:
+        start: Start of the range (inclusive), which is also the start of the
+            first delivery period.
+        end: End of the range (exclusive). A delivery period starting before `end`
+            is included even if it ends after it.
+        duration: The duration of each delivery period.
+
+    Returns:
+        The delivery periods covering the range, in chronological order.
+
+    Raises:
+        ValueError: If the range is empty.
+    """
+    if start >= end:
+        raise ValueError("The start of the range must be before its end.")
+
+    periods = []
+    period_start = start
+    while period_start < end:
+        periods.append(DeliveryPeriod(start=period_start, duration=duration))
+        period_start += duration
+    return periods
+
+
+class _Done:
+    """Marker for an exhausted iterator."""
+
+
+_DONE = _Done()
+
+
+async def merge_iterators(
+    factories: Sequence[Callable[[], AsyncIterator[T]]],
+    *,
+    max_concurrency: int,
+    ordered: bool,
+    buffer_size: int = 100,
+) -> AsyncIterator[T]:
+    """Run many async iterators concurrently and merge their items.
+
+    The first error raised by any of the iterators is raised once the items
+    already buffered for the iterator being yielded are yielded, even if it was
+    raised by a later iterator. The remaining iterators are then cancelled.
+
+    Args:
+        factories: Functions creating the iterators to merge. They are started in
+            order as soon as a concurrency slot is available.
+        max_concurrency: The maximum number of iterators consumed at the same time.
+        ordered: If `True`, all the items of an iterator are yielded before the
+            items of the next one, buffering the items of the iterators that finish
+            early. If `False`, the items are yielded as soon as they arrive.
+        buffer_size: The maximum number of items buffered per iterator if
+            `ordered`, or for all of them otherwise. Iterators with a full buffer
+            are paused, keeping their concurrency slot, until the consumer
+            catches up.
+
+    Yields:
+        The items of all the iterators.
+
+    Raises:
+        ValueError: If `max_concurrency` or `buffer_size` is not positive.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be a positive integer.")
+    if buffer_size < 1:
+        raise ValueError("buffer_size must be a positive integer.")
+
+    semaphore = asyncio.Semaphore(max_concurrency)
+    failed: asyncio.Future[Exception] = asyncio.get_running_loop().create_future()
+    shared_queue: asyncio.Queue[T | _Done] = asyncio.Queue(maxsize=buffer_size)
+    queues = [
+        asyncio.Queue(maxsize=buffer_size) if ordered else shared_queue
+        for _ in factories
+    ]
+
+    async def drain(
+        factory: Callable[[], AsyncIterator[T]],
+        queue: asyncio.Queue[T | _Done],
+    ) -> None:
+        async with semaphore:
+            try:
+                async for item in factory():
+                    await queue.put(item)
+            except Exception as exc:  # pylint: disable=broad-except
+                if not failed.done():
+                    failed.set_result(exc)
+                return
+            await queue.put(_DONE)
+
+    async def next_item(queue: asyncio.Queue[T | _Done]) -> T | _Done:
+        if not queue.empty():
+            return queue.get_nowait()
+        if failed.done():
+            raise failed.result()
+        get = asyncio.ensure_future(queue.get())
+        await asyncio.wait((get, failed), return_when=asyncio.FIRST_COMPLETED)
+        if get.done():
+            return get.result()
+        get.cancel()
+        raise failed.result()
+
+    tasks = [
+        asyncio.create_task(drain(factory, queue))
+        for factory, queue in zip(factories, queues)
+    ]
+    try:
+        pending = len(tasks)
+        for queue in queues if ordered else [shared_queue]:
+            while pending:
+                item = await next_item(queue)
+                if isinstance(item, _Done):
+                    pending -= 1
+                    if ordered:
+                        break
+                    continue
+                yield item
+    finally:
+        for task in tasks:
+            task.cancel()
+        for task in tasks:
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
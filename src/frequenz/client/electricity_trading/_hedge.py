@@ -0,0 +1,151 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Hedging of latency-critical requests."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Awaitable, Callable, TypeVar
+
+T = TypeVar("T")
+"""The type of the result of the hedged call."""
+
+
+@dataclass(frozen=True)
+class HedgePolicy:
+    """A policy to send a duplicate of slow requests."""
+
+    delay: timedelta
+    """The time to wait for a response before sending a duplicate request.
+
+    A good value is a high percentile (for example the p95) of the observed
+    latency of the requests, so that only the slowest requests are hedged.
+    """
+
+    def __post_init__(self) -> None:
+        """Validate the hedge policy.
+
+        Raises:
+            ValueError: If the delay is negative.
+        """
+        if self.delay < timedelta():
+            raise ValueError("The hedge delay must not be negative.")
+
+
+@dataclass(frozen=True)
+class HedgeStats:
+    """Statistics about the hedged requests."""
+
+    requests: int
+    """The number of requests that went through the hedger."""
+
+    hedged_requests: int
+    """The number of requests for which a duplicate was sent."""
+
+    hedge_wins: int
+    """The number of requests answered first by the duplicate."""
+
+    @property
+    def hedge_rate(self) -> float:
+        """The fraction of the requests for which a duplicate was sent.
+
+        Returns:
+            The hedge rate, between 0 and 1.
+        """
+        if self.requests == 0:
+            return 0.0
+        return self.hedged_requests / self.requests
+
+    @property
+    def win_rate(self) -> float:
+        """The fraction of the hedged requests answered first by the duplicate.
+
+        Returns:
+            The win rate, between 0 and 1.
+        """
+        if self.hedged_requests == 0:
+            return 0.0
+        return self.hedge_wins / self.hedged_requests
+
+
+class Hedger:
+    """Sends a duplicate of a request if it takes too long to be answered.
+
+    The first successful response wins and the other request is cancelled. If
+    one of the two requests fails, the other one is still waited for.
+    """
+
+    def __init__(self, policy: HedgePolicy) -> None:
+        """Initialize the hedger.
+
+        Args:
+            policy: The hedge policy to apply.
+        """
+        self._policy = policy
+        self._requests = 0
+        self._hedged_requests = 0
+        self._hedge_wins = 0
+
+    @property
+    def policy(self) -> HedgePolicy:
+        """The hedge policy applied by this hedger."""
+        return self._policy
+
+    @property
+    def stats(self) -> HedgeStats:
+        """Statistics about the requests hedged by this hedger."""
+        return HedgeStats(
+            requests=self._requests,
+            hedged_requests=self._hedged_requests,
+            hedge_wins=self._hedge_wins,
+        )
+
+    async def call(self, send: Callable[[], Awaitable[T]]) -> T:
+        """Send a request, hedging it if it is not answered in time.
+
+        If the request fails before the duplicate is sent, its error is raised. If
+        both fail, the error of the duplicate is raised.
+
+        Args:
+            send: The function sending the request. It is called a second time to
+                send the duplicate.
+
+        Returns:
+            The first successful response.
+        """
+        self._requests += 1
+        primary = asyncio.ensure_future(send())
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(
+                tasks, timeout=self._policy.delay.total_seconds()
+            )
+            if done:
+                return primary.result()
+
+            self._hedged_requests += 1
+            hedge = asyncio.ensure_future(send())
+            tasks.add(hedge)
+
+            pending = set(tasks)
+            while pending:
+                _, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                if primary.done() and primary.exception() is None:
+                    return primary.result()
+                if hedge.done() and hedge.exception() is None:
+                    self._hedge_wins += 1
+                    return hedge.result()
+            # Both requests failed, the duplicate was sent last.
+            return hedge.result()
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    # Mark the error of the losing request as retrieved.
+                    task.exception()
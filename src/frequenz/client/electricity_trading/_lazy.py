@@ -0,0 +1,392 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Views of protobuf messages decoding their fields on first access."""
+
+from __future__ import annotations
+
+import dataclasses
+from datetime import datetime, timezone
+from typing import Any, Callable, Generic, Self, TypeVar, overload
+
+# pylint: disable=no-member
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+from google.protobuf.message import Message
+
+from ._types import (
+    Currency,
+    DeliveryArea,
+    DeliveryPeriod,
+    MarketSide,
+    Order,
+    OrderDetail,
+    OrderState,
+    Power,
+    Price,
+    PublicTrade,
+    StateDetail,
+    Trade,
+    TradeState,
+)
+
+# The fields of the views are lazy fields, overriding the dataclass fields.
+# mypy: disable-error-code="override"
+
+T = TypeVar("T")
+"""The type of a field."""
+
+
+class _LazyField(Generic[T]):
+    """A field of a view, decoded from the viewed message on first access.
+
+    The decoded value is stored in the slot of the field in the viewed
+    dataclass, so views take no more memory than the dataclass instances.
+    """
+
+    def __init__(self, decode: Callable[[Any], T]) -> None:
+        """Initialize the field.
+
+        Args:
+            decode: A function decoding the field from the view's message.
+        """
+        self._decode = decode
+        self._slot: Any = None
+        self.__doc__ = decode.__doc__
+
+    def __set_name__(self, owner: type[_LazyView], name: str) -> None:
+        """Find the slot of the field in the viewed dataclass.
+
+        Args:
+            owner: The view class.
+            name: The name of the field.
+        """
+        self._slot = vars(owner._viewed)[name]
+
+    @overload
+    def __get__(self, view: None, owner: type[Any] | None = None) -> Self: ...
+
+    @overload
+    def __get__(self, view: Any, owner: type[Any] | None = None) -> T: ...
+
+    def __get__(self, view: Any, owner: type[Any] | None = None) -> Self | T:
+        """Get the value of the field, decoding it on first access.
+
+        Args:
+            view: The view, or `None` if the field is accessed on the class.
+            owner: The view class.
+
+        Returns:
+            The value of the field, or the field itself if accessed on the class.
+        """
+        if view is None:
+            return self
+        try:
+            value: T = self._slot.__get__(view, owner)
+        except AttributeError:
+            value = self._decode(view)
+            self._slot.__set__(view, value)
+        return value
+
+    def __set__(self, view: Any, value: T) -> None:
+        """Change the value of the field.
+
+        Args:
+            view: The view.
+            value: The new value of the field.
+        """
+        self._slot.__set__(view, value)
+        view._changed = True
+
+
+class _LazyView:
+    """A view of a protobuf message, decoding each field once.
+
+    The fields are lazy fields, stored in the slots of the viewed dataclass on
+    first access. Views compare equal to the dataclasses they view when all
+    their fields are equal, and are copied and pickled as their message.
+
+    Like the viewed dataclasses, views can be changed: assigning a field stores
+    the new value in place of the decoded one, and `to_pb()` then encodes the
+    fields instead of copying the viewed message. `dataclasses.replace()` returns
+    an instance of the viewed dataclass, with all the fields decoded.
+    """
+
+    __slots__ = ()
+
+    _viewed: type[Any]
+    """The viewed dataclass."""
+
+    _message: Message
+    """The viewed protobuf message."""
+
+    _changed: bool
+    """Whether a field was assigned since the view was created."""
+
+    def __new__(cls, message: Message | None = None, /, **fields: Any) -> Any:
+        """Create a view, or an instance of the viewed dataclass from its fields.
+
+        `dataclasses.replace()` creates the new instance from all its fields,
+        so it gets an instance of the viewed dataclass.
+
+        Args:
+            message: The protobuf message to view.
+            **fields: The fields of the viewed dataclass, if no message is given.
+
+        Returns:
+            The view, or an instance of the viewed dataclass.
+        """
+        if message is None:
+            return cls._viewed(**fields)
+        return super().__new__(cls)
+
+    def __init__(self, message: Message) -> None:
+        """Initialize the view.
+
+        Args:
+            message: The protobuf message to view.
+        """
+        # The slots are declared by the view classes.
+        object.__setattr__(self, "_message", message)
+        object.__setattr__(self, "_changed", False)
+
+    def __reduce__(self) -> tuple[type[Self], tuple[Message]]:
+        """Get how to copy or pickle the view.
+
+        Returns:
+            The view class and a copy of the viewed message, with the changed
+                fields.
+        """
+        return type(self), (self.to_pb(),)
+
+    def __eq__(self, other: object) -> bool:
+        """Check if the view and another object have the same fields.
+
+        Args:
+            other: The object to compare with.
+
+        Returns:
+            Whether the other object is of the viewed type, with the same fields.
+        """
+        if not isinstance(other, self._viewed):
+            return NotImplemented
+        return all(
+            getattr(self, field.name) == getattr(other, field.name)
+            for field in dataclasses.fields(self._viewed)
+        )
+
+    __hash__ = None  # type: ignore[assignment]
+
+    def to_pb(self) -> Any:
+        """Get a copy of the viewed protobuf message, with the changed fields.
+
+        Returns:
+            A copy of the protobuf message, or the encoded fields if some were
+                changed.
+        """
+        if self._changed:
+            return self._viewed.to_pb(self)
+        message = type(self._message)()
+        message.CopyFrom(self._message)
+        return message
+
+
+class LazyOrderDetail(_LazyView, OrderDetail):
+    """An order detail decoding the fields of its protobuf message lazily.
+
+    Like `OrderDetail.from_pb()`, creating a view checks that the price and
+    quantity of non-canceled orders are specified, decoding only them.
+    """
+
+    _viewed = OrderDetail
+    __slots__ = ("_message", "_changed")
+
+    _message: electricity_trading_pb2.OrderDetail
+
+    @classmethod
+    def from_pb(cls, order_detail: electricity_trading_pb2.OrderDetail) -> Self:
+        """Create a view of a protobuf OrderDetail.
+
+        Args:
+            order_detail: OrderDetail to view.
+
+        Returns:
+            A view of the protobuf message.
+
+        Raises:
+            ValueError: If the order price and quantity are not specified for a
+                non-canceled order.
+        """
+        if order_detail.state_detail.state != OrderState.CANCELED.to_pb():
+            price = Price.from_pb(order_detail.order.price)
+            if (
+                price.amount.is_nan()
+                or price.currency == Currency.UNSPECIFIED
+                or Power.from_pb(order_detail.order.quantity).mw.is_nan()
+            ):
+                raise ValueError(
+                    "Price and quantity must be specified for a non-canceled order "
+                    f"(order ID {order_detail.order_id})."
+                )
+        return cls(order_detail)
+
+    @_LazyField
+    def order_id(self) -> int:
+        """Unique identifier of the order."""
+        return self._message.order_id
+
+    @_LazyField
+    def order(self) -> Order:
+        """The details of the order."""
+        return Order.from_pb(self._message.order)
+
+    @_LazyField
+    def state_detail(self) -> StateDetail:
+        """Details of the order's current state."""
+        return StateDetail.from_pb(self._message.state_detail)
+
+    @_LazyField
+    def open_quantity(self) -> Power:
+        """Remaining open quantity for this order."""
+        return Power.from_pb(self._message.open_quantity)
+
+    @_LazyField
+    def filled_quantity(self) -> Power:
+        """Filled quantity for this order."""
+        return Power.from_pb(self._message.filled_quantity)
+
+    @_LazyField
+    def create_time(self) -> datetime:
+        """UTC Timestamp when the order was created."""
+        return self._message.create_time.ToDatetime(tzinfo=timezone.utc)
+
+    @_LazyField
+    def modification_time(self) -> datetime:
+        """UTC Timestamp of the last update to the order."""
+        return self._message.modification_time.ToDatetime(tzinfo=timezone.utc)
+
+
+class LazyTrade(_LazyView, Trade):
+    """A trade decoding the fields of its protobuf message lazily."""
+
+    _viewed = Trade
+    __slots__ = ("_message", "_changed")
+
+    _message: electricity_trading_pb2.Trade
+
+    @classmethod
+    def from_pb(cls, trade: electricity_trading_pb2.Trade) -> Self:
+        """Create a view of a protobuf Trade.
+
+        Args:
+            trade: Trade to view.
+
+        Returns:
+            A view of the protobuf message.
+        """
+        return cls(trade)
+
+    @_LazyField
+    def id(self) -> int:
+        """ID of the trade."""
+        return self._message.id
+
+    @_LazyField
+    def order_id(self) -> int:
+        """ID of the corresponding order."""
+        return self._message.order_id
+
+    @_LazyField
+    def side(self) -> MarketSide:
+        """Indicates if the trade's order was on the Buy or Sell side of the market."""
+        return MarketSide.from_pb(self._message.side)
+
+    @_LazyField
+    def delivery_area(self) -> DeliveryArea:
+        """Delivery area of the trade."""
+        return DeliveryArea.from_pb(self._message.delivery_area)
+
+    @_LazyField
+    def delivery_period(self) -> DeliveryPeriod:
+        """The delivery period for the contract."""
+        return DeliveryPeriod.from_pb(self._message.delivery_period)
+
+    @_LazyField
+    def execution_time(self) -> datetime:
+        """UTC Timestamp of the trade's execution time."""
+        return self._message.execution_time.ToDatetime(tzinfo=timezone.utc)
+
+    @_LazyField
+    def price(self) -> Price:
+        """The price at which the trade was executed."""
+        return Price.from_pb(self._message.price)
+
+    @_LazyField
+    def quantity(self) -> Power:
+        """The executed quantity of the trade."""
+        return Power.from_pb(self._message.quantity)
+
+    @_LazyField
+    def state(self) -> TradeState:
+        """Current state of the trade."""
+        return TradeState.from_pb(self._message.state)
+
+
+class LazyPublicTrade(_LazyView, PublicTrade):
+    """A public trade decoding the fields of its protobuf message lazily."""
+
+    _viewed = PublicTrade
+    __slots__ = ("_message", "_changed")
+
+    _message: electricity_trading_pb2.PublicTrade
+
+    @classmethod
+    def from_pb(cls, public_trade: electricity_trading_pb2.PublicTrade) -> Self:
+        """Create a view of a protobuf PublicTrade.
+
+        Args:
+            public_trade: PublicTrade to view.
+
+        Returns:
+            A view of the protobuf message.
+        """
+        return cls(public_trade)
+
+    @_LazyField
+    def public_trade_id(self) -> int:
+        """ID of the order from the public order book."""
+        return self._message.id
+
+    @_LazyField
+    def buy_delivery_area(self) -> DeliveryArea:
+        """Delivery area code of the buy side."""
+        return DeliveryArea.from_pb(self._message.buy_delivery_area)
+
+    @_LazyField
+    def sell_delivery_area(self) -> DeliveryArea:
+        """Delivery area code of the sell side."""
+        return DeliveryArea.from_pb(self._message.sell_delivery_area)
+
+    @_LazyField
+    def delivery_period(self) -> DeliveryPeriod:
+        """The delivery period for the contract."""
+        return DeliveryPeriod.from_pb(self._message.delivery_period)
+
+    @_LazyField
+    def execution_time(self) -> datetime:
+        """UTC Timestamp of the trades execution time."""
+        return self._message.execution_time.ToDatetime(tzinfo=timezone.utc)
+
+    @_LazyField
+    def price(self) -> Price:
+        """The limit price at which the contract is to be traded."""
+        return Price.from_pb(self._message.price)
+
+    @_LazyField
+    def quantity(self) -> Power:
+        """The quantity of the contract being traded."""
+        return Power.from_pb(self._message.quantity)
+
+    @_LazyField
+    def state(self) -> TradeState:
+        """State of the order."""
+        return TradeState.from_pb(self._message.state)
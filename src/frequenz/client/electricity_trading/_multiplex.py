@@ -0,0 +1,572 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Sharing a server stream between many subscribers with different filters."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from datetime import datetime, timedelta, timezone
+from typing import Any, Callable, Generic, Hashable, Iterable, TypeVar
+
+from frequenz.channels import Broadcast, Receiver
+from frequenz.client.base.streaming import GrpcStreamBroadcaster
+
+from ._types import (
+    DeliveryDuration,
+    DeliveryPeriod,
+    GridpoolOrderFilter,
+    OrderDetail,
+    OrderState,
+    PublicTrade,
+    PublicTradeFilter,
+)
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+"""The type of the streamed messages."""
+
+FilterT = TypeVar("FilterT", bound=Hashable)
+"""The type of the filters of the subscribers."""
+
+
+class FilteredStream(Generic[T]):
+    """The messages of a shared stream matching the filter of a subscriber.
+
+    Like a stream broadcaster, it can be given any number of receivers. The
+    receivers are tracked with weak references, and the stream stops, like when
+    `stop()` is called, once all its receivers have been garbage collected.
+    """
+
+    def __init__(self, name: str, on_stop: Callable[[], None]) -> None:
+        """Initialize the stream.
+
+        Args:
+            name: A name to identify the stream in the logs.
+            on_stop: A function unsubscribing the stream from the shared stream.
+        """
+        self._channel: Broadcast[T] = Broadcast(name=f"FilteredStream-{name}")
+        self._sender = self._channel.new_sender()
+        self._on_stop = on_stop
+        self._receivers: weakref.WeakSet[Receiver[T]] = weakref.WeakSet()
+        self._loop = asyncio.get_running_loop()
+        self._stopping: asyncio.Task[None] | None = None
+
+    def new_receiver(
+        self, maxsize: int = 50, warn_on_overflow: bool = True
+    ) -> Receiver[T]:
+        """Create a new receiver for the stream.
+
+        Args:
+            maxsize: The maximum number of messages to buffer.
+            warn_on_overflow: Whether to log a warning when the receiver's
+                buffer is full and a message is dropped.
+
+        Returns:
+            A new receiver.
+        """
+        receiver = self._channel.new_receiver(
+            limit=maxsize, warn_on_overflow=warn_on_overflow
+        )
+        self._receivers.add(receiver)
+        weakref.finalize(receiver, self._receiver_collected)
+        return receiver
+
+    @property
+    def receivers(self) -> list[Receiver[T]]:
+        """The receivers of the stream that haven't been garbage collected."""
+        return list(self._receivers)
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the stream is still receiving messages."""
+        return not self._channel.is_closed
+
+    @property
+    def is_stopping(self) -> bool:
+        """Whether the stream is being stopped because it had no receivers left."""
+        return self._stopping is not None
+
+    async def stop(self) -> None:
+        """Unsubscribe from the shared stream and stop all the receivers."""
+        if not self.is_running:
+            return
+        self._on_stop()
+        await self._channel.close()
+
+    async def send(self, message: T) -> None:
+        """Send a message matching the filter to the receivers.
+
+        Args:
+            message: The message to send.
+        """
+        await self._sender.send(message)
+
+    def _receiver_collected(self) -> None:
+        """Stop the stream later if the last receiver was garbage collected.
+
+        Garbage collection can happen in the middle of routing a message, so the
+        check is deferred to the event loop.
+        """
+        if not self._loop.is_closed():
+            self._loop.call_soon_threadsafe(self._stop_if_unused)
+
+    def _stop_if_unused(self) -> None:
+        """Stop the stream in the background if it has no receivers left."""
+        if self._receivers or not self.is_running or self._stopping is not None:
+            return
+        self._stopping = self._loop.create_task(self.stop())
+
+
+class StreamMultiplexer(
+    Generic[FilterT, T]
+):  # pylint: disable=too-many-instance-attributes
+    """Route the messages of a single server stream to many filtered streams.
+
+    Subscribers are indexed by the keys of their filters, and every message is
+    only checked against the subscribers indexed under one of its keys, so the
+    cost of routing a message doesn't grow with the number of subscribers that
+    can't match it. Subscribers with the same filter share a filtered stream.
+
+    The shared stream is only received from while there are filtered streams:
+    a receiver is created when the first one subscribes, and released when the
+    last one stops.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        new_source: Callable[[], Receiver[T]],
+        *,
+        filter_keys: Callable[[FilterT], Iterable[Hashable]],
+        message_keys: Callable[[T], Iterable[Hashable]],
+        matches: Callable[[FilterT, T], bool],
+        on_idle: Callable[[], None] | None = None,
+    ) -> None:
+        """Initialize the multiplexer.
+
+        Args:
+            name: A name to identify the multiplexer in the logs.
+            new_source: A function creating a new receiver of the shared stream.
+            filter_keys: A function getting the index keys of a filter. A
+                message can only match a filter if they have a key in common.
+            message_keys: A function getting the index keys of a message.
+            matches: A function checking if a message matches a filter, called
+                only for the filters sharing a key with the message.
+            on_idle: A function called when the last filtered stream is stopped,
+                if any.
+        """
+        self._name = name
+        self._new_source = new_source
+        self._filter_keys = filter_keys
+        self._message_keys = message_keys
+        self._matches = matches
+        self._on_idle = on_idle
+        self._streams: dict[FilterT, FilteredStream[T]] = {}
+        self._index: dict[Hashable, set[FilterT]] = {}
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_running(self) -> bool:
+        """Whether the shared stream is being routed."""
+        return self._task is not None and not self._task.done()
+
+    @property
+    def subscribers(self) -> int:
+        """The number of filtered streams fed by the multiplexer."""
+        return len(self._streams)
+
+    def subscribe(self, stream_filter: FilterT) -> FilteredStream[T]:
+        """Get the filtered stream of a filter, creating it if needed.
+
+        Args:
+            stream_filter: The filter of the messages to receive.
+
+        Returns:
+            The stream of the messages matching the filter.
+        """
+        existing = self._streams.get(stream_filter)
+        # A stream being stopped is replaced, as its new receivers would be
+        # stopped too.
+        if existing is not None and existing.is_running and not existing.is_stopping:
+            return existing
+        stream: FilteredStream[T] = FilteredStream(
+            f"{self._name}-{stream_filter}",
+            lambda: self._unsubscribe(stream_filter, stream),
+        )
+        self._streams[stream_filter] = stream
+        for key in self._filter_keys(stream_filter):
+            self._index.setdefault(key, set()).add(stream_filter)
+        if not self.is_running:
+            self._task = asyncio.create_task(self._run(self._new_source()))
+        return stream
+
+    async def stop(self) -> None:
+        """Stop routing messages and stop all the filtered streams."""
+        task = self._release_source()
+        if task is not None:
+            try:
+                await task
+            except asyncio.CancelledError:
+                pass
+        await self._close_streams()
+
+    def _unsubscribe(self, stream_filter: FilterT, stream: FilteredStream[T]) -> None:
+        """Remove a filtered stream from the index, unless it was replaced.
+
+        The receiver of the shared stream is released with the last stream.
+
+        Args:
+            stream_filter: The filter of the stream.
+            stream: The stream to remove.
+        """
+        if self._streams.get(stream_filter) is not stream:
+            return
+        del self._streams[stream_filter]
+        for key in self._filter_keys(stream_filter):
+            filters = self._index.get(key)
+            if filters is None:
+                continue
+            filters.discard(stream_filter)
+            if not filters:
+                del self._index[key]
+        if self._streams:
+            return
+        self._release_source()
+        if self._on_idle is not None:
+            self._on_idle()
+
+    def _release_source(self) -> asyncio.Task[None] | None:
+        """Stop receiving from the shared stream.
+
+        Returns:
+            The cancelled routing task, if it was running and isn't the
+                current task.
+        """
+        task, self._task = self._task, None
+        if task is None or task is asyncio.current_task():
+            return None
+        task.cancel()
+        return task
+
+    async def _run(self, source: Receiver[T]) -> None:
+        """Route the messages of the shared stream until it ends.
+
+        Args:
+            source: The receiver of the shared stream.
+        """
+        async for message in source:
+            candidates: set[FilterT] = set()
+            for key in self._message_keys(message):
+                candidates.update(self._index.get(key, ()))
+            for stream_filter in candidates:
+                stream = self._streams.get(stream_filter)
+                # Streams can be stopped while sending to others.
+                if stream is not None and self._matches(stream_filter, message):
+                    await stream.send(message)
+        _logger.info("%s: shared stream ended", self._name)
+        if self._task is asyncio.current_task():
+            self._task = None
+        await self._close_streams()
+
+    async def _close_streams(self) -> None:
+        """Stop all the filtered streams."""
+        streams = list(self._streams.values())
+        for stream in streams:
+            await stream.stop()
+
+
+def order_filter_keys(order_filter: GridpoolOrderFilter) -> list[Hashable]:
+    """Get the index keys of a gridpool order filter.
+
+    Args:
+        order_filter: The filter to index.
+
+    Returns:
+        A `(delivery_period, delivery_area, state)` key for each state of the
+            filter, with `None` for the fields the filter doesn't restrict.
+    """
+    states: list[OrderState | None] = (
+        list(order_filter.order_states) if order_filter.order_states else [None]
+    )
+    return [
+        (order_filter.delivery_period, order_filter.delivery_area, state)
+        for state in states
+    ]
+
+
+def order_keys(order: OrderDetail) -> list[Hashable]:
+    """Get the index keys of a gridpool order.
+
+    Args:
+        order: The order to route.
+
+    Returns:
+        The keys of all the filters that can match the order, from the most to
+            the least specific.
+    """
+    return [
+        (period, area, state)
+        for period in (order.order.delivery_period, None)
+        for area in (order.order.delivery_area, None)
+        for state in (order.state_detail.state, None)
+    ]
+
+
+def order_matches(order_filter: GridpoolOrderFilter, order: OrderDetail) -> bool:
+    """Check the fields of a gridpool order filter that are not indexed.
+
+    Args:
+        order_filter: The filter of a subscriber.
+        order: An order sharing an index key with the filter.
+
+    Returns:
+        Whether the order matches the filter.
+    """
+    return (order_filter.side is None or order_filter.side == order.order.side) and (
+        order_filter.tag is None or order_filter.tag == order.order.tag
+    )
+
+
+_DURATIONS = {
+    DeliveryDuration.MINUTES_5: timedelta(minutes=5),
+    DeliveryDuration.MINUTES_15: timedelta(minutes=15),
+    DeliveryDuration.MINUTES_30: timedelta(minutes=30),
+    DeliveryDuration.MINUTES_60: timedelta(minutes=60),
+}
+"""The length of each delivery duration."""
+
+
+def public_trade_filter_keys(trade_filter: PublicTradeFilter) -> list[Hashable]:
+    """Get the index keys of a public trade filter.
+
+    Args:
+        trade_filter: The filter to index.
+
+    Returns:
+        The `(delivery_period, buy_delivery_area, sell_delivery_area)` key of the
+            filter, with `None` for the fields the filter doesn't restrict.
+    """
+    return [
+        (
+            trade_filter.delivery_period,
+            trade_filter.buy_delivery_area,
+            trade_filter.sell_delivery_area,
+        )
+    ]
+
+
+def public_trade_keys(trade: PublicTrade) -> list[Hashable]:
+    """Get the index keys of a public trade.
+
+    Args:
+        trade: The trade to route.
+
+    Returns:
+        The keys of all the filters that can match the trade, from the most to
+            the least specific.
+    """
+    return [
+        (period, buy_area, sell_area)
+        for period in (trade.delivery_period, None)
+        for buy_area in (trade.buy_delivery_area, None)
+        for sell_area in (trade.sell_delivery_area, None)
+    ]
+
+
+def public_trade_matches(trade_filter: PublicTradeFilter, trade: PublicTrade) -> bool:
+    """Check the fields of a public trade filter that are not indexed.
+
+    Args:
+        trade_filter: The filter of a subscriber.
+        trade: A trade sharing an index key with the filter.
+
+    Returns:
+        Whether the trade matches the filter.
+    """
+    return not trade_filter.states or trade.state in trade_filter.states
+
+
+def _covers(upstream: PublicTradeFilter, trade_filter: PublicTradeFilter) -> bool:
+    """Check if all the trades matching a filter are streamed by an upstream.
+
+    Args:
+        upstream: The filter of the upstream stream, without states.
+        trade_filter: The filter of a subscriber.
+
+    Returns:
+        Whether the upstream streams all the trades matching the filter.
+    """
+    return all(
+        wanted is None or wanted == requested
+        for wanted, requested in (
+            (upstream.delivery_period, trade_filter.delivery_period),
+            (upstream.buy_delivery_area, trade_filter.buy_delivery_area),
+            (upstream.sell_delivery_area, trade_filter.sell_delivery_area),
+        )
+    )
+
+
+class PublicTradesMultiplexer:
+    """Share the public trade streams between subscribers with different filters.
+
+    Subscribers are served by an existing upstream stream covering their filter
+    when there is one, and otherwise by a new upstream stream filtered by their
+    delivery period and delivery areas. The trade states are always filtered
+    locally, so subscribers differing only in states share a stream. Upstream
+    streams are stopped when their last subscriber stops, or when their delivery
+    period ends, stopping their subscribers too.
+
+    Upstream streams are not merged when a broader one is opened later, as
+    switching running subscribers to another stream could lose the trades
+    executed while the new stream starts.
+    """
+
+    def __init__(
+        self,
+        open_stream: Callable[
+            [PublicTradeFilter], GrpcStreamBroadcaster[Any, PublicTrade]
+        ],
+    ) -> None:
+        """Initialize the multiplexer.
+
+        Args:
+            open_stream: A function opening a new server stream for a filter. The
+                multiplexer owns the returned stream and stops it when unused.
+        """
+        self._open_stream = open_stream
+        self._upstreams: dict[
+            PublicTradeFilter,
+            tuple[
+                GrpcStreamBroadcaster[Any, PublicTrade],
+                StreamMultiplexer[PublicTradeFilter, PublicTrade],
+            ],
+        ] = {}
+        self._expirations: dict[PublicTradeFilter, asyncio.TimerHandle] = {}
+        self._stopping: set[asyncio.Task[None]] = set()
+
+    @property
+    def upstreams(self) -> list[PublicTradeFilter]:
+        """The filters of the upstream streams currently open."""
+        return list(self._upstreams)
+
+    def subscribe(self, trade_filter: PublicTradeFilter) -> FilteredStream[PublicTrade]:
+        """Get a stream of the public trades matching a filter.
+
+        Args:
+            trade_filter: The filter of the trades to receive.
+
+        Returns:
+            The stream of the trades matching the filter. Stopping it
+                unsubscribes from the upstream stream.
+        """
+        for upstream, (stream, multiplexer) in list(self._upstreams.items()):
+            if not multiplexer.is_running or not stream.is_running:
+                self._drop(upstream)
+        covering = [
+            upstream for upstream in self._upstreams if _covers(upstream, trade_filter)
+        ]
+        if covering:
+            # Prefer the narrowest stream, which routes the fewest trades.
+            upstream = max(covering, key=_restrictions)
+        else:
+            upstream = self._open(trade_filter)
+        return self._upstreams[upstream][1].subscribe(trade_filter)
+
+    async def stop(self) -> None:
+        """Stop all the upstream streams and their subscribers."""
+        for upstream in list(self._upstreams):
+            self._drop(upstream)
+        await asyncio.gather(*self._stopping)
+
+    def _open(self, trade_filter: PublicTradeFilter) -> PublicTradeFilter:
+        """Open a new upstream stream for a subscriber.
+
+        Args:
+            trade_filter: The filter of the subscriber.
+
+        Returns:
+            The filter of the new upstream stream.
+        """
+        upstream = PublicTradeFilter(
+            delivery_period=trade_filter.delivery_period,
+            buy_delivery_area=trade_filter.buy_delivery_area,
+            sell_delivery_area=trade_filter.sell_delivery_area,
+        )
+        stream = self._open_stream(upstream)
+        self._upstreams[upstream] = (
+            stream,
+            StreamMultiplexer(
+                f"public-trades-{upstream}",
+                stream.new_receiver,
+                filter_keys=public_trade_filter_keys,
+                message_keys=public_trade_keys,
+                matches=public_trade_matches,
+                on_idle=lambda: self._drop(upstream),
+            ),
+        )
+        if upstream.delivery_period is not None:
+            self._expire_after(upstream, upstream.delivery_period)
+        return upstream
+
+    def _expire_after(
+        self, upstream: PublicTradeFilter, period: DeliveryPeriod
+    ) -> None:
+        """Drop an upstream stream once its delivery period has ended.
+
+        Args:
+            upstream: The filter of the upstream stream.
+            period: The delivery period of the upstream stream.
+        """
+        duration = _DURATIONS.get(period.duration)
+        if duration is None:
+            return
+        remaining = period.start + duration - datetime.now(timezone.utc)
+        self._expirations[upstream] = asyncio.get_running_loop().call_later(
+            max(remaining.total_seconds(), 0.0), self._drop, upstream
+        )
+
+    def _drop(self, upstream: PublicTradeFilter) -> None:
+        """Stop an upstream stream and its subscribers in the background.
+
+        Args:
+            upstream: The filter of the upstream stream.
+        """
+        entry = self._upstreams.pop(upstream, None)
+        expiration = self._expirations.pop(upstream, None)
+        if expiration is not None:
+            expiration.cancel()
+        if entry is None:
+            return
+        stream, multiplexer = entry
+        _logger.debug("Stopping unused public trades stream %s", upstream)
+
+        async def stop() -> None:
+            await multiplexer.stop()
+            await stream.stop()
+
+        task = asyncio.create_task(stop())
+        self._stopping.add(task)
+        task.add_done_callback(self._stopping.discard)
+
+
+def _restrictions(trade_filter: PublicTradeFilter) -> int:
+    """Count the fields restricting the trades streamed by an upstream.
+
+    Args:
+        trade_filter: The filter of the upstream stream.
+
+    Returns:
+        The number of fields of the filter that are set.
+    """
+    return sum(
+        field is not None
+        for field in (
+            trade_filter.delivery_period,
+            trade_filter.buy_delivery_area,
+            trade_filter.sell_delivery_area,
+        )
+    )
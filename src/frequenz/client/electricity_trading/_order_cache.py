@@ -0,0 +1,214 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""A local, indexed copy of the orders of a gridpool."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Hashable, Iterable
+
+from ._snapshot import DEFAULT_BUFFER_SIZE, SnapshotFollower
+from ._types import DeliveryArea, DeliveryPeriod, MarketSide, OrderDetail, OrderState
+
+if TYPE_CHECKING:
+    from ._client import Client
+
+_FINAL_STATES = frozenset({OrderState.CANCELED, OrderState.FILLED, OrderState.EXPIRED})
+"""The states of the orders that don't change anymore."""
+
+
+class OrderCache:  # pylint: disable=too-many-instance-attributes
+    """The orders of a gridpool, kept up to date from the orders stream.
+
+    The cache is seeded by listing the orders of the gridpool, and then applies
+    the updates of a resumable orders stream, so the updates missed while the
+    stream was reconnecting are listed and applied too. The orders are indexed
+    by state, delivery period, delivery area, side and tag, so querying them
+    doesn't need any request to the server.
+
+    Orders in a final state (canceled, filled or expired) are dropped, unless
+    they are explicitly kept, so the cache doesn't grow with the history of the
+    gridpool.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        gridpool_id: int,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+        keep_final_orders: bool = False,
+    ) -> None:
+        """Initialize the cache.
+
+        Args:
+            client: The client to list and stream the orders with.
+            gridpool_id: The ID of the gridpool of the orders.
+            buffer_size: The maximum number of updates buffered while listing
+                the orders.
+            keep_final_orders: Whether to keep the orders in a final state.
+        """
+        self._gridpool_id = gridpool_id
+        self._keep_final_orders = keep_final_orders
+        self._orders: dict[int, OrderDetail] = {}
+        self._by_state: dict[Hashable, set[int]] = {}
+        self._by_period: dict[Hashable, set[int]] = {}
+        self._by_area: dict[Hashable, set[int]] = {}
+        self._by_side: dict[Hashable, set[int]] = {}
+        self._by_tag: dict[Hashable, set[int]] = {}
+        self._follower = SnapshotFollower(
+            f"orders of gridpool {gridpool_id}",
+            lambda: client.snapshot_and_stream_gridpool_orders(
+                gridpool_id, resumable=True, buffer_size=buffer_size
+            ),
+            self.apply,
+        )
+
+    def __len__(self) -> int:
+        """Get the number of cached orders.
+
+        Returns:
+            The number of cached orders.
+        """
+        return len(self._orders)
+
+    @property
+    def gridpool_id(self) -> int:
+        """The ID of the gridpool of the orders."""
+        return self._gridpool_id
+
+    @property
+    def is_synced(self) -> bool:
+        """Whether the orders were listed and the cache follows their updates."""
+        return self._follower.is_synced
+
+    async def start(self) -> None:
+        """Start following the orders, waiting until they are listed.
+
+        If the orders stream ends before the orders are listed, a `RuntimeError`
+        is raised.
+        """
+        await self._follower.start()
+
+    async def stop(self) -> None:
+        """Stop following the orders, keeping the cached ones."""
+        await self._follower.stop()
+
+    def order(self, order_id: int) -> OrderDetail | None:
+        """Get a cached order.
+
+        Args:
+            order_id: The ID of the order.
+
+        Returns:
+            The order, if it is cached.
+        """
+        return self._orders.get(order_id)
+
+    def orders(
+        # pylint: disable=too-many-arguments
+        self,
+        *,
+        order_states: list[OrderState] | None = None,
+        side: MarketSide | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+        delivery_area: DeliveryArea | None = None,
+        tag: str | None = None,
+    ) -> list[OrderDetail]:
+        """Get the cached orders matching all the given filters.
+
+        Args:
+            order_states: The order states to filter for.
+            side: The market side to filter for.
+            delivery_period: The delivery period to filter for.
+            delivery_area: The delivery area to filter for.
+            tag: The tag to filter for.
+
+        Returns:
+            The matching orders, by order ID.
+        """
+        candidates: list[set[int]] = []
+        if order_states is not None:
+            candidates.append(
+                set().union(*(self._by_state.get(state, ()) for state in order_states))
+            )
+        if side is not None:
+            candidates.append(self._by_side.get(side, set()))
+        if delivery_period is not None:
+            candidates.append(self._by_period.get(delivery_period, set()))
+        if delivery_area is not None:
+            candidates.append(self._by_area.get(delivery_area, set()))
+        if tag is not None:
+            candidates.append(self._by_tag.get(tag, set()))
+
+        order_ids: Iterable[int] = self._orders.keys()
+        if candidates:
+            candidates.sort(key=len)
+            order_ids = candidates[0].intersection(*candidates[1:])
+        return [self._orders[order_id] for order_id in sorted(order_ids)]
+
+    def apply(self, order: OrderDetail) -> bool:
+        """Add, update or drop an order, unless a more recent version is cached.
+
+        Orders in a final state are dropped, unless final orders are kept. This
+        is also useful to apply the orders returned when creating, updating or
+        canceling them, before their update is streamed.
+
+        Args:
+            order: The order to apply.
+
+        Returns:
+            Whether the order was added, updated or dropped.
+        """
+        cached = self._orders.get(order.order_id)
+        if cached is not None:
+            if order.modification_time < cached.modification_time:
+                return False
+            self._unindex(cached)
+        if not self._keep_final_orders and order.state_detail.state in _FINAL_STATES:
+            return self._orders.pop(order.order_id, None) is not None
+        self._orders[order.order_id] = order
+        self._index(order)
+        return True
+
+    def _index(self, order: OrderDetail) -> None:
+        """Add an order to the indexes.
+
+        Args:
+            order: The order to add.
+        """
+        for index, value in self._index_keys(order):
+            index.setdefault(value, set()).add(order.order_id)
+
+    def _unindex(self, order: OrderDetail) -> None:
+        """Remove an order from the indexes.
+
+        Args:
+            order: The order to remove.
+        """
+        for index, value in self._index_keys(order):
+            order_ids = index.get(value)
+            if order_ids is None:
+                continue
+            order_ids.discard(order.order_id)
+            if not order_ids:
+                del index[value]
+
+    def _index_keys(
+        self, order: OrderDetail
+    ) -> list[tuple[dict[Hashable, set[int]], Hashable]]:
+        """Get the indexes of an order and its key in each of them.
+
+        Args:
+            order: The order to index.
+
+        Returns:
+            The indexes and the keys of the order.
+        """
+        return [
+            (self._by_state, order.state_detail.state),
+            (self._by_period, order.order.delivery_period),
+            (self._by_area, order.order.delivery_area),
+            (self._by_side, order.order.side),
+            (self._by_tag, order.order.tag),
+        ]
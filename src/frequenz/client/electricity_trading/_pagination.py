@@ -0,0 +1,152 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Helpers to iterate over paginated list responses."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from typing import AsyncGenerator, AsyncIterator, Awaitable, Callable, Protocol, TypeVar
+
+from frequenz.api.common.v1.pagination.pagination_info_pb2 import PaginationInfo
+from frequenz.api.common.v1.pagination.pagination_params_pb2 import PaginationParams
+
+_logger = logging.getLogger(__name__)
+
+
+class PaginatedRequest(Protocol):
+    """A list request message carrying pagination parameters."""
+
+    @property
+    def pagination_params(self) -> PaginationParams:
+        """The pagination parameters of the request."""
+
+
+class PaginatedResponse(Protocol):
+    """A list response message carrying pagination information."""
+
+    @property
+    def pagination_info(self) -> PaginationInfo:
+        """The pagination information of the response."""
+
+
+RequestT = TypeVar("RequestT", bound=PaginatedRequest)
+"""The type of the paginated request."""
+
+ResponseT = TypeVar("ResponseT", bound=PaginatedResponse)
+"""The type of the paginated response."""
+
+
+async def iter_pages(
+    fetch_page: Callable[[RequestT], Awaitable[ResponseT]],
+    request: RequestT,
+    *,
+    prefetch: int = 0,
+) -> AsyncIterator[ResponseT]:
+    """Iterate over all the pages of a paginated list call.
+
+    The request is updated in place with the `next_page_token` of every received
+    page until the server reports no more pages.
+
+    Args:
+        fetch_page: The function fetching a single page for a request.
+        request: The request for the first page.
+        prefetch: The maximum number of pages to fetch ahead of the consumer. If
+            `0`, the next page is only requested once the current one has been
+            consumed.
+
+    Yields:
+        The responses for each page, in order.
+
+    Raises:
+        ValueError: If `prefetch` is negative.
+    """
+    if prefetch < 0:
+        raise ValueError("prefetch must be a non-negative integer.")
+
+    if prefetch == 0:
+        has_next_page = True
+        while has_next_page:
+            response = await fetch_page(request)
+            yield response
+            has_next_page = _advance(request, response)
+    else:
+        # Closed right away when the consumer stops, to stop prefetching.
+        async with contextlib.aclosing(
+            _iter_prefetched_pages(fetch_page, request, prefetch)
+        ) as pages:
+            async for response in pages:
+                yield response
+
+
+async def _iter_prefetched_pages(
+    fetch_page: Callable[[RequestT], Awaitable[ResponseT]],
+    request: RequestT,
+    prefetch: int,
+) -> AsyncGenerator[ResponseT, None]:
+    """Iterate over all the pages, fetching them in a background task.
+
+    A page is only requested once fewer than `prefetch` pages are fetched, or
+    being fetched, without having been taken by the consumer yet. An error
+    raised while fetching a page is raised once all the pages fetched before it
+    have been consumed. If the consumer stops before reaching that page, the
+    error is only logged.
+
+    Args:
+        fetch_page: The function fetching a single page for a request.
+        request: The request for the first page.
+        prefetch: The maximum number of pages to fetch ahead of the consumer.
+
+    Yields:
+        The responses for each page, in order.
+    """
+    ahead = asyncio.Semaphore(prefetch)
+    queue: asyncio.Queue[ResponseT | None] = asyncio.Queue()
+
+    async def fetch_all() -> None:
+        try:
+            has_next_page = True
+            while has_next_page:
+                await ahead.acquire()
+                response = await fetch_page(request)
+                queue.put_nowait(response)
+                has_next_page = _advance(request, response)
+        finally:
+            queue.put_nowait(None)
+
+    task = asyncio.create_task(fetch_all())
+    reached_end = False
+    try:
+        while (item := await queue.get()) is not None:
+            ahead.release()
+            yield item
+        reached_end = True
+        # Raises the error of the fetching task, if any.
+        await task
+    finally:
+        task.cancel()
+        await asyncio.wait({task})
+        if not reached_end and not task.cancelled() and task.exception() is not None:
+            _logger.debug(
+                "Ignoring the error of a page fetched ahead but not consumed",
+                exc_info=task.exception(),
+            )
+
+
+def _advance(request: PaginatedRequest, response: PaginatedResponse) -> bool:
+    """Point the request to the page following the given response.
+
+    Args:
+        request: The request to update.
+        response: The response of the last fetched page.
+
+    Returns:
+        Whether there is a next page to fetch.
+    """
+    next_page_token = response.pagination_info.next_page_token
+    if not next_page_token:
+        return False
+    request.pagination_params.CopyFrom(PaginationParams(page_token=next_page_token))
+    return True
@@ -0,0 +1,304 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Net positions of a gridpool, updated incrementally from its trades."""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from decimal import Decimal
+from typing import TYPE_CHECKING
+
+from ._snapshot import DEFAULT_BUFFER_SIZE, SnapshotFollower
+from ._types import (
+    Currency,
+    DeliveryArea,
+    DeliveryPeriod,
+    MarketSide,
+    Power,
+    Price,
+    Trade,
+    TradeState,
+)
+
+if TYPE_CHECKING:
+    from ._client import Client
+
+_UNCOUNTED_STATES = frozenset(
+    {TradeState.UNSPECIFIED, TradeState.CANCELED, TradeState.RECALL}
+)
+"""The states of the trades not counted in the positions."""
+
+_FINAL_STATES = frozenset({TradeState.CANCELED, TradeState.RECALL})
+"""The states after which the updates of a trade are ignored."""
+
+
+@dataclass(frozen=True)
+class Position:  # pylint: disable=too-many-instance-attributes
+    """The traded volumes of a delivery area and period."""
+
+    delivery_area: DeliveryArea
+    """The delivery area of the trades."""
+
+    delivery_period: DeliveryPeriod
+    """The delivery period of the trades."""
+
+    buy_volume: Power
+    """The total quantity bought."""
+
+    sell_volume: Power
+    """The total quantity sold."""
+
+    buy_vwap: Price | None
+    """The volume-weighted average price of the quantity bought, if any."""
+
+    sell_vwap: Price | None
+    """The volume-weighted average price of the quantity sold, if any."""
+
+    vwap: Price | None
+    """The volume-weighted average price of all the quantity traded, if any."""
+
+    trades: int
+    """The number of trades counted in the position."""
+
+    @property
+    def net_position(self) -> Power:
+        """The quantity bought minus the quantity sold."""
+        return Power(mw=self.buy_volume.mw - self.sell_volume.mw)
+
+
+@dataclass
+class _Totals:
+    """The running totals of the trades of a delivery area and period."""
+
+    buy_mw: Decimal = Decimal(0)
+    """The total quantity bought, in MW."""
+
+    sell_mw: Decimal = Decimal(0)
+    """The total quantity sold, in MW."""
+
+    buy_value: Decimal = Decimal(0)
+    """The sum of the price times the quantity of the trades bought."""
+
+    sell_value: Decimal = Decimal(0)
+    """The sum of the price times the quantity of the trades sold."""
+
+    currency: Currency | None = None
+    """The currency of the prices, once a trade has been counted."""
+
+    trades: int = 0
+    """The number of trades counted."""
+
+    def add(self, trade: Trade, sign: int) -> None:
+        """Add or remove a trade.
+
+        Args:
+            trade: The trade to add or remove.
+            sign: `1` to add the trade, `-1` to remove it.
+        """
+        self.currency = trade.price.currency
+        quantity = sign * trade.quantity.mw
+        if trade.side == MarketSide.BUY:
+            self.buy_mw += quantity
+            self.buy_value += quantity * trade.price.amount
+        else:
+            self.sell_mw += quantity
+            self.sell_value += quantity * trade.price.amount
+        self.trades += sign
+        if self.trades == 0:
+            self.currency = None
+
+    def vwap(self, value: Decimal, volume: Decimal) -> Price | None:
+        """Get a volume-weighted average price.
+
+        Args:
+            value: The sum of the price times the quantity of the trades.
+            volume: The total quantity of the trades.
+
+        Returns:
+            The average price, if the volume isn't zero.
+        """
+        if not volume or self.currency is None:
+            return None
+        return Price(amount=value / volume, currency=self.currency)
+
+
+class PositionLedger:
+    """The net positions of a gridpool, per delivery area and period.
+
+    The ledger is seeded by listing the trades of the gridpool, and then applies
+    the updates of the trades stream, in constant time per trade. Trades are
+    tracked by ID, so applying a trade again has no effect, and changes of
+    state are applied by removing the previous state of the trade from its
+    position. Canceled and recalled trades are not counted, and the updates of
+    a trade received after it was canceled or recalled are ignored. Listed or
+    streamed trades that can't be applied, like trades in another currency than
+    the other trades of their position, are logged and skipped.
+    """
+
+    def __init__(
+        self,
+        client: Client,
+        gridpool_id: int,
+        *,
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Initialize the ledger.
+
+        Args:
+            client: The client to list and stream the trades with.
+            gridpool_id: The ID of the gridpool of the trades.
+            buffer_size: The maximum number of updates buffered while listing
+                the trades.
+        """
+        self._gridpool_id = gridpool_id
+        self._trades: dict[int, Trade] = {}
+        self._totals: dict[tuple[DeliveryArea, DeliveryPeriod], _Totals] = {}
+        self._follower = SnapshotFollower(
+            f"trades of gridpool {gridpool_id}",
+            lambda: client.snapshot_and_stream_gridpool_trades(
+                gridpool_id, buffer_size=buffer_size
+            ),
+            self.apply,
+        )
+
+    def __len__(self) -> int:
+        """Get the number of trades applied.
+
+        Returns:
+            The number of trades applied, including the uncounted ones.
+        """
+        return len(self._trades)
+
+    @property
+    def gridpool_id(self) -> int:
+        """The ID of the gridpool of the trades."""
+        return self._gridpool_id
+
+    @property
+    def is_synced(self) -> bool:
+        """Whether the trades were listed and the ledger follows their updates."""
+        return self._follower.is_synced
+
+    async def start(self) -> None:
+        """Start following the trades, waiting until they are listed.
+
+        If the trades stream ends before the trades are listed, a `RuntimeError`
+        is raised.
+        """
+        await self._follower.start()
+
+    async def stop(self) -> None:
+        """Stop following the trades, keeping the positions."""
+        await self._follower.stop()
+
+    def position(
+        self, delivery_area: DeliveryArea, delivery_period: DeliveryPeriod
+    ) -> Position:
+        """Get the position of a delivery area and period.
+
+        Args:
+            delivery_area: The delivery area.
+            delivery_period: The delivery period.
+
+        Returns:
+            The position, with no volume if no trades were counted.
+        """
+        totals = self._totals.get((delivery_area, delivery_period), _Totals())
+        return self._position(delivery_area, delivery_period, totals)
+
+    def positions(
+        self,
+        *,
+        delivery_area: DeliveryArea | None = None,
+        delivery_period: DeliveryPeriod | None = None,
+    ) -> list[Position]:
+        """Get the positions with counted trades, optionally filtered.
+
+        Args:
+            delivery_area: The delivery area to filter for.
+            delivery_period: The delivery period to filter for.
+
+        Returns:
+            The matching positions, by delivery period start.
+        """
+        positions = [
+            self._position(area, period, totals)
+            for (area, period), totals in self._totals.items()
+            if (delivery_area is None or area == delivery_area)
+            and (delivery_period is None or period == delivery_period)
+        ]
+        positions.sort(key=lambda position: position.delivery_period.start)
+        return positions
+
+    def apply(self, trade: Trade) -> bool:
+        """Add a trade or update its state.
+
+        Args:
+            trade: The trade to apply.
+
+        Returns:
+            Whether the trade was added or updated.
+
+        Raises:
+            ValueError: If the currency of the trade differs from the one of the
+                other trades of its delivery area and period.
+        """
+        previous = self._trades.get(trade.id)
+        if previous is not None and (
+            previous == trade or previous.state in _FINAL_STATES
+        ):
+            return False
+        if trade.state not in _UNCOUNTED_STATES:
+            totals = self._totals.get((trade.delivery_area, trade.delivery_period))
+            if totals is not None and totals.currency != trade.price.currency:
+                raise ValueError(
+                    f"Trade {trade.id} is in {trade.price.currency}, but the "
+                    f"position of its delivery area and period is in "
+                    f"{totals.currency}."
+                )
+            self._count(trade, 1)
+        if previous is not None and previous.state not in _UNCOUNTED_STATES:
+            self._count(previous, -1)
+        self._trades[trade.id] = trade
+        return True
+
+    def _count(self, trade: Trade, sign: int) -> None:
+        """Add a trade to its position or remove it.
+
+        Args:
+            trade: The trade to count.
+            sign: `1` to add the trade, `-1` to remove it.
+        """
+        key = (trade.delivery_area, trade.delivery_period)
+        totals = self._totals.setdefault(key, _Totals())
+        totals.add(trade, sign)
+        if totals.trades == 0:
+            del self._totals[key]
+
+    @staticmethod
+    def _position(
+        delivery_area: DeliveryArea, delivery_period: DeliveryPeriod, totals: _Totals
+    ) -> Position:
+        """Create a position from its running totals.
+
+        Args:
+            delivery_area: The delivery area.
+            delivery_period: The delivery period.
+            totals: The running totals of the trades.
+
+        Returns:
+            The position.
+        """
+        return Position(
+            delivery_area=delivery_area,
+            delivery_period=delivery_period,
+            buy_volume=Power(mw=totals.buy_mw),
+            sell_volume=Power(mw=totals.sell_mw),
+            buy_vwap=totals.vwap(totals.buy_value, totals.buy_mw),
+            sell_vwap=totals.vwap(totals.sell_value, totals.sell_mw),
+            vwap=totals.vwap(
+                totals.buy_value + totals.sell_value, totals.buy_mw + totals.sell_mw
+            ),
+            trades=totals.trades,
+        )
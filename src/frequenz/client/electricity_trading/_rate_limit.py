@@ -0,0 +1,135 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Client-side rate limiting of requests."""
+
+from __future__ import annotations
+
+import asyncio
+from dataclasses import dataclass
+from datetime import timedelta
+
+
+@dataclass(frozen=True)
+class RateLimit:
+    """A token-bucket rate limit."""
+
+    rate: float
+    """The number of requests per second allowed in the long run."""
+
+    burst: int = 1
+    """The number of requests that can be sent at once after an idle period."""
+
+    def __post_init__(self) -> None:
+        """Validate the rate limit.
+
+        Raises:
+            ValueError: If the rate or the burst size are not positive.
+        """
+        if self.rate <= 0:
+            raise ValueError("The rate must be positive.")
+        if self.burst < 1:
+            raise ValueError("The burst size must be at least 1.")
+
+
+@dataclass(frozen=True)
+class RateLimits:
+    """Rate limits for the different kinds of requests sent by the client."""
+
+    order_entry: RateLimit | None = None
+    """Rate limit for creating, updating and cancelling orders, if any."""
+
+    reads: RateLimit | None = None
+    """Rate limit for getting and listing orders and trades, if any."""
+
+
+@dataclass(frozen=True)
+class RateLimiterStats:
+    """Statistics about the requests delayed by a rate limiter."""
+
+    requests: int
+    """The number of requests that went through the rate limiter."""
+
+    delayed_requests: int
+    """The number of requests that had to wait for a token."""
+
+    total_delay: timedelta
+    """The total time requests spent waiting for a token."""
+
+    max_delay: timedelta
+    """The longest time a single request waited for a token."""
+
+    @property
+    def average_delay(self) -> timedelta:
+        """The average time a request waited for a token.
+
+        Returns:
+            The average delay over all the requests, including the ones that
+                didn't wait.
+        """
+        if self.requests == 0:
+            return timedelta()
+        return self.total_delay / self.requests
+
+
+class TokenBucket:
+    """A token bucket queueing requests until they are allowed to be sent.
+
+    Requests are served in the order they arrive: every request reserves the next
+    token as soon as it calls `acquire()` and then waits until the token is due.
+    """
+
+    def __init__(self, limit: RateLimit) -> None:
+        """Initialize the bucket, full of tokens.
+
+        Args:
+            limit: The rate limit to enforce.
+        """
+        self._limit = limit
+        self._tokens: float = limit.burst
+        self._updated_at: float | None = None
+        self._requests = 0
+        self._delayed_requests = 0
+        self._total_delay = 0.0
+        self._max_delay = 0.0
+
+    @property
+    def limit(self) -> RateLimit:
+        """The rate limit enforced by this bucket."""
+        return self._limit
+
+    @property
+    def stats(self) -> RateLimiterStats:
+        """Statistics about the requests delayed by this bucket."""
+        return RateLimiterStats(
+            requests=self._requests,
+            delayed_requests=self._delayed_requests,
+            total_delay=timedelta(seconds=self._total_delay),
+            max_delay=timedelta(seconds=self._max_delay),
+        )
+
+    async def acquire(self) -> None:
+        """Wait until a request is allowed to be sent."""
+        now = asyncio.get_running_loop().time()
+        if self._updated_at is not None:
+            self._tokens = min(
+                self._limit.burst,
+                self._tokens + (now - self._updated_at) * self._limit.rate,
+            )
+        self._updated_at = now
+
+        # The tokens can go negative, meaning that they are reserved by requests
+        # already waiting in the queue.
+        self._tokens -= 1
+        delay = max(0.0, -self._tokens / self._limit.rate)
+
+        self._requests += 1
+        if delay > 0:
+            self._delayed_requests += 1
+            self._total_delay += delay
+            self._max_delay = max(self._max_delay, delay)
+            try:
+                await asyncio.sleep(delay)
+            except asyncio.CancelledError:
+                self._tokens += 1
+                raise
@@ -0,0 +1,212 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""A registry of shared, reference-counted clients."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Awaitable, Callable, Generic, Hashable, TypeVar
+
+_logger = logging.getLogger(__name__)
+
+ClientT = TypeVar("ClientT")
+"""The type of the registered clients."""
+
+
+@dataclass
+class _Entry(Generic[ClientT]):
+    """A registered client and its users."""
+
+    client: ClientT
+    """The shared client."""
+
+    idle_timeout: timedelta
+    """The time to keep the client once it has no users left."""
+
+    refs: int = 0
+    """The number of users of the client."""
+
+    eviction: asyncio.TimerHandle | None = None
+    """The scheduled eviction of the client, if it is idle."""
+
+
+class ClientRegistry(Generic[ClientT]):
+    """A registry sharing clients between the users of the same key.
+
+    Getting a client doesn't take a reference to it. Users acquire a reference
+    to a client while they use it and release it when done. When a client has no
+    users for longer than its idle timeout, either because they all released it
+    or because it was never acquired since it was got, it is removed from the
+    registry and closed. Clients with a zero idle timeout are only closed when
+    released, so clients that are never acquired stay registered until closed.
+    """
+
+    def __init__(self, close: Callable[[ClientT], Awaitable[None]]) -> None:
+        """Initialize the registry.
+
+        Args:
+            close: The function closing an evicted client.
+        """
+        self._close = close
+        self._entries: dict[Hashable, _Entry[ClientT]] = {}
+        self._closing: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        """Get the number of registered clients.
+
+        Returns:
+            The number of registered clients, including the idle ones.
+        """
+        return len(self._entries)
+
+    def refs(self, key: Hashable) -> int:
+        """Get the number of users of a client.
+
+        Args:
+            key: The key of the client.
+
+        Returns:
+            The number of references to the client, or `0` if it isn't registered.
+        """
+        entry = self._entries.get(key)
+        return entry.refs if entry is not None else 0
+
+    def get(
+        self, key: Hashable, create: Callable[[], ClientT], idle_timeout: timedelta
+    ) -> ClientT:
+        """Get the client of a key, creating it if needed, without acquiring it.
+
+        If the client has no users, its idle timeout starts again, so that it
+        is evicted if it isn't acquired in time.
+
+        Args:
+            key: The key of the client.
+            create: The function creating the client, if it isn't registered.
+            idle_timeout: The time to keep the client once it has no users left.
+                Only used if the client is created.
+
+        Returns:
+            The client of the key.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _Entry(create(), idle_timeout)
+            self._entries[key] = entry
+        if entry.refs == 0:
+            self._start_eviction_timer(key, entry)
+        return entry.client
+
+    def acquire(self, key: Hashable, client: ClientT, idle_timeout: timedelta) -> None:
+        """Take a reference to a client.
+
+        A client that was evicted is registered again, unless another client was
+        registered for its key since.
+
+        Args:
+            key: The key of the client.
+            client: The client to acquire.
+            idle_timeout: The time to keep the client once it has no users left.
+                Only used if the client is registered again.
+        """
+        entry = self._entries.get(key)
+        if entry is None:
+            entry = _Entry(client, idle_timeout)
+            self._entries[key] = entry
+        elif entry.client is not client:
+            return
+        self._cancel_eviction(entry)
+        entry.refs += 1
+
+    async def release(self, key: Hashable, client: ClientT) -> None:
+        """Release a reference to a client.
+
+        Args:
+            key: The key of the client.
+            client: The client to release.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.client is not client or entry.refs == 0:
+            return
+        entry.refs -= 1
+        if entry.refs > 0:
+            return
+        if entry.idle_timeout <= timedelta():
+            await self._evict(key, entry)
+            return
+        self._start_eviction_timer(key, entry)
+
+    async def close(self, key: Hashable, client: ClientT) -> None:
+        """Remove a client from the registry and close it, even if it has users.
+
+        Args:
+            key: The key of the client.
+            client: The client to close.
+        """
+        entry = self._entries.get(key)
+        if entry is None or entry.client is not client:
+            await self._close(client)
+            return
+        self._cancel_eviction(entry)
+        entry.refs = 0
+        await self._evict(key, entry)
+
+    @staticmethod
+    def _cancel_eviction(entry: _Entry[ClientT]) -> None:
+        """Cancel the scheduled eviction of a client, if any.
+
+        Args:
+            entry: The entry of the client.
+        """
+        if entry.eviction is not None:
+            entry.eviction.cancel()
+            entry.eviction = None
+
+    def _start_eviction_timer(self, key: Hashable, entry: _Entry[ClientT]) -> None:
+        """Schedule the eviction of an idle client after its idle timeout.
+
+        Nothing is scheduled for a zero idle timeout, or outside an event loop.
+
+        Args:
+            key: The key of the client.
+            entry: The entry of the client.
+        """
+        self._cancel_eviction(entry)
+        if entry.idle_timeout <= timedelta():
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            return
+        entry.eviction = loop.call_later(
+            entry.idle_timeout.total_seconds(), self._schedule_eviction, key, entry
+        )
+
+    def _schedule_eviction(self, key: Hashable, entry: _Entry[ClientT]) -> None:
+        """Start evicting an idle client.
+
+        Args:
+            key: The key of the client.
+            entry: The entry of the client.
+        """
+        task = asyncio.create_task(self._evict(key, entry))
+        self._closing.add(task)
+        task.add_done_callback(self._closing.discard)
+
+    async def _evict(self, key: Hashable, entry: _Entry[ClientT]) -> None:
+        """Remove an idle client from the registry and close it.
+
+        Args:
+            key: The key of the client.
+            entry: The entry of the client.
+        """
+        if self._entries.get(key) is not entry or entry.refs > 0:
+            return
+        del self._entries[key]
+        try:
+            await self._close(entry.client)
+        except Exception:  # pylint: disable=broad-except
+            _logger.exception("Error while closing the idle client for %s", key)
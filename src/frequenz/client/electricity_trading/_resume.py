@@ -0,0 +1,178 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Resuming streams without gaps, backfilling the missed messages."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections import OrderedDict
+from datetime import datetime, timezone
+from typing import AsyncIterable, AsyncIterator, Callable, Generic, Hashable, TypeVar
+
+import grpc
+
+_logger = logging.getLogger(__name__)
+
+ResponseT = TypeVar("ResponseT")
+"""The type of the messages received from the server."""
+
+T = TypeVar("T")
+"""The type of the streamed items."""
+
+DEFAULT_DEDUP_WINDOW = 10_000
+"""The default number of recent items remembered to drop duplicates."""
+
+
+class ResumableStream(Generic[ResponseT, T]):
+    # pylint: disable=too-many-instance-attributes
+    """A stream backfilling the items missed while it was reconnecting.
+
+    Every item has a time, like the last modification time of an order, and a
+    key identifying its version, like the ID of the order and that time. The
+    latest time of the items received, starting from the time the stream was
+    first opened, is remembered and, when the stream reconnects, the items
+    listed since then are sent before the new items of the stream. Items
+    already sent are dropped, based on the keys of the most recent items.
+
+    If listing the missed items times out, the stream goes on without them, so
+    they are missed. Such timeouts are logged and counted in
+    `backfill_timeouts`.
+
+    It is meant to be the stream method of a stream broadcaster, which calls it
+    again after every disconnection.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        *,
+        open_stream: Callable[[], AsyncIterable[ResponseT]],
+        transform: Callable[[ResponseT], T],
+        backfill: Callable[[], AsyncIterator[T]],
+        key: Callable[[T], Hashable],
+        time: Callable[[T], datetime],
+        dedup_window: int = DEFAULT_DEDUP_WINDOW,
+    ) -> None:
+        """Initialize the stream.
+
+        Args:
+            name: A name to identify the stream in the logs.
+            open_stream: A function opening the server stream.
+            transform: A function converting the messages of the server stream.
+            backfill: A function listing the items matching the stream.
+            key: A function getting the key identifying a version of an item.
+            time: A function getting the time of an item.
+            dedup_window: The number of recent keys remembered to drop
+                duplicates.
+        """
+        self._name = name
+        self._open_stream = open_stream
+        self._transform = transform
+        self._backfill = backfill
+        self._key = key
+        self._time = time
+        self._dedup_window = dedup_window
+        self._seen: OrderedDict[Hashable, None] = OrderedDict()
+        self._last_time: datetime | None = None
+        self._backfilled = 0
+        self._duplicates = 0
+        self._backfill_timeouts = 0
+
+    @property
+    def last_time(self) -> datetime | None:
+        """The latest time of the items sent, or when the stream was first opened.
+
+        It is `None` until the stream is first opened.
+        """
+        return self._last_time
+
+    @property
+    def backfilled(self) -> int:
+        """The number of items sent from the backfill listings."""
+        return self._backfilled
+
+    @property
+    def duplicates(self) -> int:
+        """The number of duplicated items dropped."""
+        return self._duplicates
+
+    @property
+    def backfill_timeouts(self) -> int:
+        """The number of backfill listings that timed out, missing their items."""
+        return self._backfill_timeouts
+
+    async def __call__(self) -> AsyncIterator[T]:
+        """Open the stream, first sending the items missed since the last one.
+
+        Yields:
+            The missed items, in chronological order, and then the items of
+                the stream.
+        """
+        # The stream is opened before listing, so the items changed while
+        # listing are not missed.
+        since = self._last_time
+        if since is None:
+            # Nothing can be missed before the stream is first opened.
+            self._last_time = datetime.now(timezone.utc)
+        stream = self._open_stream()
+        try:
+            if since is not None:
+                for item in await self._list_since(since):
+                    self._backfilled += 1
+                    yield item
+            async for response in stream:
+                item = self._transform(response)
+                if self._is_new(item):
+                    yield item
+        finally:
+            # Gives up on the server stream if listing failed or the stream was
+            # stopped.
+            if isinstance(stream, grpc.aio.Call):
+                stream.cancel()
+
+    async def _list_since(self, since: datetime) -> list[T]:
+        """List the new items since a time.
+
+        Args:
+            since: The latest time of the items already sent.
+
+        Returns:
+            The items not sent yet, in chronological order.
+        """
+        try:
+            listed = [item async for item in self._backfill()]
+        except asyncio.TimeoutError:
+            self._backfill_timeouts += 1
+            _logger.error(
+                "%s: timed out backfilling the items since %s, they might be missed",
+                self._name,
+                since,
+            )
+            return []
+        listed.sort(key=self._time)
+        return [
+            item for item in listed if self._time(item) >= since and self._is_new(item)
+        ]
+
+    def _is_new(self, item: T) -> bool:
+        """Check if an item was not sent yet, and remember it.
+
+        Args:
+            item: The item to check.
+
+        Returns:
+            Whether the item was not sent yet.
+        """
+        key = self._key(item)
+        if key in self._seen:
+            self._duplicates += 1
+            return False
+        self._seen[key] = None
+        if len(self._seen) > self._dedup_window:
+            self._seen.popitem(last=False)
+        time = self._time(item)
+        if self._last_time is None or time > self._last_time:
+            self._last_time = time
+        return True
@@ -0,0 +1,117 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Retrying of idempotent requests."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from dataclasses import dataclass, field
+from typing import Awaitable, Callable, TypeVar
+
+import grpc
+from frequenz.client.base import retry
+
+from ._deadline import Deadline
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+"""The type of the result of the retried call."""
+
+
+def _default_strategy() -> retry.Strategy:
+    """Create the default retry strategy.
+
+    Returns:
+        An exponential backoff starting at 100ms, with up to 100ms of jitter and at
+            most 4 retries.
+    """
+    return retry.ExponentialBackoff(
+        initial_interval=0.1, max_interval=5.0, jitter=0.1, limit=4
+    )
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """A policy to retry idempotent requests failing with transient errors."""
+
+    strategy: retry.Strategy = field(default_factory=_default_strategy)
+    """The strategy giving the time to wait before each retry.
+
+    Its limit is the maximum number of retries, on top of the first attempt. A
+    fresh copy of the strategy is used for every request.
+    """
+
+    retryable_codes: frozenset[grpc.StatusCode] = frozenset(
+        {
+            grpc.StatusCode.UNAVAILABLE,
+            grpc.StatusCode.DEADLINE_EXCEEDED,
+            grpc.StatusCode.RESOURCE_EXHAUSTED,
+        }
+    )
+    """The status codes of the errors worth retrying."""
+
+    def is_retryable(self, error: Exception) -> bool:
+        """Check whether a failed request should be retried.
+
+        Timeouts are considered as errors with the `DEADLINE_EXCEEDED` status code.
+
+        Args:
+            error: The error raised by the request.
+
+        Returns:
+            Whether the error is transient according to this policy.
+        """
+        if isinstance(error, asyncio.TimeoutError):
+            return grpc.StatusCode.DEADLINE_EXCEEDED in self.retryable_codes
+        if isinstance(error, grpc.RpcError) and hasattr(error, "code"):
+            return error.code() in self.retryable_codes
+        return False
+
+
+async def call_with_retry(
+    call: Callable[[], Awaitable[T]],
+    policy: RetryPolicy,
+    name: str,
+    deadline: Deadline | None = None,
+) -> T:
+    """Call a function, retrying it according to a retry policy.
+
+    Args:
+        call: The function sending the request.
+        policy: The retry policy to apply.
+        name: The name of the request, for logging.
+        deadline: The deadline of the operation the request is part of, if any.
+            No retry is attempted if it would start after the deadline.
+
+    Returns:
+        The result of the first successful attempt.
+
+    Raises:
+        grpc.RpcError: The error of the last attempt, if it wasn't retryable or
+            there are no more retries left.
+        asyncio.TimeoutError: If the last attempt timed out and there are no more
+            retries left, or the deadline expired.
+    """
+    strategy = policy.strategy.copy()
+    while True:
+        try:
+            return await call()
+        except (grpc.RpcError, asyncio.TimeoutError) as exc:
+            if not policy.is_retryable(exc):
+                raise
+            interval = strategy.next_interval()
+            if interval is None:
+                raise
+            if deadline is not None and interval >= deadline.remaining.total_seconds():
+                raise
+            _logger.warning(
+                "%s failed with a transient error, retrying in %.3fs %s: %s",
+                name,
+                interval,
+                strategy.get_progress(),
+                exc,
+            )
+            await asyncio.sleep(interval)
@@ -0,0 +1,329 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Listing a snapshot and then streaming the updates, without gaps."""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+from collections import deque
+from typing import Any, AsyncIterator, Awaitable, Callable, Generic, Hashable, TypeVar
+
+from frequenz.channels import Receiver
+from frequenz.client.base import retry
+from frequenz.client.base.streaming import GrpcStreamBroadcaster
+
+from ._stream_cache import CachedStreamBroadcaster
+
+_logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+"""The type of the listed and streamed items."""
+
+DEFAULT_BUFFER_SIZE = 10_000
+"""The default number of stream updates buffered while listing the snapshot."""
+
+
+class SnapshotOverflowError(RuntimeError):
+    """More updates than the buffer can hold were received while listing a snapshot."""
+
+
+class SnapshotSubscription(Generic[T]):  # pylint: disable=too-many-instance-attributes
+    """A snapshot of items followed by their live updates, without gaps.
+
+    When iterating, the stream is subscribed to, and the snapshot is listed
+    once the stream has been requested from the server. The updates received
+    while listing are buffered. Once the snapshot has been sent, the buffered
+    updates are sent, dropping the ones that are not newer than an item already
+    sent with the same key, and then the live updates.
+
+    The updates are buffered up to a limit, and iterating fails if the snapshot
+    takes too long to list for the buffer to hold all the updates.
+    """
+
+    def __init__(  # pylint: disable=too-many-arguments
+        self,
+        subscribe: Callable[[int], Awaitable[Receiver[T]]],
+        snapshot: Callable[[], AsyncIterator[T]],
+        *,
+        key: Callable[[T], Hashable],
+        version: Callable[[T], Any],
+        buffer_size: int = DEFAULT_BUFFER_SIZE,
+    ) -> None:
+        """Initialize the subscription.
+
+        Args:
+            subscribe: A function creating a receiver of the stream, buffering
+                up to the given number of messages, and returning once the
+                stream has been requested from the server.
+            snapshot: A function listing the snapshot.
+            key: A function getting the key identifying an item.
+            version: A function getting the version of an item, which must be
+                comparable between items with the same key.
+            buffer_size: The maximum number of updates buffered while listing.
+
+        Raises:
+            ValueError: If the buffer size is not positive.
+        """
+        if buffer_size < 1:
+            raise ValueError("The buffer size must be positive.")
+        self._subscribe = subscribe
+        self._snapshot = snapshot
+        self._key = key
+        self._version = version
+        self._buffer_size = buffer_size
+        self._buffer: deque[T] = deque()
+        self._high_water_mark = 0
+        self._versions: dict[Hashable, Any] = {}
+        self._snapshot_sent = asyncio.Event()
+
+    @property
+    def buffer_high_water_mark(self) -> int:
+        """The largest number of updates buffered while listing the snapshot."""
+        return self._high_water_mark
+
+    @property
+    def snapshot_sent(self) -> bool:
+        """Whether all the items of the snapshot were sent."""
+        return self._snapshot_sent.is_set()
+
+    async def wait_for_snapshot(self) -> None:
+        """Wait until all the items of the snapshot were sent."""
+        await self._snapshot_sent.wait()
+
+    async def __aiter__(self) -> AsyncIterator[T]:
+        """Iterate over the snapshot and then over the updates.
+
+        Yields:
+            The items of the snapshot, followed by their updates.
+
+        Raises:
+            SnapshotOverflowError: If more updates than the size of the buffer
+                were received while listing the snapshot.
+        """
+        receiver = await self._subscribe(self._buffer_size)
+        overflow = asyncio.Event()
+        buffering = asyncio.create_task(self._fill_buffer(receiver, overflow))
+        try:
+            async for item in self._snapshot():
+                if overflow.is_set():
+                    break
+                if self._is_new(item):
+                    yield item
+        finally:
+            buffering.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await buffering
+        if overflow.is_set():
+            raise SnapshotOverflowError(
+                f"More than {self._buffer_size} updates were received while "
+                "listing the snapshot."
+            )
+        self._snapshot_sent.set()
+
+        while self._buffer:
+            item = self._buffer.popleft()
+            if self._is_new(item):
+                yield item
+        async for item in receiver:
+            if self._is_newer_update(item):
+                yield item
+
+    async def _fill_buffer(
+        self, receiver: Receiver[T], overflow: asyncio.Event
+    ) -> None:
+        """Buffer the updates received while listing the snapshot.
+
+        Args:
+            receiver: The receiver of the stream.
+            overflow: An event set if the buffer is full.
+        """
+        async for item in receiver:
+            if len(self._buffer) == self._buffer_size:
+                overflow.set()
+                return
+            self._buffer.append(item)
+            self._high_water_mark = max(self._high_water_mark, len(self._buffer))
+
+    def _is_new(self, item: T) -> bool:
+        """Check if an item is newer than the ones already sent, and remember it.
+
+        Args:
+            item: The item to check.
+
+        Returns:
+            Whether no item with the same key and a newer or the same version
+                was sent.
+        """
+        key = self._key(item)
+        version = self._version(item)
+        if key in self._versions and version <= self._versions[key]:
+            return False
+        self._versions[key] = version
+        return True
+
+    def _is_newer_update(self, item: T) -> bool:
+        """Check if a live update is newer than the item sent with the same key.
+
+        The versions of the listed and buffered items are only kept until a
+        newer update of the same item is received, as the updates that follow
+        are newer, so they don't grow with the live updates.
+
+        Args:
+            item: The live update to check.
+
+        Returns:
+            Whether no item with the same key and a newer or the same version
+                was listed or buffered.
+        """
+        key = self._key(item)
+        if key in self._versions:
+            if self._version(item) <= self._versions[key]:
+                return False
+            del self._versions[key]
+        return True
+
+
+async def subscribe_when_streaming(
+    stream: GrpcStreamBroadcaster[Any, T], maxsize: int
+) -> Receiver[T]:
+    """Create a receiver of a stream, once the server stream has been requested.
+
+    Args:
+        stream: The stream to subscribe to.
+        maxsize: The maximum number of messages to buffer.
+
+    Returns:
+        The new receiver, created before waiting for the server stream.
+    """
+    receiver = stream.new_receiver(maxsize=maxsize)
+    if isinstance(stream, CachedStreamBroadcaster):
+        await stream.wait_for_stream()
+    return receiver
+
+
+class SnapshotFollower(Generic[T]):
+    """Applies a snapshot and then its updates, in the background.
+
+    If the updates buffered while listing the snapshot overflow, the snapshot
+    is listed again, after a backoff growing with the consecutive overflows.
+    Items that fail to be applied are logged and skipped.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        subscribe: Callable[[], SnapshotSubscription[T]],
+        apply: Callable[[T], Any],
+        *,
+        relist_strategy: retry.Strategy | None = None,
+    ) -> None:
+        """Initialize the follower.
+
+        Args:
+            name: A name to identify the followed items in the logs.
+            subscribe: A function creating a new subscription.
+            apply: A function applying a listed or streamed item.
+            relist_strategy: The strategy giving the time to wait before listing
+                the snapshot again after an overflow. Defaults to an exponential
+                backoff from 1 to 60 seconds, without limit.
+        """
+        self._name = name
+        self._subscribe = subscribe
+        self._apply = apply
+        self._relist_strategy = (
+            retry.ExponentialBackoff(initial_interval=1.0, jitter=0.5)
+            if relist_strategy is None
+            else relist_strategy.copy()
+        )
+        self._task: asyncio.Task[None] | None = None
+        self._synced = asyncio.Event()
+        self._apply_errors = 0
+
+    @property
+    def is_synced(self) -> bool:
+        """Whether the snapshot was applied and the updates are followed."""
+        return self._synced.is_set()
+
+    @property
+    def apply_errors(self) -> int:
+        """The number of items skipped because they failed to be applied."""
+        return self._apply_errors
+
+    async def start(self) -> None:
+        """Start following the items, waiting until the snapshot is applied.
+
+        Raises:
+            RuntimeError: If the stream ended before the snapshot was applied.
+        """
+        if self._task is None or self._task.done():
+            self._synced.clear()
+            self._task = asyncio.create_task(self._run())
+        synced = asyncio.create_task(self._synced.wait())
+        await asyncio.wait({synced, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        if synced.done():
+            return
+        synced.cancel()
+        # Raises the error that stopped following the items, if any.
+        self._task.result()
+        raise RuntimeError(f"The stream of {self._name} ended before listing them.")
+
+    async def stop(self) -> None:
+        """Stop following the items."""
+        if self._task is None:
+            return
+        self._task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await self._task
+        self._task = None
+        self._synced.clear()
+
+    async def _run(self) -> None:
+        """Apply the snapshot and then the updates, relisting on overflow."""
+        while True:
+            subscription = self._subscribe()
+            synced = asyncio.create_task(subscription.wait_for_snapshot())
+            synced.add_done_callback(self._set_synced)
+            try:
+                async for item in subscription:
+                    self._apply_item(item)
+            except SnapshotOverflowError as exc:
+                interval = self._relist_strategy.next_interval()
+                if interval is None:
+                    raise
+                _logger.warning(
+                    "Relisting the %s in %0.3f seconds: %s", self._name, interval, exc
+                )
+                await asyncio.sleep(interval)
+                continue
+            finally:
+                synced.cancel()
+                self._synced.clear()
+            _logger.info("The stream of %s ended", self._name)
+            return
+
+    def _apply_item(self, item: T) -> None:
+        """Apply an item, logging and skipping it if it fails.
+
+        Args:
+            item: The item to apply.
+        """
+        try:
+            self._apply(item)
+        except Exception:  # pylint: disable=broad-except
+            self._apply_errors += 1
+            _logger.exception(
+                "Skipping one of the %s, which failed to apply: %s", self._name, item
+            )
+
+    def _set_synced(self, task: asyncio.Task[None]) -> None:
+        """Mark the follower as synced once the snapshot was applied.
+
+        Args:
+            task: The task waiting for the snapshot to be sent.
+        """
+        if not task.cancelled():
+            self._relist_strategy.reset()
+            self._synced.set()
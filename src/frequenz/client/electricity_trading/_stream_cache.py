@@ -0,0 +1,376 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""A cache of the streams opened by the client, stopping the unused ones."""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import weakref
+from collections import OrderedDict
+from collections.abc import Sized
+from dataclasses import dataclass
+from datetime import timedelta
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Hashable, TypeVar
+
+from frequenz.channels import Receiver
+from frequenz.client.base.streaming import GrpcStreamBroadcaster
+
+_logger = logging.getLogger(__name__)
+
+InputT = TypeVar("InputT")
+"""The type of the messages received from the server."""
+
+OutputT = TypeVar("OutputT")
+"""The type of the messages sent to the receivers."""
+
+DerivedT = TypeVar("DerivedT")
+"""The type of the messages sent by a derived stream."""
+
+
+@dataclass(frozen=True)
+class StreamCachePolicy:
+    """A policy limiting the streams kept open by the client."""
+
+    idle_timeout: timedelta | None = None
+    """The time after which a stream without receivers is stopped, if any.
+
+    Streams are checked periodically, so they can stay open up to half this
+    time longer.
+    """
+
+    max_streams: int | None = None
+    """The maximum number of streams kept open, if any.
+
+    When opening a stream over the limit, the least recently used stream is
+    stopped, preferring streams without receivers. Receivers of a stopped
+    stream stop receiving messages.
+    """
+
+    def __post_init__(self) -> None:
+        """Validate the policy.
+
+        Raises:
+            ValueError: If the idle timeout or the maximum number of streams are
+                not positive.
+        """
+        if self.idle_timeout is not None and self.idle_timeout <= timedelta():
+            raise ValueError("The idle timeout of streams must be positive.")
+        if self.max_streams is not None and self.max_streams < 1:
+            raise ValueError("The maximum number of streams must be positive.")
+
+
+@dataclass(frozen=True)
+class StreamCacheStats:
+    """Statistics about the streams kept open by the client."""
+
+    streams: int
+    """The number of streams currently open."""
+
+    receivers: int
+    """The number of live receivers of the open streams."""
+
+    buffered_messages: int
+    """The number of messages buffered by the receivers, not consumed yet."""
+
+    idle_evictions: int
+    """The number of streams stopped because they had no receivers."""
+
+    lru_evictions: int
+    """The number of streams stopped to stay within the maximum number of streams."""
+
+
+class CachedStreamBroadcaster(GrpcStreamBroadcaster[InputT, OutputT]):
+    """A stream broadcaster keeping track of its receivers."""
+
+    def __init__(
+        self,
+        stream_name: str,
+        stream_method: Callable[[], AsyncIterable[InputT]],
+        transform: Callable[[InputT], OutputT],
+        *,
+        upstream: CachedStreamBroadcaster[Any, InputT] | None = None,
+        **kwargs: Any,
+    ) -> None:
+        """Initialize the broadcaster and start streaming.
+
+        Args:
+            stream_name: A name to identify the stream in the logs.
+            stream_method: A function opening the server stream, called again
+                after every disconnection.
+            transform: A function converting the messages of the server stream.
+            upstream: The stream whose messages are received, if this stream is
+                derived from it.
+            **kwargs: The other keyword arguments of `GrpcStreamBroadcaster`.
+        """
+        self._streaming = asyncio.Event()
+        super().__init__(
+            stream_name,
+            lambda: self._stream(stream_method),
+            transform,
+            **kwargs,
+        )
+        self._receivers: weakref.WeakSet[Receiver[OutputT]] = weakref.WeakSet()
+        self._derived: dict[Hashable, CachedStreamBroadcaster[OutputT, Any]] = {}
+        self._upstream = upstream
+        self._loop = asyncio.get_running_loop()
+        self.idle_since: float | None = self._loop.time()
+        """The loop time since which the stream has no receivers, if it has none."""
+
+    @property
+    def receivers(self) -> list[Receiver[Any]]:
+        """The receivers of the stream and its derived streams that are still alive."""
+        return [
+            *self._receivers,
+            *(
+                receiver
+                for stream in self._derived.values()
+                if stream.is_running
+                for receiver in stream.receivers
+            ),
+        ]
+
+    def new_receiver(
+        self, maxsize: int = 50, warn_on_overflow: bool = True
+    ) -> Receiver[OutputT]:
+        """Create a new receiver for the stream.
+
+        Args:
+            maxsize: The maximum number of messages to buffer.
+            warn_on_overflow: Whether to log a warning when the receiver's
+                buffer is full and a message is dropped.
+
+        Returns:
+            A new receiver.
+        """
+        receiver = super().new_receiver(maxsize, warn_on_overflow)
+        self._receivers.add(receiver)
+        self.idle_since = None
+        return receiver
+
+    def check_idle(self) -> float | None:
+        """Update the time since which the stream has no receivers.
+
+        Returns:
+            The loop time since which the stream has no receivers, if it has none.
+        """
+        if self.receivers:
+            self.idle_since = None
+        elif self.idle_since is None:
+            self.idle_since = self._loop.time()
+        return self.idle_since
+
+    def derive(
+        self, key: Hashable, transform: Callable[[OutputT], DerivedT]
+    ) -> CachedStreamBroadcaster[OutputT, DerivedT]:
+        """Get a stream converting the messages of this one, sharing its server stream.
+
+        The derived stream stops with this one, and its receivers keep this one
+        from being idle.
+
+        Args:
+            key: The key of the derived stream, reused while it is running.
+            transform: A function converting the messages of this stream.
+
+        Returns:
+            The derived stream.
+        """
+        stream = self._derived.get(key)
+        if stream is None or not stream.is_running:
+            # Not tracked, as the derived stream tracks its own receivers. It is
+            # created right away not to miss any message, and only referenced by
+            # the derived stream while it runs.
+            pending = [super().new_receiver()]
+            stream = CachedStreamBroadcaster(
+                f"{self._stream_name}-{key}",
+                pending.pop,
+                transform,
+                upstream=self,
+            )
+            self._derived[key] = stream
+        return stream
+
+    async def stop(self) -> None:
+        """Stop the stream and its derived streams."""
+        await super().stop()
+        for stream in self._derived.values():
+            await stream.stop()
+        self._derived.clear()
+
+    async def wait_for_stream(self) -> None:
+        """Wait until the server stream has been requested, or the broadcaster stopped.
+
+        The messages sent by the server from then on reach the receivers
+        created before.
+        """
+        streaming = asyncio.create_task(self._streaming.wait())
+        await asyncio.wait({streaming, self._task}, return_when=asyncio.FIRST_COMPLETED)
+        streaming.cancel()
+        if self._upstream is not None:
+            await self._upstream.wait_for_stream()
+
+    async def _stream(
+        self, stream_method: Callable[[], AsyncIterable[InputT]]
+    ) -> AsyncIterator[InputT]:
+        """Open the server stream, marking it as requested until it ends.
+
+        Args:
+            stream_method: The function opening the server stream.
+
+        Yields:
+            The messages of the server stream.
+        """
+        stream = stream_method()
+        self._streaming.set()
+        try:
+            async for message in stream:
+                yield message
+        finally:
+            self._streaming.clear()
+
+
+class StreamCache:
+    """The streams opened by the client, reused by all the users of a stream.
+
+    Stopped streams are removed when looked up. Depending on the policy, streams
+    without receivers are stopped after an idle timeout, and the least recently
+    used streams are stopped to stay within a maximum number of streams.
+    """
+
+    def __init__(self, policy: StreamCachePolicy | None = None) -> None:
+        """Initialize the cache.
+
+        Args:
+            policy: The policy limiting the open streams, if any.
+        """
+        self._policy = policy or StreamCachePolicy()
+        self._streams: OrderedDict[Hashable, CachedStreamBroadcaster[Any, Any]] = (
+            OrderedDict()
+        )
+        self._idle_evictions = 0
+        self._lru_evictions = 0
+        self._sweeper: asyncio.Task[None] | None = None
+        self._stopping: set[asyncio.Task[None]] = set()
+
+    def __len__(self) -> int:
+        """Get the number of cached streams.
+
+        Returns:
+            The number of cached streams.
+        """
+        return len(self._streams)
+
+    @property
+    def stats(self) -> StreamCacheStats:
+        """Statistics about the cached streams."""
+        receivers = [
+            receiver
+            for stream in self._streams.values()
+            for receiver in stream.receivers
+        ]
+        return StreamCacheStats(
+            streams=len(self._streams),
+            receivers=len(receivers),
+            buffered_messages=sum(
+                len(receiver) for receiver in receivers if isinstance(receiver, Sized)
+            ),
+            idle_evictions=self._idle_evictions,
+            lru_evictions=self._lru_evictions,
+        )
+
+    def get(self, key: Hashable) -> CachedStreamBroadcaster[Any, Any] | None:
+        """Get a running stream, marking it as the most recently used.
+
+        Args:
+            key: The key of the stream.
+
+        Returns:
+            The running stream of the key, if any.
+        """
+        stream = self._streams.get(key)
+        if stream is None:
+            return None
+        if not stream.is_running:
+            del self._streams[key]
+            return None
+        self._streams.move_to_end(key)
+        return stream
+
+    def add(self, key: Hashable, stream: CachedStreamBroadcaster[Any, Any]) -> None:
+        """Add a new stream, stopping the least recently used ones if needed.
+
+        Args:
+            key: The key of the stream.
+            stream: The stream to add.
+        """
+        self._streams[key] = stream
+        self._streams.move_to_end(key)
+        max_streams = self._policy.max_streams
+        while max_streams is not None and len(self._streams) > max_streams:
+            self._lru_evictions += 1
+            self._evict(self._least_recently_used(key))
+        if self._policy.idle_timeout is not None and (
+            self._sweeper is None or self._sweeper.done()
+        ):
+            self._sweeper = asyncio.create_task(
+                self._sweep(self._policy.idle_timeout.total_seconds())
+            )
+
+    async def close(self) -> None:
+        """Stop all the streams."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        streams = list(self._streams.values())
+        self._streams.clear()
+        for stream in streams:
+            await stream.stop()
+        await asyncio.gather(*self._stopping)
+
+    def _least_recently_used(self, new_key: Hashable) -> Hashable:
+        """Get the stream to evict to make room for a new one.
+
+        Args:
+            new_key: The key of the new stream, which is never evicted.
+
+        Returns:
+            The key of the least recently used stream without receivers, or of
+                the least recently used stream if all of them have receivers.
+        """
+        candidates = [key for key in self._streams if key != new_key]
+        for key in candidates:
+            if self._streams[key].check_idle() is not None:
+                return key
+        return candidates[0]
+
+    def _evict(self, key: Hashable) -> None:
+        """Remove a stream and stop it in the background.
+
+        Args:
+            key: The key of the stream.
+        """
+        stream = self._streams.pop(key)
+        _logger.debug("Stopping unused stream %s", key)
+        task = asyncio.create_task(stream.stop())
+        self._stopping.add(task)
+        task.add_done_callback(self._stopping.discard)
+
+    async def _sweep(self, idle_timeout: float) -> None:
+        """Periodically stop the streams without receivers for too long.
+
+        Args:
+            idle_timeout: The idle timeout of the streams, in seconds.
+        """
+        loop = asyncio.get_running_loop()
+        while self._streams:
+            await asyncio.sleep(idle_timeout / 2)
+            now = loop.time()
+            for key, stream in list(self._streams.items()):
+                if not stream.is_running:
+                    del self._streams[key]
+                    continue
+                idle_since = stream.check_idle()
+                if idle_since is not None and now - idle_since >= idle_timeout:
+                    self._idle_evictions += 1
+                    self._evict(key)
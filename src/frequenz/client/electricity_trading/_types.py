@@ -111,7 +111,7 @@ class Currency(enum.Enum):
         return price_pb2.Price.Currency.ValueType(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Price:
     """Price of an order."""
 
@@ -156,7 +156,7 @@ class Price:
         return f"{self.amount} {self.currency.name}"
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class Power:
     """Represents power unit in Megawatthours (MW)."""
 
@@ -247,7 +247,7 @@ class EnergyMarketCodeType(enum.Enum):
         return delivery_area_pb2.EnergyMarketCodeType.ValueType(self.value)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class DeliveryArea:
     """
     Geographical or administrative region.
@@ -350,6 +350,8 @@ class DeliveryPeriod:
     It is defined by a start timestamp and a duration.
     """
 
+    __slots__ = ("start", "duration")
+
     start: datetime
     """Start UTC timestamp represents the beginning of the delivery period.
         This timestamp is inclusive, meaning that the delivery period starts
@@ -939,7 +941,7 @@ class MarketActor(enum.Enum):
         return self.value
 
 
-@dataclass()
+@dataclass(slots=True)
 class Order:  # pylint: disable=too-many-instance-attributes
     """Represents an order in the electricity market."""
 
@@ -1127,7 +1129,7 @@ class Order:  # pylint: disable=too-many-instance-attributes
         )
 
 
-@dataclass()
+@dataclass(slots=True)
 class Trade:  # pylint: disable=too-many-instance-attributes
     """Represents a private trade in the electricity market."""
 
@@ -1212,7 +1214,7 @@ class Trade:  # pylint: disable=too-many-instance-attributes
         )
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class StateDetail:
     """Details about the current state of the order."""
 
@@ -1261,7 +1263,7 @@ class StateDetail:
         )
 
 
-@dataclass()
+@dataclass(slots=True)
 class OrderDetail:
     """
     Represents an order with full details, including its ID, state, and associated UTC timestamps.
@@ -1367,7 +1369,7 @@ class OrderDetail:
         )
 
 
-@dataclass()
+@dataclass(slots=True)
 class PublicTrade:  # pylint: disable=too-many-instance-attributes
     """Represents a public order in the market."""
 
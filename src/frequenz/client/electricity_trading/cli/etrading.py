@@ -57,24 +57,26 @@ async def list_public_trades(url: str, key: str, *, delivery_start: datetime) ->
 
     print_public_trade_header()
 
-    delivery_period = None
-    # If delivery period is selected, list historical trades also
-    if delivery_start is not None:
-        check_delivery_start(delivery_start)
-        delivery_period = DeliveryPeriod(
-            start=delivery_start,
-            duration=timedelta(minutes=15),
-        )
-        lst = client.list_public_trades(delivery_period=delivery_period)
-
-        async for trade in lst:
+    # If no delivery period is selected, only stream new trades
+    if delivery_start is None:
+        stream = client.public_trades_stream().new_receiver()
+        async for trade in stream:
             print_public_trade(trade)
+        return
 
-        if delivery_start <= datetime.now(timezone.utc):
-            return
+    check_delivery_start(delivery_start)
+    delivery_period = DeliveryPeriod(
+        start=delivery_start,
+        duration=timedelta(minutes=15),
+    )
+    # Past delivery periods don't get new trades
+    if delivery_start <= datetime.now(timezone.utc):
+        async for trade in client.list_public_trades(delivery_period=delivery_period):
+            print_public_trade(trade)
+        return
 
-    stream = client.public_trades_stream(delivery_period=delivery_period).new_receiver()
-    async for trade in stream:
+    trades = client.snapshot_and_stream_public_trades(delivery_period=delivery_period)
+    async for trade in trades:
         print_public_trade(trade)
 
 
@@ -103,18 +105,18 @@ async def list_gridpool_trades(
             start=delivery_start,
             duration=timedelta(minutes=15),
         )
-    lst = client.list_gridpool_trades(gid, delivery_period=delivery_period)
-
-    async for trade in lst:
-        print_trade(trade)
-
+    # Past delivery periods don't get new trades
     if delivery_start and delivery_start <= datetime.now(timezone.utc):
+        async for trade in client.list_gridpool_trades(
+            gid, delivery_period=delivery_period
+        ):
+            print_trade(trade)
         return
 
-    stream = client.gridpool_trades_stream(
+    trades = client.snapshot_and_stream_gridpool_trades(
         gid, delivery_period=delivery_period
-    ).new_receiver()
-    async for trade in stream:
+    )
+    async for trade in trades:
         print_trade(trade)
 
 
@@ -127,8 +129,10 @@ async def list_gridpool_orders(
     for the 15 minute delivery period starting at delivery_start.
     If no delivery_start is provided, stream new orders for any delivery period.
 
-    Note that retrieved sort order for listed orders (starting from the newest)
-    is reversed in chunks trying to bring more recent orders to the bottom.
+    Note that for past delivery periods, the retrieved sort order for listed
+    orders (starting from the newest) is reversed in chunks trying to bring more
+    recent orders to the bottom. Otherwise the orders are listed as retrieved,
+    followed by their updates.
 
     Args:
         url: URL of the trading API.
@@ -148,18 +152,17 @@ async def list_gridpool_orders(
             start=delivery_start,
             duration=timedelta(minutes=15),
         )
-    lst = client.list_gridpool_orders(gid, delivery_period=delivery_period)
-
-    async for order in reverse_iterator(lst):
-        print_order(order)
-
+    # Past delivery periods don't get order updates
     if delivery_start and delivery_start <= datetime.now(timezone.utc):
+        lst = client.list_gridpool_orders(gid, delivery_period=delivery_period)
+        async for order in reverse_iterator(lst):
+            print_order(order)
         return
 
-    stream = client.gridpool_orders_stream(
+    orders = client.snapshot_and_stream_gridpool_orders(
         gid, delivery_period=delivery_period
-    ).new_receiver()
-    async for order in stream:
+    )
+    async for order in orders:
         print_order(order)
 
 
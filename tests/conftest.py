@@ -0,0 +1,235 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Fixtures building the orders and trades shared by the tests."""
+
+from datetime import datetime, timedelta, timezone
+from decimal import Decimal
+from typing import Callable
+
+import pytest
+
+from frequenz.client.electricity_trading import (
+    Currency,
+    DeliveryArea,
+    DeliveryPeriod,
+    EnergyMarketCodeType,
+    MarketActor,
+    MarketSide,
+    Order,
+    OrderDetail,
+    OrderState,
+    OrderType,
+    Power,
+    Price,
+    PublicTrade,
+    StateDetail,
+    StateReason,
+    Trade,
+    TradeState,
+)
+
+_START = datetime(2025, 1, 1, 12, tzinfo=timezone.utc)
+_AREA = DeliveryArea(code="10YDE-EON------1", code_type=EnergyMarketCodeType.EUROPE_EIC)
+
+
+def _delivery_period(minutes: int = 0) -> DeliveryPeriod:
+    """Create a delivery period of 15 minutes.
+
+    Args:
+        minutes: The start of the delivery period, in minutes after the start.
+
+    Returns:
+        The delivery period.
+    """
+    return DeliveryPeriod(
+        start=_START + timedelta(minutes=minutes), duration=timedelta(minutes=15)
+    )
+
+
+def _order_detail(  # pylint: disable=too-many-arguments
+    order_id: int = 1,
+    *,
+    state: OrderState = OrderState.ACTIVE,
+    side: MarketSide = MarketSide.BUY,
+    minutes: int = 0,
+    price: str = "50",
+    mw: str = "1",
+    tag: str | None = None,
+    modified: timedelta = timedelta(),
+) -> OrderDetail:
+    """Create an open limit order.
+
+    Args:
+        order_id: The ID of the order.
+        state: The state of the order.
+        side: The side of the order.
+        minutes: The start of the delivery period, in minutes after the start.
+        price: The price of the order, in EUR.
+        mw: The quantity of the order, in MW, all of it open.
+        tag: The tag of the order.
+        modified: The modification time, after the start.
+
+    Returns:
+        The order.
+    """
+    return OrderDetail(
+        order_id=order_id,
+        order=Order(
+            delivery_area=_AREA,
+            delivery_period=_delivery_period(minutes),
+            type=OrderType.LIMIT,
+            side=side,
+            price=Price(amount=Decimal(price), currency=Currency.EUR),
+            quantity=Power(mw=Decimal(mw)),
+            tag=tag,
+        ),
+        state_detail=StateDetail(
+            state=state,
+            state_reason=StateReason.ADD,
+            market_actor=MarketActor.USER,
+        ),
+        open_quantity=Power(mw=Decimal(mw)),
+        filled_quantity=Power(mw=Decimal("0")),
+        create_time=_START,
+        modification_time=_START + modified,
+    )
+
+
+def _trade(  # pylint: disable=too-many-arguments
+    trade_id: int = 1,
+    *,
+    side: MarketSide = MarketSide.BUY,
+    state: TradeState = TradeState.ACTIVE,
+    minutes: int = 0,
+    area: DeliveryArea = _AREA,
+    price: str = "50",
+    currency: Currency = Currency.EUR,
+    mw: str = "1",
+    executed: timedelta = timedelta(),
+) -> Trade:
+    """Create a gridpool trade of the order with the same ID.
+
+    Args:
+        trade_id: The ID of the trade.
+        side: The side of the trade.
+        state: The state of the trade.
+        minutes: The start of the delivery period, in minutes after the start.
+        area: The delivery area of the trade.
+        price: The price of the trade.
+        currency: The currency of the price.
+        mw: The quantity of the trade, in MW.
+        executed: The execution time, after the start.
+
+    Returns:
+        The trade.
+    """
+    return Trade(
+        id=trade_id,
+        order_id=trade_id,
+        side=side,
+        delivery_area=area,
+        delivery_period=_delivery_period(minutes),
+        execution_time=_START + executed,
+        price=Price(amount=Decimal(price), currency=currency),
+        quantity=Power(mw=Decimal(mw)),
+        state=state,
+    )
+
+
+def _public_trade(  # pylint: disable=too-many-arguments
+    public_trade_id: int = 1,
+    *,
+    state: TradeState = TradeState.ACTIVE,
+    minutes: int = 0,
+    buy_area: DeliveryArea = _AREA,
+    sell_area: DeliveryArea = _AREA,
+    price: str = "50",
+    mw: str = "1",
+    executed: timedelta = timedelta(),
+) -> PublicTrade:
+    """Create a public trade.
+
+    Args:
+        public_trade_id: The ID of the trade.
+        state: The state of the trade.
+        minutes: The start of the delivery period, in minutes after the start.
+        buy_area: The delivery area of the buy side.
+        sell_area: The delivery area of the sell side.
+        price: The price of the trade, in EUR.
+        mw: The quantity of the trade, in MW.
+        executed: The execution time, after the start.
+
+    Returns:
+        The trade.
+    """
+    return PublicTrade(
+        public_trade_id=public_trade_id,
+        buy_delivery_area=buy_area,
+        sell_delivery_area=sell_area,
+        delivery_period=_delivery_period(minutes),
+        execution_time=_START + executed,
+        price=Price(amount=Decimal(price), currency=Currency.EUR),
+        quantity=Power(mw=Decimal(mw)),
+        state=state,
+    )
+
+
+@pytest.fixture
+def start() -> datetime:
+    """Get the start time of the orders and trades, and of their delivery.
+
+    Returns:
+        The start time.
+    """
+    return _START
+
+
+@pytest.fixture
+def area() -> DeliveryArea:
+    """Get the delivery area of the orders and trades.
+
+    Returns:
+        The delivery area.
+    """
+    return _AREA
+
+
+@pytest.fixture
+def make_delivery_period() -> Callable[..., DeliveryPeriod]:
+    """Get a function creating a delivery period of the orders and trades.
+
+    Returns:
+        The function, taking the start of the period in minutes after the start.
+    """
+    return _delivery_period
+
+
+@pytest.fixture
+def make_order_detail() -> Callable[..., OrderDetail]:
+    """Get a function creating an order.
+
+    Returns:
+        The function, taking the ID and the fields to change.
+    """
+    return _order_detail
+
+
+@pytest.fixture
+def make_trade() -> Callable[..., Trade]:
+    """Get a function creating a gridpool trade.
+
+    Returns:
+        The function, taking the ID and the fields to change.
+    """
+    return _trade
+
+
+@pytest.fixture
+def make_public_trade() -> Callable[..., PublicTrade]:
+    """Get a function creating a public trade.
+
+    Returns:
+        The function, taking the ID and the fields to change.
+    """
+    return _public_trade
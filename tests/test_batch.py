@@ -0,0 +1,265 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the columnar batches."""
+
+from datetime import datetime, timedelta
+from typing import Callable
+from unittest.mock import AsyncMock
+
+import numpy as np
+import pandas as pd
+import pytest
+
+# pylint: disable=no-member
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+
+from frequenz.client.electricity_trading import (
+    Client,
+    Currency,
+    DeliveryArea,
+    DeliveryDuration,
+    EnergyMarketCodeType,
+    MarketActor,
+    MarketSide,
+    OrderDetail,
+    OrderDetailBatch,
+    OrderState,
+    OrderType,
+    PublicTrade,
+    PublicTradeBatch,
+    StateReason,
+    Trade,
+    TradeBatch,
+    TradeState,
+)
+
+_FR = DeliveryArea(code="10YFR-RTE------C", code_type=EnergyMarketCodeType.EUROPE_EIC)
+
+
+def _ns(time: datetime) -> int:
+    """Get a time in nanoseconds since the epoch.
+
+    Args:
+        time: The time.
+
+    Returns:
+        The nanoseconds since the epoch.
+    """
+    return int(time.timestamp()) * 1_000_000_000
+
+
+def test_public_trade_batch_columns(
+    start: datetime, area: DeliveryArea, make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test decoding public trades into columns."""
+    batch = PublicTradeBatch.from_pb(
+        [
+            make_public_trade(
+                1,
+                sell_area=_FR,
+                minutes=15,
+                price="50.25",
+                mw="0.1",
+                executed=timedelta(microseconds=1),
+            ).to_pb(),
+            make_public_trade(
+                2,
+                buy_area=_FR,
+                sell_area=_FR,
+                price="50.25",
+                mw="0.2",
+                executed=timedelta(microseconds=2),
+            ).to_pb(),
+        ]
+    )
+
+    assert len(batch) == 2
+    assert batch.areas == (area, _FR)
+    assert batch.public_trade_id.tolist() == [1, 2]
+    assert batch.buy_delivery_area.tolist() == [0, 1]
+    assert batch.sell_delivery_area.tolist() == [1, 1]
+    assert batch.execution_time.tolist() == [_ns(start) + 1_000, _ns(start) + 2_000]
+    assert batch.delivery_start.tolist() == [
+        _ns(start + timedelta(minutes=15)),
+        _ns(start),
+    ]
+    assert batch.delivery_duration.tolist() == [DeliveryDuration.MINUTES_15.value] * 2
+    assert batch.price.tolist() == [50.25, 50.25]
+    assert batch.currency.tolist() == [Currency.EUR.value] * 2
+    assert batch.quantity.tolist() == [0.1, 0.2]
+    assert batch.state.tolist() == [TradeState.ACTIVE.value] * 2
+    assert batch.to_numpy()["price"] is batch.price
+
+
+def test_public_trade_batch_to_pandas(
+    start: datetime, area: DeliveryArea, make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test converting a batch to a data frame without copying the columns."""
+    batch = PublicTradeBatch.from_pb(
+        [
+            make_public_trade(1, executed=timedelta(microseconds=1)).to_pb(),
+            make_public_trade(2, buy_area=_FR).to_pb(),
+        ]
+    )
+    frame = batch.to_pandas()
+
+    assert frame["buy_delivery_area"].tolist() == [area.code, _FR.code]
+    assert frame["execution_time"][0] == pd.Timestamp(_ns(start) + 1_000)
+    assert np.shares_memory(frame["price"].to_numpy(), batch.price)
+
+
+def test_public_trade_batch_concat(
+    area: DeliveryArea, make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test that concatenating batches merges their delivery areas."""
+    first = PublicTradeBatch.from_pb([make_public_trade(1).to_pb()])
+    second = PublicTradeBatch.from_pb([make_public_trade(2, buy_area=_FR).to_pb()])
+    batch = PublicTradeBatch.concat([first, second])
+
+    assert len(batch) == 2
+    assert batch.areas == (area, _FR)
+    assert batch.buy_delivery_area.tolist() == [0, 1]
+    assert batch.sell_delivery_area.tolist() == [0, 0]
+    with pytest.raises(ValueError):
+        PublicTradeBatch.concat([])
+
+
+def test_public_trade_batch_to_arrow(
+    make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test converting a batch to an Arrow table."""
+    pytest.importorskip("pyarrow")
+    batch = PublicTradeBatch.from_pb([make_public_trade(1, sell_area=_FR).to_pb()])
+    table = batch.to_arrow()
+    assert table.num_rows == 1
+    assert table.column("sell_delivery_area").to_pylist() == [_FR.code]
+
+
+async def test_list_public_trades_batches(
+    make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test that every page of public trades is decoded into a batch."""
+    client = Client("grpc://batch.host:50051?ssl=false", connect=False)
+    stub = AsyncMock()
+    stub.ListPublicTrades.return_value = (
+        electricity_trading_pb2.ListPublicTradesResponse(
+            public_trades=[make_public_trade(1).to_pb(), make_public_trade(2).to_pb()]
+        )
+    )
+    client._stub = stub  # pylint: disable=protected-access
+
+    batches = [batch async for batch in client.list_public_trades_batches()]
+    assert len(batches) == 1
+    assert batches[0].public_trade_id.tolist() == [1, 2]
+    await client.close()
+
+
+def test_trade_batch_columns(
+    start: datetime, area: DeliveryArea, make_trade: Callable[..., Trade]
+) -> None:
+    """Test decoding gridpool trades into columns."""
+    batch = TradeBatch.from_pb(
+        [
+            make_trade(
+                1,
+                side=MarketSide.SELL,
+                area=_FR,
+                price="-3.5",
+                mw="2",
+                executed=timedelta(seconds=1),
+            ).to_pb(),
+            make_trade(
+                2,
+                side=MarketSide.SELL,
+                price="-3.5",
+                mw="2",
+                executed=timedelta(seconds=2),
+            ).to_pb(),
+        ]
+    )
+
+    assert len(batch) == 2
+    assert batch.areas == (_FR, area)
+    assert batch.id.tolist() == [1, 2]
+    assert batch.order_id.tolist() == [1, 2]
+    assert batch.side.tolist() == [MarketSide.SELL.value] * 2
+    assert batch.delivery_area.tolist() == [0, 1]
+    assert batch.delivery_start.tolist() == [_ns(start)] * 2
+    assert batch.delivery_duration.tolist() == [DeliveryDuration.MINUTES_15.value] * 2
+    assert batch.execution_time.tolist() == [
+        _ns(start) + 1_000_000_000,
+        _ns(start) + 2_000_000_000,
+    ]
+    assert batch.price.tolist() == [-3.5, -3.5]
+    assert batch.quantity.tolist() == [2.0, 2.0]
+
+    frame = batch.to_pandas()
+    assert frame["delivery_area"].tolist() == [_FR.code, area.code]
+    assert frame["delivery_start"][0] == pd.Timestamp(_ns(start))
+
+
+def test_order_detail_batch_columns(
+    start: datetime,
+    area: DeliveryArea,
+    make_order_detail: Callable[..., OrderDetail],
+) -> None:
+    """Test decoding gridpool orders into columns."""
+    batch = OrderDetailBatch.from_pb(
+        [
+            make_order_detail(
+                order_id,
+                price="42",
+                mw="1.5",
+                tag="batch",
+                modified=timedelta(seconds=order_id),
+            ).to_pb()
+            for order_id in (1, 2)
+        ]
+    )
+
+    assert len(batch) == 2
+    assert batch.areas == (area,)
+    assert batch.order_id.tolist() == [1, 2]
+    assert batch.delivery_area.tolist() == [0, 0]
+    assert batch.type.tolist() == [OrderType.LIMIT.value] * 2
+    assert batch.side.tolist() == [MarketSide.BUY.value] * 2
+    assert batch.price.tolist() == [42.0, 42.0]
+    assert batch.quantity.tolist() == [1.5, 1.5]
+    assert batch.open_quantity.tolist() == [1.5, 1.5]
+    assert batch.filled_quantity.tolist() == [0.0, 0.0]
+    assert batch.state.tolist() == [OrderState.ACTIVE.value] * 2
+    assert batch.state_reason.tolist() == [StateReason.ADD.value] * 2
+    assert batch.market_actor.tolist() == [MarketActor.USER.value] * 2
+    assert batch.create_time.tolist() == [_ns(start)] * 2
+    assert batch.modification_time.tolist() == [
+        _ns(start) + 1_000_000_000,
+        _ns(start) + 2_000_000_000,
+    ]
+
+
+async def test_list_gridpool_batches(
+    make_order_detail: Callable[..., OrderDetail], make_trade: Callable[..., Trade]
+) -> None:
+    """Test that every page of gridpool trades and orders is decoded into a batch."""
+    client = Client("grpc://batch.host:50051?ssl=false", connect=False)
+    stub = AsyncMock()
+    stub.ListGridpoolTrades.return_value = (
+        electricity_trading_pb2.ListGridpoolTradesResponse(
+            trades=[make_trade(1).to_pb(), make_trade(2, area=_FR).to_pb()]
+        )
+    )
+    stub.ListGridpoolOrders.return_value = (
+        electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_details=[make_order_detail(3).to_pb()]
+        )
+    )
+    client._stub = stub  # pylint: disable=protected-access
+
+    trades = [batch async for batch in client.list_gridpool_trades_batches(1)]
+    assert len(trades) == 1
+    assert trades[0].id.tolist() == [1, 2]
+    orders = [batch async for batch in client.list_gridpool_orders_batches(1)]
+    assert len(orders) == 1
+    assert orders[0].order_id.tolist() == [3]
+    await client.close()
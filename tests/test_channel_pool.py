@@ -0,0 +1,108 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the pool of gRPC channels."""
+
+import grpc
+import pytest
+from frequenz.client.base.channel import ChannelOptions
+
+from frequenz.client.electricity_trading._channel_pool import (
+    ChannelPool,
+    create_channel,
+)
+
+_URL = "grpc://localhost:50051?ssl=false"
+
+
+async def test_lease_least_in_flight() -> None:
+    """Test that unary calls go to the channel with the fewest calls in flight."""
+    pool: ChannelPool[grpc.aio.Channel] = ChannelPool(
+        lambda channel: channel, channels=3
+    )
+    pool.connect(_URL)
+
+    with pool.lease() as first, pool.lease() as second:
+        assert first is not second
+        assert pool.in_flight == [1, 1, 0]
+        with pool.lease() as third, pool.lease() as fourth:
+            assert len({first, second, third}) == 3
+            assert fourth is first
+            assert pool.in_flight == [2, 1, 1]
+    assert pool.in_flight == [0, 0, 0]
+
+    await pool.close()
+    assert not pool.is_connected
+
+
+async def test_streams_are_pinned_to_dedicated_channels() -> None:
+    """Test that streams are assigned round-robin to the stream channels."""
+    pool: ChannelPool[grpc.aio.Channel] = ChannelPool(
+        lambda channel: channel, channels=2, stream_channels=2
+    )
+    pool.connect(_URL)
+
+    streams = [pool.stream_stub() for _ in range(4)]
+    with pool.lease() as unary:
+        assert unary not in streams
+    assert streams[0] is streams[2]
+    assert streams[1] is streams[3]
+    assert streams[0] is not streams[1]
+
+    await pool.close()
+
+
+async def test_channels_have_their_own_connection() -> None:
+    """Test that the channels of a pool to an IP address don't share connections."""
+    peers: list[str] = []
+
+    async def echo(
+        request: bytes, context: grpc.aio.ServicerContext[bytes, bytes]
+    ) -> bytes:
+        peers.append(context.peer())
+        return request
+
+    server = grpc.aio.server()
+    server.add_generic_rpc_handlers(
+        (
+            grpc.method_handlers_generic_handler(
+                "test.Echo", {"Echo": grpc.unary_unary_rpc_method_handler(echo)}
+            ),
+        )
+    )
+    port = server.add_insecure_port("127.0.0.1:0")
+    await server.start()
+    try:
+        pool: ChannelPool[grpc.aio.Channel] = ChannelPool(
+            lambda channel: channel, channels=4
+        )
+        pool.connect(f"grpc://127.0.0.1:{port}?ssl=false")
+        for _ in range(4):
+            with pool.lease() as channel:
+                await channel.unary_unary("/test.Echo/Echo", None, None)(b"ping")
+        await pool.close()
+    finally:
+        await server.stop(None)
+
+    assert len(set(peers)) == 4
+
+
+def test_create_channel_validation() -> None:
+    """Test that invalid URIs are rejected like by `parse_grpc_uri()`."""
+    for url in (
+        "http://localhost:50051",
+        "grpc://localhost",
+        "grpc://localhost:50051/path",
+        "grpc://localhost:50051?unknown=1",
+        "grpc://localhost:50051?ssl=false&ssl_root_certificates_path=ca.pem",
+    ):
+        with pytest.raises(ValueError):
+            create_channel(url, ChannelOptions())
+
+
+def test_channel_pool_validation() -> None:
+    """Test that invalid pool sizes are rejected."""
+    with pytest.raises(ValueError):
+        ChannelPool(lambda channel: channel, channels=0)
+    with pytest.raises(ValueError):
+        ChannelPool(lambda channel: channel, channels=1, stream_channels=-1)
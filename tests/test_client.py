@@ -8,15 +8,22 @@ from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from unittest.mock import AsyncMock
 
+import grpc
 import pytest
 
 # pylint: disable=no-member
+from frequenz.api.common.v1.pagination.pagination_info_pb2 import PaginationInfo
 from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+from frequenz.client.base import retry
+from frequenz.client.base.exception import ClientNotConnected
 from google.protobuf import timestamp_pb2
 from typing_extensions import Any, Generator
 
 from frequenz.client.electricity_trading import (
+    CallOptions,
     Client,
+    ConnectionLane,
+    ConnectionLanes,
     Currency,
     DeliveryArea,
     DeliveryPeriod,
@@ -30,6 +37,10 @@ from frequenz.client.electricity_trading import (
     OrderType,
     Power,
     Price,
+    PublicTrade,
+    RateLimit,
+    RateLimits,
+    RetryPolicy,
     StateDetail,
     StateReason,
     TradeState,
@@ -229,6 +240,78 @@ def test_create_gridpool_order(
     assert args[0].order.execution_option == set_up.order_execution_option.to_pb()
 
 
+async def test_create_gridpool_orders(set_up: SetupParams) -> None:
+    """Test creating many orders, where one of them fails."""
+    in_flight = 0
+    max_in_flight = 0
+
+    async def create_order(
+        request: electricity_trading_pb2.CreateGridpoolOrderRequest, **_: Any
+    ) -> electricity_trading_pb2.CreateGridpoolOrderResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if request.order.tag == "fail":
+            raise RuntimeError("order rejected")
+        return electricity_trading_pb2.CreateGridpoolOrderResponse(
+            order_detail=set_up_order_detail_response(set_up)
+        )
+
+    set_up.mock_stub.CreateGridpoolOrder.side_effect = create_order
+
+    orders = [
+        Order(
+            delivery_area=set_up.delivery_area,
+            delivery_period=set_up.delivery_period,
+            type=set_up.order_type,
+            side=set_up.side,
+            price=set_up.price,
+            quantity=set_up.quantity,
+            tag=tag,
+        )
+        for tag in ["a", "fail", "b", "c"]
+    ]
+
+    result = await set_up.client.create_gridpool_orders(
+        set_up.gridpool_id, orders, max_concurrency=2
+    )
+
+    assert max_in_flight == 2
+    assert [outcome.request for outcome in result.outcomes] == orders
+    assert [outcome.succeeded for outcome in result.outcomes] == [
+        True,
+        False,
+        True,
+        True,
+    ]
+    assert len(result.results) == 3
+    assert isinstance(result.failed[0].error, RuntimeError)
+    assert all(outcome.latency > timedelta(0) for outcome in result.outcomes)
+    assert result.elapsed >= max(outcome.latency for outcome in result.outcomes)
+
+
+async def test_create_gridpool_orders_validates_first(set_up: SetupParams) -> None:
+    """Test that no order is sent if any of them is invalid."""
+    orders = [
+        Order(
+            delivery_area=set_up.delivery_area,
+            delivery_period=set_up.delivery_period,
+            type=set_up.order_type,
+            side=set_up.side,
+            price=price,
+            quantity=set_up.quantity,
+        )
+        for price in [set_up.price, Price(Decimal("50.123"), Currency.EUR)]
+    ]
+
+    with pytest.raises(ValueError):
+        await set_up.client.create_gridpool_orders(set_up.gridpool_id, orders)
+
+    set_up.mock_stub.CreateGridpoolOrder.assert_not_called()
+
+
 def test_update_gridpool_order(
     set_up: SetupParams,
 ) -> None:
@@ -263,6 +346,59 @@ def test_update_gridpool_order(
     ), "Price field should not be set."
 
 
+async def test_update_gridpool_orders(set_up: SetupParams) -> None:
+    """Test updating many orders, sharing the field masks of equal updates."""
+
+    async def update_order(
+        request: electricity_trading_pb2.UpdateGridpoolOrderRequest, **_: Any
+    ) -> electricity_trading_pb2.UpdateGridpoolOrderResponse:
+        return electricity_trading_pb2.UpdateGridpoolOrderResponse(
+            order_detail=set_up_order_detail_response(set_up, request.order_id)
+        )
+
+    set_up.mock_stub.UpdateGridpoolOrder.side_effect = update_order
+
+    new_price = Price(amount=Decimal("51"), currency=Currency.EUR)
+    result = await set_up.client.update_gridpool_orders(
+        set_up.gridpool_id,
+        [
+            (1, {"price": new_price}),
+            (2, {"price": new_price, "tag": None}),
+            (3, {"price": new_price}),
+        ],
+    )
+
+    assert [order.order_id for order in result.results] == [1, 2, 3]
+    requests = {
+        call.args[0].order_id: call.args[0]
+        for call in set_up.mock_stub.UpdateGridpoolOrder.call_args_list
+    }
+    assert requests[1].update_mask.paths == ["price"]
+    assert requests[2].update_mask.paths == ["price", "tag"]
+    assert requests[3].update_mask.paths == ["price"]
+    assert requests[1].update_order_fields.price == new_price.to_pb()
+
+
+@pytest.mark.parametrize(
+    "changes",
+    [
+        {},
+        {"colour": "blue"},
+        {"price": Price(amount=Decimal("50.123"), currency=Currency.EUR)},
+    ],
+)
+async def test_update_gridpool_orders_invalid(
+    set_up: SetupParams, changes: dict[str, Any]
+) -> None:
+    """Test that no update is sent if any of them is invalid."""
+    with pytest.raises(ValueError):
+        await set_up.client.update_gridpool_orders(
+            set_up.gridpool_id, [(1, {"tag": "valid"}), (2, changes)]
+        )
+
+    set_up.mock_stub.UpdateGridpoolOrder.assert_not_called()
+
+
 def test_cancel_gridpool_order(
     set_up: SetupParams,
 ) -> None:
@@ -291,6 +427,49 @@ def test_cancel_gridpool_order(
     assert args[0].order_id == order_id
 
 
+async def test_cancel_gridpool_orders_by_filter(
+    set_up: SetupParams, caplog: pytest.LogCaptureFixture
+) -> None:
+    """Test cancelling the open orders matching a filter, without logging failures."""
+    set_up.mock_stub.ListGridpoolOrders.return_value = (
+        electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_details=[
+                set_up_order_detail_response(set_up, order_id=order_id)
+                for order_id in (1, 2, 3)
+            ]
+        )
+    )
+
+    async def cancel_order(
+        request: electricity_trading_pb2.CancelGridpoolOrderRequest, **_: Any
+    ) -> electricity_trading_pb2.CancelGridpoolOrderResponse:
+        if request.order_id == 2:
+            raise _rpc_error(grpc.StatusCode.FAILED_PRECONDITION)
+        return electricity_trading_pb2.CancelGridpoolOrderResponse(
+            order_detail=set_up_order_detail_response(set_up, request.order_id)
+        )
+
+    set_up.mock_stub.CancelGridpoolOrder.side_effect = cancel_order
+
+    result = await set_up.client.cancel_gridpool_orders_by_filter(
+        set_up.gridpool_id,
+        delivery_period=set_up.delivery_period,
+        tag="ladder",
+    )
+
+    args, _ = set_up.mock_stub.ListGridpoolOrders.call_args
+    assert args[0].filter.tag == "ladder"
+    assert args[0].filter.delivery_period == set_up.delivery_period.to_pb()
+    assert args[0].filter.states == [
+        state.to_pb()
+        for state in [OrderState.PENDING, OrderState.ACTIVE, OrderState.HIBERNATE]
+    ]
+    assert [outcome.request for outcome in result.outcomes] == [1, 2, 3]
+    assert [order.order_id for order in result.results] == [1, 3]
+    assert [outcome.request for outcome in result.failed] == [2]
+    assert "cancelling gridpool order" not in caplog.text
+
+
 @pytest.mark.asyncio
 async def test_list_gridpool_orders(
     set_up: SetupParams,
@@ -324,6 +503,182 @@ async def test_list_gridpool_orders(
     assert len(orders) == len(mock_response.order_details)
 
 
+def _rpc_error(code: grpc.StatusCode) -> grpc.aio.AioRpcError:
+    """Create the error of a failed gRPC call."""
+    return grpc.aio.AioRpcError(
+        code, grpc.aio.Metadata(), grpc.aio.Metadata(), None, None
+    )
+
+
+@pytest.mark.parametrize("prefetch", [0, 2])
+async def test_list_gridpool_orders_pagination(
+    set_up: SetupParams, prefetch: int
+) -> None:
+    """Test that listing gridpool orders follows the page tokens in order."""
+    pages = [
+        electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_details=[set_up_order_detail_response(set_up, order_id=order_id)],
+            pagination_info=PaginationInfo(next_page_token=next_page_token),
+        )
+        for order_id, next_page_token in [(1, "page-2"), (2, "page-3"), (3, "")]
+    ]
+    requested_tokens: list[str] = []
+
+    async def list_orders(
+        request: electricity_trading_pb2.ListGridpoolOrdersRequest, **_: Any
+    ) -> electricity_trading_pb2.ListGridpoolOrdersResponse:
+        requested_tokens.append(request.pagination_params.page_token)
+        return pages[len(requested_tokens) - 1]
+
+    set_up.mock_stub.ListGridpoolOrders.side_effect = list_orders
+
+    orders = [
+        order.order_id
+        async for order in set_up.client.list_gridpool_orders(
+            gridpool_id=set_up.gridpool_id, prefetch=prefetch
+        )
+    ]
+
+    assert orders == [1, 2, 3]
+    assert requested_tokens == ["", "page-2", "page-3"]
+
+
+@pytest.mark.parametrize("partial", [False, True])
+async def test_list_gridpool_orders_deadline(
+    set_up: SetupParams, partial: bool
+) -> None:
+    """Test that a listing stops when its overall deadline expires."""
+    requested_tokens: list[str] = []
+
+    async def list_orders(
+        request: electricity_trading_pb2.ListGridpoolOrdersRequest,
+        timeout: float | None = None,
+        **_: Any,
+    ) -> electricity_trading_pb2.ListGridpoolOrdersResponse:
+        requested_tokens.append(request.pagination_params.page_token)
+        # Emulate the gRPC deadline of the call
+        try:
+            await asyncio.wait_for(asyncio.sleep(0.1), timeout)
+        except asyncio.TimeoutError:
+            raise _rpc_error(grpc.StatusCode.DEADLINE_EXCEEDED) from None
+        return electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_details=[
+                set_up_order_detail_response(set_up, order_id=len(requested_tokens))
+            ],
+            pagination_info=PaginationInfo(
+                next_page_token=f"page-{len(requested_tokens) + 1}"
+            ),
+        )
+
+    set_up.mock_stub.ListGridpoolOrders.side_effect = list_orders
+
+    orders: list[int] = []
+
+    async def consume() -> None:
+        async for order in set_up.client.list_gridpool_orders(
+            gridpool_id=set_up.gridpool_id,
+            timeout=timedelta(seconds=1),
+            deadline=timedelta(seconds=0.35),
+            partial=partial,
+        ):
+            orders.append(order.order_id)
+
+    if partial:
+        await consume()
+    else:
+        with pytest.raises(asyncio.TimeoutError):
+            await consume()
+
+    # The fourth page would end after the deadline, so it is cut short.
+    assert orders == [1, 2, 3]
+    assert len(requested_tokens) == 4
+
+
+async def test_list_gridpool_orders_retry(set_up: SetupParams) -> None:
+    """Test that a listing resumes from the page that failed with a transient error."""
+    client = Client(
+        "grpc://retrying.host",
+        connect=False,
+        retry_policy=RetryPolicy(
+            strategy=retry.LinearBackoff(interval=0.0, jitter=0.0, limit=1)
+        ),
+    )
+    mock_stub = AsyncMock()
+    client._stub = mock_stub  # pylint: disable=protected-access
+    pages = {
+        "": electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_details=[set_up_order_detail_response(set_up, order_id=1)],
+            pagination_info=PaginationInfo(next_page_token="page-2"),
+        ),
+        "page-2": electricity_trading_pb2.ListGridpoolOrdersResponse(
+            order_details=[set_up_order_detail_response(set_up, order_id=2)],
+        ),
+    }
+    requested_tokens: list[str] = []
+
+    async def list_orders(
+        request: electricity_trading_pb2.ListGridpoolOrdersRequest, **_: Any
+    ) -> electricity_trading_pb2.ListGridpoolOrdersResponse:
+        requested_tokens.append(request.pagination_params.page_token)
+        if requested_tokens == ["", "page-2"]:
+            raise _rpc_error(grpc.StatusCode.UNAVAILABLE)
+        return pages[request.pagination_params.page_token]
+
+    mock_stub.ListGridpoolOrders.side_effect = list_orders
+
+    orders = [
+        order.order_id
+        async for order in client.list_gridpool_orders(gridpool_id=set_up.gridpool_id)
+    ]
+
+    assert orders == [1, 2]
+    assert requested_tokens == ["", "page-2", "page-2"]
+
+
+async def test_list_public_trades_in_range(set_up: SetupParams) -> None:
+    """Test listing the public trades of a time range, one request per period."""
+    requested_periods: list[DeliveryPeriod] = []
+
+    async def list_trades(
+        request: electricity_trading_pb2.ListPublicTradesRequest, **_: Any
+    ) -> electricity_trading_pb2.ListPublicTradesResponse:
+        delivery_period = DeliveryPeriod.from_pb(request.filter.delivery_period)
+        requested_periods.append(delivery_period)
+        return electricity_trading_pb2.ListPublicTradesResponse(
+            public_trades=[
+                PublicTrade(
+                    public_trade_id=len(requested_periods),
+                    buy_delivery_area=set_up.delivery_area,
+                    sell_delivery_area=set_up.delivery_area,
+                    delivery_period=delivery_period,
+                    execution_time=delivery_period.start - timedelta(hours=1),
+                    price=set_up.price,
+                    quantity=set_up.quantity,
+                    state=TradeState.ACTIVE,
+                ).to_pb()
+            ]
+        )
+
+    set_up.mock_stub.ListPublicTrades.side_effect = list_trades
+
+    start = set_up.delivery_period.start
+    trades = [
+        trade
+        async for trade in set_up.client.list_public_trades_in_range(
+            start, start + timedelta(hours=1), max_concurrency=2
+        )
+    ]
+
+    expected_periods = [
+        DeliveryPeriod(start + timedelta(minutes=minutes), timedelta(minutes=15))
+        for minutes in (0, 15, 30, 45)
+    ]
+    assert sorted(requested_periods, key=lambda period: period.start) == (
+        expected_periods
+    )
+    assert [trade.delivery_period for trade in trades] == expected_periods
+
+
 @pytest.mark.parametrize(
     "price, quantity, delivery_period, valid_until, execution_option, expected_exception",
     [
@@ -460,3 +815,181 @@ def test_update_gridpool_order_with_invalid_params(  # pylint: disable=too-many-
                 valid_until=valid_until,
             )
         )
+
+
+@pytest.mark.asyncio
+async def test_rate_limits(set_up: SetupParams) -> None:
+    """Test that requests are rate limited per kind of request."""
+    client = Client(
+        "grpc://rate-limited.host",
+        connect=False,
+        rate_limits=RateLimits(order_entry=RateLimit(rate=20), reads=None),
+    )
+    mock_stub = AsyncMock()
+    client._stub = mock_stub  # pylint: disable=protected-access
+    mock_stub.CancelGridpoolOrder.return_value = (
+        electricity_trading_pb2.CancelGridpoolOrderResponse(
+            order_detail=set_up_order_detail_response(set_up)
+        )
+    )
+    mock_stub.CancelAllGridpoolOrders.return_value = (
+        electricity_trading_pb2.CancelAllGridpoolOrdersResponse(gridpool_id=1)
+    )
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    order = await client.cancel_gridpool_order(1, 1)
+    await client.cancel_all_gridpool_orders(1)
+    await client.cancel_all_gridpool_orders(1)
+    elapsed = loop.time() - start
+
+    assert order.order_id == 1
+    # Only the first request is sent right away, the others wait for a token.
+    assert elapsed >= 0.09
+    stats = client.rate_limiter_stats
+    assert list(stats) == ["order_entry"]
+    assert stats["order_entry"].requests == 3
+    assert stats["order_entry"].delayed_requests == 2
+    assert stats["order_entry"].max_delay >= timedelta(seconds=0.04)
+
+
+async def test_call_options() -> None:
+    """Test that the call options are passed to the gRPC calls."""
+    client = Client(
+        "grpc://call-options.host",
+        connect=False,
+        auth_key="secret",
+        call_options=CallOptions(
+            timeout=timedelta(seconds=5),
+            compression=grpc.Compression.Gzip,
+            metadata=(("client", "default"),),
+        ),
+    )
+    mock_stub = AsyncMock()
+    client._stub = mock_stub  # pylint: disable=protected-access
+    mock_stub.CancelAllGridpoolOrders.return_value = (
+        electricity_trading_pb2.CancelAllGridpoolOrdersResponse(gridpool_id=1)
+    )
+
+    await client.cancel_all_gridpool_orders(1)
+    _, kwargs = mock_stub.CancelAllGridpoolOrders.call_args
+    assert kwargs == {
+        "timeout": 5.0,
+        "metadata": (("key", "secret"), ("client", "default")),
+        "compression": grpc.Compression.Gzip,
+    }
+
+    await client.cancel_all_gridpool_orders(
+        1,
+        timeout=timedelta(seconds=1),
+        call_options=CallOptions(wait_for_ready=True, metadata=(("call", "1"),)),
+    )
+    _, kwargs = mock_stub.CancelAllGridpoolOrders.call_args
+    assert kwargs == {
+        "timeout": 1.0,
+        "metadata": (("key", "secret"), ("client", "default"), ("call", "1")),
+        "compression": grpc.Compression.Gzip,
+        "wait_for_ready": True,
+    }
+
+
+async def test_deadline_exceeded_raises_timeout(set_up: SetupParams) -> None:
+    """Test that a call exceeding its gRPC deadline raises a timeout error."""
+    set_up.mock_stub.CancelAllGridpoolOrders.side_effect = _rpc_error(
+        grpc.StatusCode.DEADLINE_EXCEEDED
+    )
+
+    with pytest.raises(asyncio.TimeoutError):
+        await set_up.client.cancel_all_gridpool_orders(
+            set_up.gridpool_id, timeout=timedelta(seconds=1)
+        )
+
+
+async def test_channel_pool() -> None:
+    """Test that the channel pool is connected and closed with the client."""
+    client = Client("grpc://pooled.host:50051?ssl=false", channels=2, stream_channels=1)
+    pool = client._channel_pool  # pylint: disable=protected-access
+    assert pool is not None
+    assert pool.is_connected
+    assert client.is_connected
+    # All the requests go through the pool, so there is no shared channel.
+    with pytest.raises(ClientNotConnected):
+        _ = client.channel
+
+    await client.disconnect()
+    assert not pool.is_connected
+    assert not client.is_connected
+
+
+async def test_connection_lanes(set_up: SetupParams) -> None:
+    """Test that requests use the lane of their kind and its concurrency limit."""
+    client = Client(
+        "grpc://laned.host:50051?ssl=false",
+        lanes=ConnectionLanes(
+            order_entry=ConnectionLane(max_concurrency=1),
+            market_data=ConnectionLane(channels=2),
+        ),
+    )
+    order_entry_stub = AsyncMock()
+    market_data_stub = AsyncMock()
+    # pylint: disable=protected-access
+    pools = list(client._lane_pools.values())
+    pools[0]._stubs = [order_entry_stub]
+    pools[1]._stubs = [market_data_stub, market_data_stub]
+    # pylint: enable=protected-access
+
+    in_flight = 0
+    max_in_flight = 0
+
+    async def cancel_all(
+        request: electricity_trading_pb2.CancelAllGridpoolOrdersRequest, **_: Any
+    ) -> electricity_trading_pb2.CancelAllGridpoolOrdersResponse:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return electricity_trading_pb2.CancelAllGridpoolOrdersResponse(
+            gridpool_id=request.gridpool_id
+        )
+
+    order_entry_stub.CancelAllGridpoolOrders.side_effect = cancel_all
+    market_data_stub.GetGridpoolOrder.return_value = (
+        electricity_trading_pb2.GetGridpoolOrderResponse(
+            order_detail=set_up_order_detail_response(set_up)
+        )
+    )
+
+    await asyncio.gather(*(client.cancel_all_gridpool_orders(1) for _ in range(3)))
+    await client.get_gridpool_order(1, 1)
+
+    assert order_entry_stub.CancelAllGridpoolOrders.call_count == 3
+    assert max_in_flight == 1
+    market_data_stub.GetGridpoolOrder.assert_called_once()
+    order_entry_stub.GetGridpoolOrder.assert_not_called()
+
+    await client.disconnect()
+
+
+async def test_client_registry() -> None:
+    """Test that shared clients keep their streams and are closed by their last user."""
+    first = Client("grpc://shared.host:50051?ssl=false")
+    # pylint: disable=protected-access
+    streams = first._streams
+    second = Client("grpc://shared.host:50051?ssl=false")
+    assert second is first
+    assert second._streams is streams
+    # Getting the client doesn't take a reference to it.
+    assert Client._registry.refs(first._registry_key) == 0
+    # pylint: enable=protected-access
+
+    async with first:
+        async with second:
+            pass
+        assert first.is_connected
+    assert not first.is_connected
+
+    third = Client("grpc://shared.host:50051?ssl=false", connect=False)
+    assert third is not first
+    await third.close()
+    assert Client("grpc://shared.host:50051?ssl=false", connect=False) is not third
@@ -0,0 +1,69 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the time budgets shared by several requests."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+
+from frequenz.client.electricity_trading import Client, RateLimit, RateLimits
+from frequenz.client.electricity_trading._deadline import Deadline
+
+
+async def test_deadline_caps_timeouts() -> None:
+    """Test that request timeouts are capped to the time left."""
+    deadline = Deadline(timedelta(seconds=10))
+
+    assert deadline.timeout(timedelta(seconds=1)) == timedelta(seconds=1)
+    assert timedelta(seconds=9) < deadline.timeout() <= timedelta(seconds=10)
+    assert timedelta(seconds=9) < deadline.timeout(timedelta(seconds=30))
+    assert not deadline.expired
+
+
+async def test_deadline_expires() -> None:
+    """Test that no timeout is given once the deadline has expired."""
+    deadline = Deadline(timedelta(milliseconds=10))
+    await asyncio.sleep(0.02)
+
+    assert deadline.expired
+    assert deadline.remaining == timedelta()
+    with pytest.raises(asyncio.TimeoutError):
+        deadline.timeout(timedelta(seconds=1))
+
+
+async def test_deadline_validation() -> None:
+    """Test that invalid budgets are rejected."""
+    with pytest.raises(ValueError):
+        Deadline(timedelta())
+
+
+async def test_deadline_bounds_rate_limiter_wait() -> None:
+    """Test that the wait for the rate limiter doesn't outlast the deadline."""
+    client = Client(
+        "grpc://deadline-rate-limited.host",
+        connect=False,
+        rate_limits=RateLimits(reads=RateLimit(rate=1)),
+    )
+    mock_stub = AsyncMock()
+    client._stub = mock_stub  # pylint: disable=protected-access
+    mock_stub.ListGridpoolOrders.return_value = (
+        electricity_trading_pb2.ListGridpoolOrdersResponse()
+    )
+    deadline = timedelta(milliseconds=100)
+
+    async for _ in client.list_gridpool_orders(1, deadline=deadline):
+        pass
+
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    with pytest.raises(asyncio.TimeoutError):
+        # The next token is only available after a second.
+        async for _ in client.list_gridpool_orders(1, deadline=deadline):
+            pass
+
+    assert loop.time() - start < 0.5
+    assert mock_stub.ListGridpoolOrders.call_count == 1
@@ -0,0 +1,136 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the fan-out helpers."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable
+
+import pytest
+
+from frequenz.client.electricity_trading import DeliveryPeriod
+from frequenz.client.electricity_trading._fan_out import (
+    delivery_periods,
+    merge_iterators,
+)
+
+START = datetime(2025, 1, 1, tzinfo=timezone.utc)
+
+
+def test_delivery_periods() -> None:
+    """Test splitting a time range into delivery periods."""
+    periods = delivery_periods(START, START + timedelta(hours=1), timedelta(minutes=15))
+
+    assert periods == [
+        DeliveryPeriod(START + timedelta(minutes=minutes), timedelta(minutes=15))
+        for minutes in (0, 15, 30, 45)
+    ]
+    assert (
+        len(delivery_periods(START, START + timedelta(days=1), timedelta(minutes=15)))
+        == 96
+    )
+
+    with pytest.raises(ValueError):
+        delivery_periods(START, START, timedelta(minutes=15))
+
+
+def _source(
+    items: list[int], delays: list[float], running: list[int], peak: list[int]
+) -> Callable[[], AsyncIterator[int]]:
+    async def iterate() -> AsyncIterator[int]:
+        running.append(1)
+        peak[0] = max(peak[0], len(running))
+        try:
+            for item, delay in zip(items, delays):
+                await asyncio.sleep(delay)
+                yield item
+        finally:
+            running.pop()
+
+    return iterate
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_merge_iterators(ordered: bool) -> None:
+    """Test merging iterators with bounded concurrency."""
+    running: list[int] = []
+    peak = [0]
+    factories = [
+        _source([1, 2], [0.03, 0.03], running, peak),
+        _source([3, 4], [0.01, 0.01], running, peak),
+        _source([5], [0.0], running, peak),
+    ]
+
+    merged = [
+        item
+        async for item in merge_iterators(factories, max_concurrency=2, ordered=ordered)
+    ]
+
+    assert peak[0] == 2
+    if ordered:
+        assert merged == [1, 2, 3, 4, 5]
+    else:
+        assert sorted(merged) == [1, 2, 3, 4, 5]
+        assert merged != [1, 2, 3, 4, 5]
+
+
+async def test_merge_iterators_error() -> None:
+    """Test that errors raised by an iterator are forwarded."""
+
+    async def failing() -> AsyncIterator[int]:
+        yield 1
+        raise RuntimeError("listing failed")
+
+    running: list[int] = []
+    received = []
+    with pytest.raises(RuntimeError, match="listing failed"):
+        async for item in merge_iterators(
+            [failing, _source([2], [0.0], running, [0])],
+            max_concurrency=2,
+            ordered=True,
+        ):
+            received.append(item)
+
+    assert received == [1]
+
+
+async def test_merge_iterators_later_error() -> None:
+    """Test that an error of a later iterator is raised without waiting for it."""
+
+    async def slow() -> AsyncIterator[int]:
+        yield 1
+        await asyncio.sleep(10)
+        yield 2
+
+    async def failing() -> AsyncIterator[int]:
+        raise RuntimeError("listing failed")
+        yield 3  # pylint: disable=unreachable
+
+    received = []
+    with pytest.raises(RuntimeError, match="listing failed"):
+        async with asyncio.timeout(1):
+            async for item in merge_iterators(
+                [slow, failing], max_concurrency=2, ordered=True
+            ):
+                received.append(item)
+
+    assert received == [1]
+
+
+@pytest.mark.parametrize("ordered", [True, False])
+async def test_merge_iterators_bounded_buffer(ordered: bool) -> None:
+    """Test that iterators are paused while their buffer is full."""
+    produced: list[int] = []
+
+    async def count() -> AsyncIterator[int]:
+        for item in range(100):
+            produced.append(item)
+            yield item
+
+    merged = merge_iterators([count], max_concurrency=1, ordered=ordered, buffer_size=5)
+    assert await anext(merged) == 0
+    await asyncio.sleep(0.01)
+    # The yielded item, the buffered ones and the one waiting to be buffered.
+    assert len(produced) == 7
+    await merged.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,127 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the hedging of requests."""
+
+import asyncio
+from datetime import timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+
+from frequenz.client.electricity_trading import (
+    Client,
+    HedgePolicy,
+    RateLimit,
+    RateLimits,
+)
+from frequenz.client.electricity_trading._hedge import Hedger
+
+
+def test_hedge_policy_validation() -> None:
+    """Test that invalid hedge policies are rejected."""
+    with pytest.raises(ValueError):
+        HedgePolicy(delay=timedelta(seconds=-1))
+
+
+async def test_fast_request_is_not_hedged() -> None:
+    """Test that no duplicate is sent when the response arrives in time."""
+    hedger = Hedger(HedgePolicy(delay=timedelta(seconds=1)))
+    sent: list[int] = []
+
+    async def send() -> str:
+        sent.append(len(sent))
+        return "fast"
+
+    assert await hedger.call(send) == "fast"
+    assert sent == [0]
+    assert hedger.stats.hedged_requests == 0
+    assert hedger.stats.hedge_rate == 0.0
+
+
+async def test_slow_request_is_hedged() -> None:
+    """Test that the duplicate of a slow request wins and the original is cancelled."""
+    hedger = Hedger(HedgePolicy(delay=timedelta(milliseconds=10)))
+    cancelled: list[int] = []
+    sent = 0
+
+    async def send() -> int:
+        nonlocal sent
+        index = sent
+        sent += 1
+        try:
+            await asyncio.sleep(10.0 if index == 0 else 0.0)
+        except asyncio.CancelledError:
+            cancelled.append(index)
+            raise
+        return index
+
+    assert await hedger.call(send) == 1
+    await asyncio.sleep(0)
+
+    assert cancelled == [0]
+    stats = hedger.stats
+    assert (stats.requests, stats.hedged_requests, stats.hedge_wins) == (1, 1, 1)
+    assert stats.hedge_rate == 1.0
+    assert stats.win_rate == 1.0
+
+
+async def test_hedged_request_falls_back_on_failure() -> None:
+    """Test that a failing duplicate doesn't hide a slow but successful original."""
+    hedger = Hedger(HedgePolicy(delay=timedelta(milliseconds=10)))
+    sent = 0
+
+    async def send() -> str:
+        nonlocal sent
+        index = sent
+        sent += 1
+        if index == 1:
+            raise RuntimeError("duplicate failed")
+        await asyncio.sleep(0.05)
+        return "original"
+
+    assert await hedger.call(send) == "original"
+    assert hedger.stats.hedge_wins == 0
+    assert hedger.stats.win_rate == 0.0
+
+
+async def test_all_hedged_requests_fail() -> None:
+    """Test that an error is raised when both requests fail."""
+    hedger = Hedger(HedgePolicy(delay=timedelta()))
+
+    async def send() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("failed")
+
+    with pytest.raises(RuntimeError, match="failed"):
+        await hedger.call(send)
+
+
+async def test_rate_limited_requests_are_not_hedged() -> None:
+    """Test that the time spent waiting for the rate limiter isn't hedged."""
+    client = Client(
+        "grpc://hedged-rate-limited.host",
+        connect=False,
+        rate_limits=RateLimits(reads=RateLimit(rate=10)),
+        hedge_policy=HedgePolicy(delay=timedelta(milliseconds=10)),
+    )
+    mock_stub = AsyncMock()
+    client._stub = mock_stub  # pylint: disable=protected-access
+    mock_stub.ListGridpoolOrders.return_value = (
+        electricity_trading_pb2.ListGridpoolOrdersResponse()
+    )
+
+    async def list_orders() -> None:
+        async for _ in client.list_gridpool_orders(1):
+            pass
+
+    # The requests after the first one wait 100ms for a token each.
+    await asyncio.gather(*(list_orders() for _ in range(3)))
+
+    assert mock_stub.ListGridpoolOrders.call_count == 3
+    assert client.rate_limiter_stats["reads"].delayed_requests == 2
+    hedge_stats = client.hedge_stats
+    assert hedge_stats is not None
+    assert hedge_stats.requests == 3
+    assert hedge_stats.hedged_requests == 0
@@ -0,0 +1,180 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the lazy views of protobuf messages."""
+
+import copy
+import dataclasses
+import pickle
+from decimal import Decimal
+from typing import Any, AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+# pylint: disable=no-member
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+
+from frequenz.client.electricity_trading import (
+    Client,
+    LazyOrderDetail,
+    LazyPublicTrade,
+    LazyTrade,
+    OrderDetail,
+    OrderState,
+    Power,
+    PublicTrade,
+    Trade,
+)
+
+
+def _is_decoded(view: OrderDetail, name: str) -> bool:
+    """Check if a field of a view was decoded.
+
+    Args:
+        view: The view.
+        name: The name of the field.
+
+    Returns:
+        Whether the field is stored in its slot.
+    """
+    try:
+        # The slot descriptor of the dataclass doesn't decode the field.
+        vars(OrderDetail)[name].__get__(view)  # pylint: disable=unnecessary-dunder-call
+    except AttributeError:
+        return False
+    return True
+
+
+def test_lazy_order_detail_decodes_fields_on_access(
+    make_order_detail: Callable[..., OrderDetail]
+) -> None:
+    """Test that only the accessed fields are decoded, once."""
+    order = make_order_detail(tag="spread")
+    view = LazyOrderDetail.from_pb(order.to_pb())
+    assert isinstance(view, OrderDetail)
+    assert view.order_id == 1
+    assert view.state_detail.state == OrderState.ACTIVE
+    assert _is_decoded(view, "state_detail")
+    assert not _is_decoded(view, "order")
+
+    assert view.order.tag == "spread"
+    assert view == order
+    assert order == view
+    assert view != make_order_detail(state=OrderState.FILLED, tag="spread")
+
+
+def test_lazy_order_detail_validates_price_and_quantity(
+    make_order_detail: Callable[..., OrderDetail]
+) -> None:
+    """Test that a missing price is rejected when creating the view."""
+    message = make_order_detail().to_pb()
+    message.order.price.amount.value = "NaN"
+    with pytest.raises(ValueError):
+        LazyOrderDetail.from_pb(message)
+
+    message = make_order_detail(state=OrderState.CANCELED).to_pb()
+    message.order.price.amount.value = "NaN"
+    assert LazyOrderDetail.from_pb(message).order.price.amount.is_nan()
+
+
+def test_lazy_trades(
+    make_trade: Callable[..., Trade], make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test that trade views are equal to the eagerly decoded trades."""
+    trade = make_trade()
+    view = LazyTrade.from_pb(trade.to_pb())
+    assert view == trade
+    assert view.to_pb() == trade.to_pb()
+
+    public_trade = make_public_trade()
+    assert LazyPublicTrade.from_pb(public_trade.to_pb()) == public_trade
+
+
+def test_lazy_views_can_be_changed(
+    make_order_detail: Callable[..., OrderDetail], make_trade: Callable[..., Trade]
+) -> None:
+    """Test that fields can be assigned and replaced like in the dataclasses."""
+    view = LazyTrade.from_pb(make_trade().to_pb())
+    view.quantity = Power(mw=Decimal("2"))
+    assert isinstance(view, LazyTrade)
+    assert view.quantity == Power(mw=Decimal("2"))
+    assert (
+        view.to_pb()
+        == dataclasses.replace(make_trade(), quantity=view.quantity).to_pb()
+    )
+    with pytest.raises(AttributeError):
+        view.unknown = 1  # type: ignore[attr-defined]
+
+    order = dataclasses.replace(
+        LazyOrderDetail.from_pb(make_order_detail().to_pb()), order_id=8
+    )
+    assert type(order) is OrderDetail  # pylint: disable=unidiomatic-typecheck
+    assert order == dataclasses.replace(make_order_detail(), order_id=8)
+
+
+def test_lazy_views_are_copied(make_order_detail: Callable[..., OrderDetail]) -> None:
+    """Test that views are copied and pickled with their changed fields."""
+    view = LazyOrderDetail.from_pb(make_order_detail().to_pb())
+    view.order_id = 8
+    for copied in (
+        copy.copy(view),
+        copy.deepcopy(view),
+        pickle.loads(pickle.dumps(view)),
+    ):
+        assert isinstance(copied, LazyOrderDetail)
+        assert copied == view
+        assert copied.to_pb() == view.to_pb()
+        assert copied.to_pb() is not view.to_pb()
+
+
+async def test_list_gridpool_trades_lazy(make_trade: Callable[..., Trade]) -> None:
+    """Test that listing lazily yields views of the received trades."""
+    client = Client("grpc://unknown.host", connect=False)
+    mock_stub = AsyncMock()
+    client._stub = mock_stub  # pylint: disable=protected-access
+    mock_stub.ListGridpoolTrades.return_value = (
+        electricity_trading_pb2.ListGridpoolTradesResponse(
+            trades=[make_trade().to_pb()]
+        )
+    )
+
+    trades = [trade async for trade in client.list_gridpool_trades(1, lazy=True)]
+    assert len(trades) == 1
+    assert isinstance(trades[0], LazyTrade)
+    assert trades[0] == make_trade()
+
+    trades = [trade async for trade in client.list_gridpool_trades(1)]
+    assert not isinstance(trades[0], LazyTrade)
+
+
+async def test_gridpool_streams_lazy(
+    make_order_detail: Callable[..., OrderDetail], make_trade: Callable[..., Trade]
+) -> None:
+    """Test that lazy streams send views of the received messages."""
+    client = Client("grpc://lazy.host:50051?ssl=false", connect=False)
+
+    async def orders(*_: Any, **__: Any) -> AsyncIterator[Any]:
+        yield electricity_trading_pb2.ReceiveGridpoolOrdersStreamResponse(
+            order_detail=make_order_detail().to_pb()
+        )
+
+    async def trades(*_: Any, **__: Any) -> AsyncIterator[Any]:
+        yield electricity_trading_pb2.ReceiveGridpoolTradesStreamResponse(
+            trade=make_trade().to_pb()
+        )
+
+    stub = MagicMock()
+    stub.ReceiveGridpoolOrdersStream.side_effect = orders
+    stub.ReceiveGridpoolTradesStream.side_effect = trades
+    client._stub = stub  # pylint: disable=protected-access
+
+    order_receiver = client.gridpool_orders_stream(1, lazy=True).new_receiver()
+    trade_receiver = client.gridpool_trades_stream(1, lazy=True).new_receiver()
+    order = await order_receiver.receive()
+    trade = await trade_receiver.receive()
+    assert isinstance(order, LazyOrderDetail)
+    assert order == make_order_detail()
+    assert isinstance(trade, LazyTrade)
+    assert trade == make_trade()
+    await client.close()
@@ -0,0 +1,295 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the multiplexing of streams."""
+
+import asyncio
+import gc
+from dataclasses import replace
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator, Callable
+from unittest.mock import MagicMock
+
+from frequenz.channels import Broadcast, Receiver
+from frequenz.client.base.streaming import GrpcStreamBroadcaster
+
+from frequenz.client.electricity_trading import (
+    Client,
+    DeliveryArea,
+    DeliveryPeriod,
+    GridpoolOrderFilter,
+    MarketSide,
+    OrderDetail,
+    OrderState,
+    PublicTrade,
+    PublicTradeFilter,
+    TradeState,
+)
+from frequenz.client.electricity_trading._multiplex import (
+    PublicTradesMultiplexer,
+    StreamMultiplexer,
+    order_filter_keys,
+    order_keys,
+    order_matches,
+)
+
+
+async def test_orders_are_routed_to_matching_subscribers(
+    area: DeliveryArea,
+    make_delivery_period: Callable[..., DeliveryPeriod],
+    make_order_detail: Callable[..., OrderDetail],
+) -> None:
+    """Test that every subscriber only receives the orders matching its filter."""
+    source: Broadcast[OrderDetail] = Broadcast(name="orders")
+    multiplexer: StreamMultiplexer[GridpoolOrderFilter, OrderDetail] = (
+        StreamMultiplexer(
+            "orders",
+            source.new_receiver,
+            filter_keys=order_filter_keys,
+            message_keys=order_keys,
+            matches=order_matches,
+        )
+    )
+    period = make_delivery_period()
+    everything = multiplexer.subscribe(GridpoolOrderFilter()).new_receiver()
+    first_period = multiplexer.subscribe(
+        GridpoolOrderFilter(delivery_period=period, delivery_area=area)
+    ).new_receiver()
+    sells = multiplexer.subscribe(
+        GridpoolOrderFilter(
+            order_states=[OrderState.ACTIVE, OrderState.FILLED], side=MarketSide.SELL
+        )
+    ).new_receiver()
+    assert multiplexer.subscribe(GridpoolOrderFilter()) is multiplexer.subscribe(
+        GridpoolOrderFilter()
+    )
+
+    sender = source.new_sender()
+    await sender.send(make_order_detail(1))
+    await sender.send(make_order_detail(2, side=MarketSide.SELL, minutes=15))
+    await sender.send(
+        make_order_detail(3, side=MarketSide.SELL, state=OrderState.CANCELED)
+    )
+    await source.close()
+    await asyncio.sleep(0.01)
+
+    assert [order.order_id async for order in everything] == [1, 2, 3]
+    assert [order.order_id async for order in first_period] == [1, 3]
+    assert [order.order_id async for order in sells] == [2]
+    assert not multiplexer.is_running
+
+
+async def test_stopped_subscribers_are_unsubscribed() -> None:
+    """Test that stopping a filtered stream removes it from the multiplexer."""
+    source: Broadcast[OrderDetail] = Broadcast(name="orders")
+    multiplexer: StreamMultiplexer[GridpoolOrderFilter, OrderDetail] = (
+        StreamMultiplexer(
+            "orders",
+            source.new_receiver,
+            filter_keys=order_filter_keys,
+            message_keys=order_keys,
+            matches=order_matches,
+        )
+    )
+    stream = multiplexer.subscribe(GridpoolOrderFilter(side=MarketSide.BUY))
+    assert multiplexer.subscribers == 1
+
+    await stream.stop()
+    assert not stream.is_running
+    assert multiplexer.subscribers == 0
+    assert multiplexer.subscribe(GridpoolOrderFilter(side=MarketSide.BUY)) is not stream
+
+    await multiplexer.stop()
+    assert multiplexer.subscribers == 0
+
+
+async def test_unused_subscribers_release_the_source(
+    make_order_detail: Callable[..., OrderDetail]
+) -> None:
+    """Test that the shared stream is only received from while it has subscribers."""
+    source: Broadcast[OrderDetail] = Broadcast(name="orders")
+    sources: list[Receiver[OrderDetail]] = []
+
+    def new_source() -> Receiver[OrderDetail]:
+        receiver = source.new_receiver()
+        sources.append(receiver)
+        return receiver
+
+    multiplexer: StreamMultiplexer[GridpoolOrderFilter, OrderDetail] = (
+        StreamMultiplexer(
+            "orders",
+            new_source,
+            filter_keys=order_filter_keys,
+            message_keys=order_keys,
+            matches=order_matches,
+        )
+    )
+    assert not sources
+    stream = multiplexer.subscribe(GridpoolOrderFilter())
+    receiver = stream.new_receiver()
+    assert multiplexer.is_running
+    assert len(sources) == 1
+
+    del receiver
+    gc.collect()
+    await asyncio.sleep(0.01)
+    assert not stream.receivers
+    assert not stream.is_running
+    assert multiplexer.subscribers == 0
+    assert not multiplexer.is_running
+
+    receiver = multiplexer.subscribe(GridpoolOrderFilter()).new_receiver()
+    await asyncio.sleep(0)
+    assert len(sources) == 2
+    await source.new_sender().send(make_order_detail(1))
+    assert (await receiver.receive()).order_id == 1
+    await multiplexer.stop()
+
+
+async def test_subscribing_while_a_stop_is_pending(
+    make_order_detail: Callable[..., OrderDetail]
+) -> None:
+    """Test that subscribing replaces a stream whose stop is pending."""
+    source: Broadcast[OrderDetail] = Broadcast(name="orders")
+    multiplexer: StreamMultiplexer[GridpoolOrderFilter, OrderDetail] = (
+        StreamMultiplexer(
+            "orders",
+            source.new_receiver,
+            filter_keys=order_filter_keys,
+            message_keys=order_keys,
+            matches=order_matches,
+        )
+    )
+    stream = multiplexer.subscribe(GridpoolOrderFilter())
+    receiver = stream.new_receiver()
+    del receiver
+    gc.collect()
+    # Lets the stream decide to stop, without stopping it yet.
+    await asyncio.sleep(0)
+    assert stream.is_stopping
+    assert stream.is_running
+
+    new_stream = multiplexer.subscribe(GridpoolOrderFilter())
+    assert new_stream is not stream
+    receiver = new_stream.new_receiver()
+    await asyncio.sleep(0.01)
+    assert not stream.is_running
+    assert new_stream.is_running
+    assert multiplexer.subscribers == 1
+
+    await source.new_sender().send(make_order_detail(1))
+    assert (await receiver.receive()).order_id == 1
+    await multiplexer.stop()
+
+
+async def test_client_shares_one_stream_per_gridpool() -> None:
+    """Test that the multiplexed streams of a gridpool share one server stream."""
+    client = Client("grpc://multiplexed.host:50051?ssl=false", connect=False)
+
+    async def endless_stream(*_: Any, **__: Any) -> AsyncIterator[Any]:
+        await asyncio.Event().wait()
+        yield
+
+    stub = MagicMock()
+    stub.ReceiveGridpoolOrdersStream.side_effect = endless_stream
+    client._stub = stub  # pylint: disable=protected-access
+
+    buys = client.multiplexed_gridpool_orders_stream(1, market_side=MarketSide.BUY)
+    sells = client.multiplexed_gridpool_orders_stream(1, market_side=MarketSide.SELL)
+    client.multiplexed_gridpool_orders_stream(2)
+    await asyncio.sleep(0)
+
+    assert buys is not sells
+    assert stub.ReceiveGridpoolOrdersStream.call_count == 2
+    request = stub.ReceiveGridpoolOrdersStream.call_args_list[0].args[0]
+    assert request.gridpool_id == 1
+    assert request.filter == GridpoolOrderFilter().to_pb()
+
+    await client.close()
+    assert not buys.is_running
+
+
+class _FakeServer:
+    """A server of public trade streams fed by the tests."""
+
+    def __init__(self) -> None:
+        """Initialize the server."""
+        self.opened: list[PublicTradeFilter] = []
+        self.queues: list[asyncio.Queue[PublicTrade]] = []
+
+    def open_stream(
+        self, trade_filter: PublicTradeFilter
+    ) -> GrpcStreamBroadcaster[PublicTrade, PublicTrade]:
+        """Open a stream of the trades put in a new queue.
+
+        Args:
+            trade_filter: The filter of the stream.
+
+        Returns:
+            The stream.
+        """
+        queue: asyncio.Queue[PublicTrade] = asyncio.Queue()
+        self.opened.append(trade_filter)
+        self.queues.append(queue)
+
+        async def stream() -> AsyncIterator[PublicTrade]:
+            while True:
+                yield await queue.get()
+
+        return GrpcStreamBroadcaster(str(trade_filter), stream, lambda trade: trade)
+
+
+async def test_public_trade_subscribers_share_covering_streams(
+    area: DeliveryArea, make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test that subscribers are served by an open stream covering their filter."""
+    server = _FakeServer()
+    multiplexer = PublicTradesMultiplexer(server.open_stream)
+    period = DeliveryPeriod(
+        start=datetime.now(timezone.utc) + timedelta(hours=1),
+        duration=timedelta(minutes=15),
+    )
+
+    area_stream = multiplexer.subscribe(PublicTradeFilter(buy_delivery_area=area))
+    all_trades = area_stream.new_receiver()
+    canceled = multiplexer.subscribe(
+        PublicTradeFilter(
+            states=[TradeState.CANCELED],
+            delivery_period=period,
+            buy_delivery_area=area,
+        )
+    ).new_receiver()
+
+    assert server.opened == [PublicTradeFilter(buy_delivery_area=area)]
+    await asyncio.sleep(0)
+    server.queues[0].put_nowait(replace(make_public_trade(1), delivery_period=period))
+    server.queues[0].put_nowait(
+        replace(make_public_trade(2, state=TradeState.CANCELED), delivery_period=period)
+    )
+    server.queues[0].put_nowait(make_public_trade(3, state=TradeState.CANCELED))
+    await asyncio.sleep(0.01)
+
+    await area_stream.stop()
+    await multiplexer.stop()
+    assert [trade.public_trade_id async for trade in all_trades] == [1, 2, 3]
+    assert [trade.public_trade_id async for trade in canceled] == [2]
+    assert not multiplexer.upstreams
+
+
+async def test_unused_public_trade_streams_are_dropped(
+    area: DeliveryArea, make_delivery_period: Callable[..., DeliveryPeriod]
+) -> None:
+    """Test that streams stop with their last subscriber or their delivery period."""
+    server = _FakeServer()
+    multiplexer = PublicTradesMultiplexer(server.open_stream)
+    ended = make_delivery_period()
+
+    stream = multiplexer.subscribe(PublicTradeFilter(sell_delivery_area=area))
+    past = multiplexer.subscribe(PublicTradeFilter(delivery_period=ended))
+    assert len(multiplexer.upstreams) == 2
+
+    await stream.stop()
+    await asyncio.sleep(0.01)
+
+    assert not past.is_running
+    assert not multiplexer.upstreams
@@ -0,0 +1,212 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the local cache of gridpool orders."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import AsyncIterator, Callable
+from unittest.mock import MagicMock
+
+import grpc
+from frequenz.channels import Broadcast, Receiver
+from frequenz.client.base import retry
+
+from frequenz.client.electricity_trading import (
+    Client,
+    DeliveryArea,
+    DeliveryPeriod,
+    MarketSide,
+    OrderCache,
+    OrderDetail,
+    OrderState,
+    SnapshotSubscription,
+)
+from frequenz.client.electricity_trading._resume import ResumableStream
+from frequenz.client.electricity_trading._snapshot import subscribe_when_streaming
+from frequenz.client.electricity_trading._stream_cache import CachedStreamBroadcaster
+
+
+def test_order_cache_indexes(
+    make_order_detail: Callable[..., OrderDetail],
+    make_delivery_period: Callable[..., DeliveryPeriod],
+    area: DeliveryArea,
+) -> None:
+    """Test querying the orders by their indexes."""
+    cache = OrderCache(MagicMock(spec=Client), gridpool_id=1, keep_final_orders=True)
+    cache.apply(make_order_detail(1))
+    cache.apply(make_order_detail(2, side=MarketSide.SELL, tag="spread"))
+    cache.apply(make_order_detail(3, minutes=15, tag="spread"))
+    cache.apply(make_order_detail(4, state=OrderState.FILLED))
+
+    assert len(cache) == 4
+    assert [order.order_id for order in cache.orders()] == [1, 2, 3, 4]
+    assert [
+        order.order_id
+        for order in cache.orders(
+            order_states=[OrderState.ACTIVE],
+            side=MarketSide.BUY,
+            delivery_period=make_delivery_period(0),
+            delivery_area=area,
+        )
+    ] == [1]
+    assert [order.order_id for order in cache.orders(tag="spread")] == [2, 3]
+    assert [
+        order.order_id
+        for order in cache.orders(order_states=[OrderState.ACTIVE, OrderState.FILLED])
+    ] == [1, 2, 3, 4]
+    assert not cache.orders(delivery_period=make_delivery_period(30))
+
+
+def test_order_cache_updates(make_order_detail: Callable[..., OrderDetail]) -> None:
+    """Test that updates move the orders between indexes, unless outdated."""
+    cache = OrderCache(MagicMock(spec=Client), gridpool_id=1, keep_final_orders=True)
+    assert cache.apply(make_order_detail(1, modified=timedelta(seconds=1)))
+    assert cache.apply(
+        make_order_detail(1, state=OrderState.FILLED, modified=timedelta(seconds=2))
+    )
+    assert not cache.apply(
+        make_order_detail(1, state=OrderState.CANCELED, modified=timedelta(seconds=1))
+    )
+
+    assert not cache.orders(order_states=[OrderState.ACTIVE])
+    assert [
+        order.order_id for order in cache.orders(order_states=[OrderState.FILLED])
+    ] == [1]
+    order = cache.order(1)
+    assert order is not None
+    assert order.state_detail.state == OrderState.FILLED
+    assert cache.order(2) is None
+
+
+def test_order_cache_drops_final_orders(
+    make_order_detail: Callable[..., OrderDetail],
+) -> None:
+    """Test that orders in a final state are dropped, unless outdated."""
+    cache = OrderCache(MagicMock(spec=Client), gridpool_id=1)
+    assert cache.apply(make_order_detail(1, modified=timedelta(seconds=1)))
+    assert cache.apply(make_order_detail(2))
+    assert not cache.apply(
+        make_order_detail(1, state=OrderState.FILLED, modified=timedelta())
+    )
+    assert cache.apply(
+        make_order_detail(1, state=OrderState.FILLED, modified=timedelta(seconds=2))
+    )
+    assert not cache.apply(make_order_detail(3, state=OrderState.EXPIRED))
+
+    assert len(cache) == 1
+    assert cache.order(1) is None
+    assert not cache.orders(order_states=[OrderState.FILLED])
+    assert [order.order_id for order in cache.orders()] == [2]
+
+
+async def test_order_cache_follows_stream(
+    make_order_detail: Callable[..., OrderDetail],
+) -> None:
+    """Test that the cache is seeded by listing and then follows the stream."""
+    channel: Broadcast[OrderDetail] = Broadcast(name="orders")
+    sender = channel.new_sender()
+
+    async def snapshot() -> AsyncIterator[OrderDetail]:
+        yield make_order_detail(1)
+        await sender.send(
+            make_order_detail(1, state=OrderState.FILLED, modified=timedelta(seconds=1))
+        )
+        await asyncio.sleep(0)
+        yield make_order_detail(2)
+
+    async def subscribe(maxsize: int) -> Receiver[OrderDetail]:
+        return channel.new_receiver(limit=maxsize)
+
+    client = MagicMock(spec=Client)
+    client.snapshot_and_stream_gridpool_orders.side_effect = (
+        lambda gridpool_id, resumable, buffer_size: SnapshotSubscription(
+            subscribe,
+            snapshot,
+            key=lambda order: order.order_id,
+            version=lambda order: order.modification_time,
+            buffer_size=buffer_size,
+        )
+    )
+    cache = OrderCache(client, gridpool_id=1)
+    await cache.start()
+    assert cache.is_synced
+    assert [order.order_id for order in cache.orders()] == [2]
+
+    await asyncio.sleep(0.01)
+    await sender.send(make_order_detail(3, side=MarketSide.SELL))
+    await asyncio.sleep(0.01)
+    assert [
+        order.order_id for order in cache.orders(order_states=[OrderState.ACTIVE])
+    ] == [2, 3]
+    assert [order.order_id for order in cache.orders()] == [2, 3]
+
+    await cache.stop()
+    assert not cache.is_synced
+    assert len(cache) == 2
+    client.snapshot_and_stream_gridpool_orders.assert_called_once_with(
+        1, resumable=True, buffer_size=10_000
+    )
+
+
+async def test_order_cache_applies_missed_updates(
+    make_order_detail: Callable[..., OrderDetail], start: datetime
+) -> None:
+    """Test that the updates missed while the stream reconnects are applied."""
+    # The resumable stream only lists the updates since it was opened.
+    later = datetime.now(timezone.utc) - start + timedelta(hours=1)
+    reconnected = asyncio.Event()
+
+    async def open_stream() -> AsyncIterator[OrderDetail]:
+        if not reconnected.is_set():
+            reconnected.set()
+            await asyncio.sleep(0.01)
+            yield make_order_detail(1, modified=later)
+            raise grpc.aio.AioRpcError(
+                grpc.StatusCode.UNAVAILABLE,
+                grpc.aio.Metadata(),
+                grpc.aio.Metadata(),
+                None,
+                None,
+            )
+        await asyncio.Event().wait()
+        yield make_order_detail(1)
+
+    async def list_missed() -> AsyncIterator[OrderDetail]:
+        yield make_order_detail(1, state=OrderState.CANCELED, modified=later * 2)
+        yield make_order_detail(2, modified=later * 2)
+
+    async def list_snapshot() -> AsyncIterator[OrderDetail]:
+        yield make_order_detail(3)
+
+    stream: CachedStreamBroadcaster[OrderDetail, OrderDetail] = CachedStreamBroadcaster(
+        "orders",
+        ResumableStream(
+            "orders",
+            open_stream=open_stream,
+            transform=lambda order: order,
+            backfill=list_missed,
+            key=lambda order: (order.order_id, order.modification_time),
+            time=lambda order: order.modification_time,
+        ),
+        lambda order: order,
+        retry_strategy=retry.LinearBackoff(interval=0.0, jitter=0.0),
+    )
+    client = MagicMock(spec=Client)
+    client.snapshot_and_stream_gridpool_orders.side_effect = (
+        lambda gridpool_id, resumable, buffer_size: SnapshotSubscription(
+            lambda maxsize: subscribe_when_streaming(stream, maxsize),
+            list_snapshot,
+            key=lambda order: order.order_id,
+            version=lambda order: order.modification_time,
+            buffer_size=buffer_size,
+        )
+    )
+    cache = OrderCache(client, gridpool_id=1)
+    await cache.start()
+    await asyncio.sleep(0.05)
+
+    assert [order.order_id for order in cache.orders()] == [2, 3]
+
+    await cache.stop()
+    await stream.stop()
@@ -0,0 +1,122 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the pagination helpers."""
+
+import asyncio
+
+import pytest
+
+# pylint: disable=no-member
+from frequenz.api.common.v1.pagination.pagination_info_pb2 import PaginationInfo
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+
+from frequenz.client.electricity_trading._pagination import iter_pages
+
+
+def _page(next_page_token: str) -> electricity_trading_pb2.ListPublicTradesResponse:
+    return electricity_trading_pb2.ListPublicTradesResponse(
+        pagination_info=PaginationInfo(next_page_token=next_page_token)
+    )
+
+
+async def test_prefetch_fetches_while_consuming() -> None:
+    """Test that the next page is requested before the current one is consumed."""
+    pages = {"": _page("2"), "2": _page("3"), "3": _page("")}
+    fetched: list[str] = []
+
+    async def fetch(
+        request: electricity_trading_pb2.ListPublicTradesRequest,
+    ) -> electricity_trading_pb2.ListPublicTradesResponse:
+        fetched.append(request.pagination_params.page_token)
+        return pages[request.pagination_params.page_token]
+
+    request = electricity_trading_pb2.ListPublicTradesRequest()
+    consumed: list[str] = []
+    async for page in iter_pages(fetch, request, prefetch=1):
+        consumed.append(page.pagination_info.next_page_token)
+        # Give the prefetching task a chance to run while the page is "processed"
+        await asyncio.sleep(0)
+        if page.pagination_info.next_page_token:
+            assert len(fetched) > len(consumed)
+
+    assert fetched == ["", "2", "3"]
+    assert consumed == ["2", "3", ""]
+
+
+async def test_prefetch_propagates_errors() -> None:
+    """Test that errors raised while prefetching reach the consumer in order."""
+
+    async def fetch(
+        request: electricity_trading_pb2.ListPublicTradesRequest,
+    ) -> electricity_trading_pb2.ListPublicTradesResponse:
+        if request.pagination_params.page_token:
+            raise RuntimeError("page failed")
+        return _page("2")
+
+    received = []
+    with pytest.raises(RuntimeError, match="page failed"):
+        async for page in iter_pages(
+            fetch, electricity_trading_pb2.ListPublicTradesRequest(), prefetch=3
+        ):
+            received.append(page)
+
+    assert len(received) == 1
+
+
+async def test_prefetch_errors_of_unconsumed_pages() -> None:
+    """Test that errors of pages the consumer didn't reach are not raised."""
+
+    async def fetch(
+        request: electricity_trading_pb2.ListPublicTradesRequest,
+    ) -> electricity_trading_pb2.ListPublicTradesResponse:
+        if request.pagination_params.page_token:
+            raise RuntimeError("page failed")
+        return _page("2")
+
+    pages = iter_pages(
+        fetch, electricity_trading_pb2.ListPublicTradesRequest(), prefetch=3
+    )
+    await anext(pages)
+    # Lets the next page fail before the consumer stops.
+    await asyncio.sleep(0.01)
+    await pages.aclose()  # type: ignore[attr-defined]
+
+
+async def test_negative_prefetch() -> None:
+    """Test that a negative prefetch depth is rejected."""
+
+    async def fetch(
+        _: electricity_trading_pb2.ListPublicTradesRequest,
+    ) -> electricity_trading_pb2.ListPublicTradesResponse:
+        return _page("")
+
+    with pytest.raises(ValueError):
+        async for _ in iter_pages(
+            fetch, electricity_trading_pb2.ListPublicTradesRequest(), prefetch=-1
+        ):
+            pass
+
+
+async def test_prefetch_depth() -> None:
+    """Test that no more than `prefetch` pages are fetched ahead of the consumer."""
+    fetched: list[str] = []
+
+    async def fetch(
+        request: electricity_trading_pb2.ListPublicTradesRequest,
+    ) -> electricity_trading_pb2.ListPublicTradesResponse:
+        fetched.append(request.pagination_params.page_token)
+        return _page(str(len(fetched) + 1))
+
+    pages = iter_pages(
+        fetch, electricity_trading_pb2.ListPublicTradesRequest(), prefetch=2
+    )
+    await anext(pages)
+    await asyncio.sleep(0.01)
+    # The first page was taken by the consumer, and the next two are ahead.
+    assert fetched == ["", "2", "3"]
+
+    await anext(pages)
+    await asyncio.sleep(0.01)
+    assert fetched == ["", "2", "3", "4"]
+    await pages.aclose()  # type: ignore[attr-defined]
@@ -0,0 +1,147 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the ledger of gridpool positions."""
+
+import asyncio
+from datetime import datetime, timedelta
+from decimal import Decimal
+from typing import AsyncIterator, Callable
+from unittest.mock import MagicMock
+
+import pytest
+from frequenz.channels import Broadcast, Receiver
+
+from frequenz.client.electricity_trading import (
+    Client,
+    Currency,
+    DeliveryArea,
+    DeliveryPeriod,
+    MarketSide,
+    PositionLedger,
+    Power,
+    Price,
+    SnapshotSubscription,
+    Trade,
+    TradeState,
+)
+
+
+def test_position_volumes_and_vwap(
+    start: datetime,
+    area: DeliveryArea,
+    make_delivery_period: Callable[..., DeliveryPeriod],
+    make_trade: Callable[..., Trade],
+) -> None:
+    """Test the volumes and average prices of a position."""
+    ledger = PositionLedger(MagicMock(spec=Client), gridpool_id=1)
+    assert ledger.apply(make_trade(1, mw="1", price="40"))
+    assert ledger.apply(make_trade(2, mw="3", price="60"))
+    assert ledger.apply(make_trade(3, side=MarketSide.SELL, mw="2", price="70"))
+    assert ledger.apply(make_trade(4, minutes=15))
+
+    position = ledger.position(area, make_delivery_period())
+    assert position.buy_volume == Power(mw=Decimal("4"))
+    assert position.sell_volume == Power(mw=Decimal("2"))
+    assert position.net_position == Power(mw=Decimal("2"))
+    assert position.buy_vwap == Price(amount=Decimal("55"), currency=Currency.EUR)
+    assert position.sell_vwap == Price(amount=Decimal("70"), currency=Currency.EUR)
+    assert position.vwap == Price(amount=Decimal("60"), currency=Currency.EUR)
+    assert position.trades == 3
+
+    assert [p.delivery_period.start for p in ledger.positions()] == [
+        start,
+        start + timedelta(minutes=15),
+    ]
+    assert [
+        p.trades for p in ledger.positions(delivery_period=make_delivery_period())
+    ] == [3]
+
+
+def test_position_state_changes_are_idempotent(
+    area: DeliveryArea,
+    make_delivery_period: Callable[..., DeliveryPeriod],
+    make_trade: Callable[..., Trade],
+) -> None:
+    """Test that repeated trades and cancellations are only counted once."""
+    ledger = PositionLedger(MagicMock(spec=Client), gridpool_id=1)
+    assert ledger.apply(make_trade(1))
+    assert not ledger.apply(make_trade(1))
+    assert ledger.apply(make_trade(2, mw="2"))
+    assert ledger.apply(make_trade(2, mw="2", state=TradeState.CANCEL_REQUESTED))
+    assert ledger.position(area, make_delivery_period()).buy_volume == Power(
+        mw=Decimal("3")
+    )
+
+    assert ledger.apply(make_trade(2, mw="2", state=TradeState.CANCELED))
+    assert not ledger.apply(make_trade(2, mw="2", state=TradeState.CANCELED))
+    assert not ledger.apply(make_trade(2, mw="2"))
+    assert ledger.position(area, make_delivery_period()).buy_volume == Power(
+        mw=Decimal("1")
+    )
+
+    assert ledger.apply(make_trade(1, state=TradeState.RECALL))
+    position = ledger.position(area, make_delivery_period())
+    assert position.trades == 0
+    assert position.buy_vwap is None
+    assert not ledger.positions()
+    assert len(ledger) == 2
+
+
+def test_position_rejects_mixed_currencies(
+    area: DeliveryArea,
+    make_delivery_period: Callable[..., DeliveryPeriod],
+    make_trade: Callable[..., Trade],
+) -> None:
+    """Test that a trade in another currency is rejected without any change."""
+    ledger = PositionLedger(MagicMock(spec=Client), gridpool_id=1)
+    ledger.apply(make_trade(1))
+    with pytest.raises(ValueError):
+        ledger.apply(make_trade(2, currency=Currency.USD))
+    assert ledger.position(area, make_delivery_period()).trades == 1
+    assert len(ledger) == 1
+
+
+async def test_position_ledger_follows_stream(
+    area: DeliveryArea,
+    make_delivery_period: Callable[..., DeliveryPeriod],
+    make_trade: Callable[..., Trade],
+) -> None:
+    """Test that the ledger is seeded by listing and then follows the stream."""
+    channel: Broadcast[Trade] = Broadcast(name="trades")
+    sender = channel.new_sender()
+
+    async def snapshot() -> AsyncIterator[Trade]:
+        yield make_trade(1)
+        yield make_trade(2)
+
+    async def subscribe(maxsize: int) -> Receiver[Trade]:
+        return channel.new_receiver(limit=maxsize)
+
+    client = MagicMock(spec=Client)
+    client.snapshot_and_stream_gridpool_trades.side_effect = (
+        lambda gridpool_id, buffer_size: SnapshotSubscription(
+            subscribe,
+            snapshot,
+            key=lambda trade: (trade.id, trade.state),
+            version=lambda trade: trade.execution_time,
+            buffer_size=buffer_size,
+        )
+    )
+    ledger = PositionLedger(client, gridpool_id=1)
+    await ledger.start()
+    assert ledger.is_synced
+    assert ledger.position(area, make_delivery_period()).net_position == Power(
+        mw=Decimal("2")
+    )
+
+    await asyncio.sleep(0.01)
+    await sender.send(make_trade(2, state=TradeState.CANCELED))
+    await sender.send(make_trade(3, side=MarketSide.SELL, mw="5"))
+    await asyncio.sleep(0.01)
+    assert ledger.position(area, make_delivery_period()).net_position == Power(
+        mw=Decimal("-4")
+    )
+
+    await ledger.stop()
+    assert not ledger.is_synced
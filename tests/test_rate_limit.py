@@ -0,0 +1,74 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the client-side rate limiting."""
+
+import asyncio
+
+import pytest
+
+from frequenz.client.electricity_trading import RateLimit
+from frequenz.client.electricity_trading._rate_limit import TokenBucket
+
+
+def test_rate_limit_validation() -> None:
+    """Test that invalid rate limits are rejected."""
+    with pytest.raises(ValueError):
+        RateLimit(rate=0)
+    with pytest.raises(ValueError):
+        RateLimit(rate=1, burst=0)
+
+
+async def test_token_bucket_queues_requests() -> None:
+    """Test that requests over the burst are queued in arrival order."""
+    bucket = TokenBucket(RateLimit(rate=50, burst=2))
+    loop = asyncio.get_running_loop()
+    start = loop.time()
+    finished: list[tuple[int, float]] = []
+
+    async def request(index: int) -> None:
+        await bucket.acquire()
+        finished.append((index, loop.time() - start))
+
+    await asyncio.gather(*(request(index) for index in range(5)))
+
+    assert [index for index, _ in finished] == [0, 1, 2, 3, 4]
+    # The burst goes through immediately, then one request every 20ms.
+    assert finished[1][1] < 0.01
+    assert finished[4][1] >= 0.06 - 0.005
+
+    stats = bucket.stats
+    assert stats.requests == 5
+    assert stats.delayed_requests == 3
+    assert stats.max_delay.total_seconds() == pytest.approx(0.06, abs=1e-3)
+    assert stats.total_delay.total_seconds() == pytest.approx(0.12, abs=1e-3)
+    assert stats.average_delay == stats.total_delay / 5
+
+
+async def test_token_bucket_refills() -> None:
+    """Test that the bucket refills up to its burst size when idle."""
+    bucket = TokenBucket(RateLimit(rate=100, burst=2))
+    await bucket.acquire()
+    await bucket.acquire()
+    await asyncio.sleep(0.05)
+    await bucket.acquire()
+    await bucket.acquire()
+
+    assert bucket.stats.delayed_requests == 0
+
+
+async def test_token_bucket_cancelled_request() -> None:
+    """Test that a cancelled request gives its token back."""
+    bucket = TokenBucket(RateLimit(rate=10, burst=1))
+    await bucket.acquire()
+
+    task = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0)
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    await asyncio.sleep(0.1)
+    start = asyncio.get_running_loop().time()
+    await bucket.acquire()
+    assert asyncio.get_running_loop().time() - start < 0.01
@@ -0,0 +1,97 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the raw variants of the list and stream methods."""
+
+import asyncio
+from typing import Any, AsyncIterator, Callable
+from unittest.mock import AsyncMock, MagicMock
+
+# pylint: disable=no-member
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+
+from frequenz.client.electricity_trading import Client, PublicTrade
+
+
+async def test_list_public_trades_raw(
+    make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test that listing raw trades yields the received protobuf messages."""
+    client = Client("grpc://raw.host:50051?ssl=false", connect=False)
+    stub = AsyncMock()
+    stub.ListPublicTrades.return_value = (
+        electricity_trading_pb2.ListPublicTradesResponse(
+            public_trades=[make_public_trade(1).to_pb(), make_public_trade(2).to_pb()]
+        )
+    )
+    client._stub = stub  # pylint: disable=protected-access
+
+    trades = [trade async for trade in client.list_public_trades_raw()]
+    assert trades == [make_public_trade(1).to_pb(), make_public_trade(2).to_pb()]
+    assert all(
+        isinstance(trade, electricity_trading_pb2.PublicTrade) for trade in trades
+    )
+    await client.close()
+
+
+async def test_public_trades_stream_raw(
+    make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test that raw streams send the received protobuf messages."""
+    client = Client("grpc://raw.host:50051?ssl=false", connect=False)
+
+    async def stream(
+        *_: Any, **__: Any
+    ) -> AsyncIterator[electricity_trading_pb2.ReceivePublicTradesStreamResponse]:
+        yield electricity_trading_pb2.ReceivePublicTradesStreamResponse(
+            public_trade=make_public_trade(1).to_pb()
+        )
+        await asyncio.Event().wait()
+
+    stub = MagicMock()
+    stub.ReceivePublicTradesStream.side_effect = stream
+    client._stub = stub  # pylint: disable=protected-access
+
+    raw = client.public_trades_stream_raw()
+    assert client.public_trades_stream_raw() is raw
+    assert client.public_trades_stream() is not raw  # type: ignore[comparison-overlap]
+    receiver = raw.new_receiver()
+    assert await receiver.receive() == make_public_trade(1).to_pb()
+    await client.close()
+
+
+async def test_streams_share_the_raw_server_stream(
+    make_public_trade: Callable[..., PublicTrade]
+) -> None:
+    """Test that raw, decoded and lazy streams share one server stream."""
+    client = Client("grpc://raw.host:50051?ssl=false", connect=False)
+
+    async def stream(
+        *_: Any, **__: Any
+    ) -> AsyncIterator[electricity_trading_pb2.ReceivePublicTradesStreamResponse]:
+        yield electricity_trading_pb2.ReceivePublicTradesStreamResponse(
+            public_trade=make_public_trade(1).to_pb()
+        )
+        await asyncio.Event().wait()
+
+    stub = MagicMock()
+    stub.ReceivePublicTradesStream.side_effect = stream
+    client._stub = stub  # pylint: disable=protected-access
+
+    decoded = client.public_trades_stream()
+    assert client.public_trades_stream() is decoded
+    receivers = [
+        decoded.new_receiver(),
+        client.public_trades_stream(lazy=True).new_receiver(),
+        client.public_trades_stream_raw().new_receiver(),
+    ]
+    assert [await receiver.receive() for receiver in receivers] == [
+        make_public_trade(1),
+        make_public_trade(1),
+        make_public_trade(1).to_pb(),
+    ]
+    assert stub.ReceivePublicTradesStream.call_count == 1
+    assert client.stream_cache_stats.streams == 1
+
+    await client.close()
+    assert not decoded.is_running
@@ -0,0 +1,154 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the registry of shared clients."""
+
+import asyncio
+from datetime import timedelta
+
+import pytest
+
+from frequenz.client.electricity_trading import Client
+from frequenz.client.electricity_trading._registry import ClientRegistry
+
+
+class _FakeClient:
+    """A client recording whether it was closed."""
+
+    def __init__(self) -> None:
+        """Initialize the client."""
+        self.closed = False
+
+
+async def _close(client: _FakeClient) -> None:
+    """Close a fake client.
+
+    Args:
+        client: The client to close.
+    """
+    client.closed = True
+
+
+async def test_clients_are_shared_until_released() -> None:
+    """Test that a client is closed only when its last user releases it."""
+    registry: ClientRegistry[_FakeClient] = ClientRegistry(_close)
+
+    first = registry.get("key", _FakeClient, timedelta())
+    second = registry.get("key", _FakeClient, timedelta())
+    assert first is second
+    assert registry.refs("key") == 0
+
+    registry.acquire("key", first, timedelta())
+    registry.acquire("key", second, timedelta())
+    assert registry.refs("key") == 2
+
+    await registry.release("key", first)
+    assert not first.closed
+    assert registry.refs("key") == 1
+
+    await registry.release("key", second)
+    assert first.closed
+    assert len(registry) == 0
+
+    assert registry.get("key", _FakeClient, timedelta()) is not first
+
+
+async def test_idle_clients_are_evicted() -> None:
+    """Test that idle clients are kept until their idle timeout expires."""
+    registry: ClientRegistry[_FakeClient] = ClientRegistry(_close)
+    idle_timeout = timedelta(milliseconds=20)
+
+    client = registry.get("key", _FakeClient, idle_timeout)
+    registry.acquire("key", client, idle_timeout)
+    await registry.release("key", client)
+    await asyncio.sleep(0.01)
+    # Reusing the idle client cancels its eviction.
+    registry.acquire("key", client, idle_timeout)
+    await asyncio.sleep(0.03)
+    assert not client.closed
+
+    await registry.release("key", client)
+    assert len(registry) == 1
+    await asyncio.sleep(0.03)
+    assert client.closed
+    assert len(registry) == 0
+
+
+async def test_clients_never_acquired_are_evicted() -> None:
+    """Test that clients that are got but never acquired are evicted when idle."""
+    registry: ClientRegistry[_FakeClient] = ClientRegistry(_close)
+    idle_timeout = timedelta(milliseconds=20)
+
+    client = registry.get("key", _FakeClient, idle_timeout)
+    await asyncio.sleep(0.01)
+    # Getting the client again starts its idle timeout again.
+    assert registry.get("key", _FakeClient, idle_timeout) is client
+    await asyncio.sleep(0.015)
+    assert not client.closed
+    await asyncio.sleep(0.015)
+    assert client.closed
+    assert len(registry) == 0
+
+    # Acquiring the client cancels its eviction.
+    client = registry.get("key", _FakeClient, idle_timeout)
+    registry.acquire("key", client, idle_timeout)
+    await asyncio.sleep(0.03)
+    assert not client.closed
+    assert len(registry) == 1
+
+
+async def test_client_never_entered_is_evicted() -> None:
+    """Test that a client that is never used in `async with` is closed when idle."""
+    client = Client(
+        "grpc://never-entered.host:50051?ssl=false",
+        connect=False,
+        idle_timeout=timedelta(milliseconds=20),
+    )
+    await asyncio.sleep(0.03)
+
+    assert (
+        Client("grpc://never-entered.host:50051?ssl=false", connect=False) is not client
+    )
+
+
+async def test_release_is_idempotent_for_evicted_clients() -> None:
+    """Test that releasing an evicted client doesn't affect its replacement."""
+    registry: ClientRegistry[_FakeClient] = ClientRegistry(_close)
+
+    old = registry.get("key", _FakeClient, timedelta())
+    registry.acquire("key", old, timedelta())
+    await registry.release("key", old)
+    new = registry.get("key", _FakeClient, timedelta())
+    registry.acquire("key", new, timedelta())
+
+    await registry.release("key", old)
+    registry.acquire("key", old, timedelta())
+    assert registry.refs("key") == 1
+    assert not new.closed
+
+
+async def test_close_evicts_clients_in_use() -> None:
+    """Test that closing a client evicts it even if it has users."""
+    registry: ClientRegistry[_FakeClient] = ClientRegistry(_close)
+
+    client = registry.get("key", _FakeClient, timedelta(seconds=10))
+    registry.acquire("key", client, timedelta(seconds=10))
+    await registry.close("key", client)
+    assert client.closed
+    assert len(registry) == 0
+
+    await registry.release("key", client)
+    assert len(registry) == 0
+
+
+async def test_client_options_conflicts() -> None:
+    """Test that getting an existing client with different options fails."""
+    url = "grpc://options.host:50051?ssl=false"
+    client = Client(url, connect=False, channels=2)
+
+    assert Client(url, connect=False) is client
+    assert Client(url, connect=False, channels=2) is client
+    with pytest.raises(ValueError, match="channels"):
+        Client(url, connect=False, channels=3)
+
+    await client.close()
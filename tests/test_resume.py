@@ -0,0 +1,148 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the resumable streams."""
+
+import asyncio
+from datetime import datetime, timedelta, timezone
+from typing import Any, AsyncIterator
+from unittest.mock import MagicMock
+
+from frequenz.client.electricity_trading import Client
+from frequenz.client.electricity_trading._resume import ResumableStream
+
+_START = datetime.now(timezone.utc) + timedelta(hours=1)
+"""A time after the streams are opened."""
+
+_Item = tuple[int, datetime]
+"""An item ID and its modification time."""
+
+
+def _item(item_id: int, minutes: int) -> _Item:
+    """Create an item.
+
+    Args:
+        item_id: The ID of the item.
+        minutes: The modification time of the item, in minutes after `_START`.
+
+    Returns:
+        The item.
+    """
+    return (item_id, _START + timedelta(minutes=minutes))
+
+
+def _resumable_stream(
+    connections: list[list[_Item]], listed: list[_Item]
+) -> ResumableStream[_Item, _Item]:
+    """Create a resumable stream sending predefined items.
+
+    Args:
+        connections: The items sent by each connection of the server stream.
+        listed: The items returned by the backfill listings.
+
+    Returns:
+        The resumable stream.
+    """
+    pending = list(connections)
+
+    async def open_stream() -> AsyncIterator[_Item]:
+        for item in pending.pop(0):
+            yield item
+
+    async def backfill() -> AsyncIterator[_Item]:
+        for item in listed:
+            yield item
+
+    return ResumableStream(
+        "test",
+        open_stream=open_stream,
+        transform=lambda item: item,
+        backfill=backfill,
+        key=lambda item: item,
+        time=lambda item: item[1],
+    )
+
+
+async def test_missed_items_are_backfilled() -> None:
+    """Test that the items missed between connections are sent after reconnecting."""
+    stream = _resumable_stream(
+        [[_item(1, 0), _item(2, 1)], [_item(4, 3), _item(2, 1), _item(5, 4)]],
+        # Only the items modified since the last one received are sent again.
+        listed=[_item(4, 3), _item(0, -1), _item(3, 2), _item(2, 1), _item(1, 5)],
+    )
+
+    first = [item async for item in stream()]
+    assert first == [_item(1, 0), _item(2, 1)]
+
+    second = [item async for item in stream()]
+    assert second == [_item(3, 2), _item(4, 3), _item(1, 5), _item(5, 4)]
+    assert stream.backfilled == 3
+    assert stream.duplicates == 3
+    assert stream.last_time == _item(1, 5)[1]
+
+
+async def test_backfill_timeout_resumes_streaming() -> None:
+    """Test that the stream resumes even if the backfill times out."""
+    connections = [[_item(1, 0)], [_item(2, 1)]]
+
+    async def open_stream() -> AsyncIterator[_Item]:
+        for item in connections.pop(0):
+            yield item
+
+    async def backfill() -> AsyncIterator[_Item]:
+        raise asyncio.TimeoutError()
+        yield  # pylint: disable=unreachable
+
+    stream: ResumableStream[_Item, _Item] = ResumableStream(
+        "test",
+        open_stream=open_stream,
+        transform=lambda item: item,
+        backfill=backfill,
+        key=lambda item: item,
+        time=lambda item: item[1],
+    )
+
+    assert [item async for item in stream()] == [_item(1, 0)]
+    assert [item async for item in stream()] == [_item(2, 1)]
+    assert stream.backfilled == 0
+    assert stream.backfill_timeouts == 1
+
+
+async def test_backfill_since_first_opened() -> None:
+    """Test that the items missed are backfilled even if none was received."""
+    stream = _resumable_stream(
+        [[], []],
+        listed=[_item(1, 0), (2, datetime.now(timezone.utc) - timedelta(hours=1))],
+    )
+    assert stream.last_time is None
+
+    assert not [item async for item in stream()]
+    assert stream.last_time is not None
+    assert [item async for item in stream()] == [_item(1, 0)]
+    assert stream.backfilled == 1
+
+
+async def test_client_resumable_streams() -> None:
+    """Test that resumable streams are separate from the other streams."""
+    client = Client("grpc://resumable.host:50051?ssl=false", connect=False)
+
+    async def endless_stream(*_: Any, **__: Any) -> AsyncIterator[Any]:
+        await asyncio.Event().wait()
+        yield
+
+    stub = MagicMock()
+    stub.ReceiveGridpoolOrdersStream.side_effect = endless_stream
+    stub.ReceiveGridpoolTradesStream.side_effect = endless_stream
+    client._stub = stub  # pylint: disable=protected-access
+
+    orders = client.gridpool_orders_stream(1, resumable=True)
+    assert client.gridpool_orders_stream(1, resumable=True) is orders
+    assert client.gridpool_orders_stream(1) is not orders
+    trades = client.gridpool_trades_stream(1, resumable=True)
+    await asyncio.sleep(0)
+
+    assert stub.ReceiveGridpoolOrdersStream.call_count == 2
+    stub.ReceiveGridpoolTradesStream.assert_called_once()
+    await client.close()
+    assert not orders.is_running
+    assert not trades.is_running
@@ -0,0 +1,72 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the retrying of idempotent requests."""
+
+import asyncio
+
+import grpc
+import pytest
+from frequenz.client.base import retry
+
+from frequenz.client.electricity_trading import RetryPolicy
+from frequenz.client.electricity_trading._retry import call_with_retry
+
+
+def _rpc_error(code: grpc.StatusCode) -> grpc.aio.AioRpcError:
+    return grpc.aio.AioRpcError(
+        code, grpc.aio.Metadata(), grpc.aio.Metadata(), None, None
+    )
+
+
+def test_is_retryable() -> None:
+    """Test the classification of errors."""
+    policy = RetryPolicy()
+
+    assert policy.is_retryable(_rpc_error(grpc.StatusCode.UNAVAILABLE))
+    assert policy.is_retryable(asyncio.TimeoutError())
+    assert not policy.is_retryable(_rpc_error(grpc.StatusCode.INVALID_ARGUMENT))
+    assert not policy.is_retryable(ValueError())
+
+
+async def test_call_with_retry() -> None:
+    """Test that transient errors are retried until the call succeeds."""
+    policy = RetryPolicy(strategy=retry.LinearBackoff(interval=0.0, jitter=0.0))
+    attempts: list[int] = []
+
+    async def call() -> str:
+        attempts.append(len(attempts))
+        if len(attempts) < 3:
+            raise _rpc_error(grpc.StatusCode.UNAVAILABLE)
+        return "done"
+
+    assert await call_with_retry(call, policy, "call") == "done"
+    assert len(attempts) == 3
+
+
+@pytest.mark.parametrize(
+    "code, limit, expected_attempts",
+    [
+        (grpc.StatusCode.UNAVAILABLE, 2, 3),
+        (grpc.StatusCode.PERMISSION_DENIED, 2, 1),
+    ],
+)
+async def test_call_with_retry_gives_up(
+    code: grpc.StatusCode, limit: int, expected_attempts: int
+) -> None:
+    """Test that the last error is raised when retrying is not possible."""
+    policy = RetryPolicy(
+        strategy=retry.LinearBackoff(interval=0.0, jitter=0.0, limit=limit)
+    )
+    attempts: list[int] = []
+
+    async def call() -> str:
+        attempts.append(len(attempts))
+        raise _rpc_error(code)
+
+    with pytest.raises(grpc.aio.AioRpcError) as exc_info:
+        await call_with_retry(call, policy, "call")
+    assert exc_info.value.code() == code
+    assert len(attempts) == expected_attempts
+    # The strategy of the policy is copied, not consumed.
+    assert len(list(policy.strategy)) == limit
@@ -0,0 +1,256 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the snapshot-then-subscribe helper."""
+
+import asyncio
+from typing import Any, AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+from frequenz.api.electricity_trading.v1 import electricity_trading_pb2
+from frequenz.channels import Broadcast, Receiver
+from frequenz.client.base.retry import LinearBackoff
+
+from frequenz.client.electricity_trading import (
+    Client,
+    SnapshotOverflowError,
+    SnapshotSubscription,
+)
+from frequenz.client.electricity_trading._snapshot import SnapshotFollower
+
+_Item = tuple[str, int]
+"""An item key and its version."""
+
+
+async def test_snapshot_then_updates_without_duplicates() -> None:
+    """Test that the updates received while listing follow the snapshot."""
+    channel: Broadcast[_Item] = Broadcast(name="updates")
+    sender = channel.new_sender()
+
+    async def snapshot() -> AsyncIterator[_Item]:
+        yield ("a", 1)
+        # Updates received while listing, one of them already in the snapshot.
+        await sender.send(("b", 2))
+        await sender.send(("a", 2))
+        await asyncio.sleep(0)
+        yield ("b", 2)
+        yield ("c", 1)
+
+    async def subscribe(maxsize: int) -> Receiver[_Item]:
+        return channel.new_receiver(limit=maxsize)
+
+    subscription = SnapshotSubscription(
+        subscribe,
+        snapshot,
+        key=lambda item: item[0],
+        version=lambda item: item[1],
+    )
+
+    received: list[_Item] = []
+
+    async def consume() -> None:
+        async for item in subscription:
+            received.append(item)
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    await sender.send(("c", 1))
+    await sender.send(("c", 2))
+    await channel.close()
+    await consumer
+
+    assert received == [("a", 1), ("b", 2), ("c", 1), ("a", 2), ("c", 2)]
+    assert subscription.buffer_high_water_mark == 2
+    # The versions are dropped once a newer live update is received.
+    versions = subscription._versions  # pylint: disable=protected-access
+    assert versions == {"a": 2, "b": 2}
+
+
+async def test_snapshot_buffer_overflow() -> None:
+    """Test that iterating fails if the buffer is too small."""
+    channel: Broadcast[_Item] = Broadcast(name="updates")
+    sender = channel.new_sender()
+
+    async def snapshot() -> AsyncIterator[_Item]:
+        for version in range(3):
+            await sender.send(("a", version))
+            await asyncio.sleep(0)
+        yield ("a", 0)
+
+    async def subscribe(maxsize: int) -> Receiver[_Item]:
+        return channel.new_receiver(limit=maxsize)
+
+    subscription = SnapshotSubscription(
+        subscribe,
+        snapshot,
+        key=lambda item: item[0],
+        version=lambda item: item[1],
+        buffer_size=2,
+    )
+
+    with pytest.raises(SnapshotOverflowError):
+        async for _ in subscription:
+            pass
+    assert subscription.buffer_high_water_mark == 2
+
+
+async def test_follower_relists_after_overflow() -> None:
+    """Test that the follower lists the snapshot again after a backoff."""
+    channel: Broadcast[_Item] = Broadcast(name="updates")
+    sender = channel.new_sender()
+    listings: list[float] = []
+
+    async def snapshot() -> AsyncIterator[_Item]:
+        listings.append(asyncio.get_running_loop().time())
+        if len(listings) == 1:
+            for version in range(3):
+                await sender.send(("a", version))
+                await asyncio.sleep(0)
+        yield ("a", 2)
+
+    async def subscribe(maxsize: int) -> Receiver[_Item]:
+        return channel.new_receiver(limit=maxsize)
+
+    applied: list[_Item] = []
+    follower = SnapshotFollower(
+        "items",
+        lambda: SnapshotSubscription(
+            subscribe,
+            snapshot,
+            key=lambda item: item[0],
+            version=lambda item: item[1],
+            buffer_size=2,
+        ),
+        applied.append,
+        relist_strategy=LinearBackoff(interval=0.05, jitter=0.0),
+    )
+    await follower.start()
+
+    assert follower.is_synced
+    assert applied == [("a", 2)]
+    assert len(listings) == 2
+    assert listings[1] - listings[0] >= 0.05
+    await follower.stop()
+
+
+async def test_follower_skips_items_failing_to_apply() -> None:
+    """Test that items failing to apply are skipped without stopping the follower."""
+    channel: Broadcast[_Item] = Broadcast(name="updates")
+    sender = channel.new_sender()
+
+    async def snapshot() -> AsyncIterator[_Item]:
+        yield ("a", 1)
+        yield ("bad", 1)
+
+    async def subscribe(maxsize: int) -> Receiver[_Item]:
+        return channel.new_receiver(limit=maxsize)
+
+    applied: list[_Item] = []
+
+    def apply(item: _Item) -> None:
+        if item[0] == "bad":
+            raise ValueError("Bad item")
+        applied.append(item)
+
+    follower = SnapshotFollower(
+        "items",
+        lambda: SnapshotSubscription(
+            subscribe,
+            snapshot,
+            key=lambda item: item[0],
+            version=lambda item: item[1],
+        ),
+        apply,
+    )
+    await follower.start()
+    await sender.send(("b", 1))
+    await asyncio.sleep(0.01)
+
+    assert applied == [("a", 1), ("b", 1)]
+    assert follower.apply_errors == 1
+    assert follower.is_synced
+    await follower.stop()
+
+
+async def test_snapshot_subscribes_when_iterating() -> None:
+    """Test that the stream is only subscribed to when iterating."""
+    channel: Broadcast[_Item] = Broadcast(name="updates")
+    buffer_sizes: list[int] = []
+
+    async def subscribe(maxsize: int) -> Receiver[_Item]:
+        buffer_sizes.append(maxsize)
+        return channel.new_receiver(limit=maxsize)
+
+    async def snapshot() -> AsyncIterator[_Item]:
+        yield ("a", 1)
+
+    subscription = SnapshotSubscription(
+        subscribe,
+        snapshot,
+        key=lambda item: item[0],
+        version=lambda item: item[1],
+        buffer_size=5,
+    )
+    await asyncio.sleep(0.01)
+    assert not buffer_sizes
+
+    await channel.close()
+    assert [item async for item in subscription] == [("a", 1)]
+    assert buffer_sizes == [5]
+
+
+async def test_client_lists_once_streaming() -> None:
+    """Test that the client lists the snapshot after requesting the stream."""
+    client = Client("grpc://snapshot.host:50051?ssl=false", connect=False)
+    calls: list[str] = []
+
+    async def endless_stream() -> AsyncIterator[Any]:
+        await asyncio.Event().wait()
+        yield
+
+    def open_stream(*_: Any, **__: Any) -> AsyncIterator[Any]:
+        calls.append("stream")
+        return endless_stream()
+
+    async def list_orders(*_: Any, **__: Any) -> Any:
+        calls.append("list")
+        return electricity_trading_pb2.ListGridpoolOrdersResponse()
+
+    stub = MagicMock()
+    stub.ReceiveGridpoolOrdersStream.side_effect = open_stream
+    stub.ListGridpoolOrders.side_effect = list_orders
+    client._stub = stub  # pylint: disable=protected-access
+
+    subscription = client.snapshot_and_stream_gridpool_orders(1)
+    await asyncio.sleep(0.01)
+    assert not calls
+
+    async def consume() -> None:
+        async for _ in subscription:
+            pass
+
+    updates = asyncio.create_task(consume())
+    await asyncio.sleep(0.01)
+    assert calls == ["stream", "list"]
+    assert subscription.snapshot_sent
+
+    updates.cancel()
+    await client.close()
+
+
+def test_snapshot_buffer_size_validation() -> None:
+    """Test that invalid buffer sizes are rejected."""
+    channel: Broadcast[_Item] = Broadcast(name="updates")
+
+    async def subscribe(maxsize: int) -> Receiver[_Item]:
+        return channel.new_receiver(limit=maxsize)
+
+    with pytest.raises(ValueError):
+        SnapshotSubscription(
+            subscribe,
+            lambda: None,  # type: ignore[arg-type, return-value]
+            key=lambda item: item[0],
+            version=lambda item: item[1],
+            buffer_size=0,
+        )
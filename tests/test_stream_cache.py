@@ -0,0 +1,130 @@
+# License: MIT
+# Copyright © 2025 Frequenz Energy-as-a-Service GmbH
+
+"""Tests for the cache of streams."""
+
+import asyncio
+from datetime import timedelta
+from typing import Any, AsyncIterator
+from unittest.mock import MagicMock
+
+import pytest
+
+from frequenz.client.electricity_trading import Client, StreamCachePolicy
+from frequenz.client.electricity_trading._stream_cache import (
+    CachedStreamBroadcaster,
+    StreamCache,
+)
+
+
+async def _endless_stream(*_: Any, **__: Any) -> AsyncIterator[int]:
+    """Stream a single message and then nothing, forever.
+
+    Yields:
+        The only message of the stream.
+    """
+    yield 1
+    await asyncio.Event().wait()
+
+
+def _new_stream(name: str) -> CachedStreamBroadcaster[int, int]:
+    """Create a stream broadcaster over an endless stream.
+
+    Args:
+        name: The name of the stream.
+
+    Returns:
+        The stream broadcaster.
+    """
+    return CachedStreamBroadcaster(name, _endless_stream, lambda message: message)
+
+
+def test_stream_cache_policy_validation() -> None:
+    """Test that invalid policies are rejected."""
+    with pytest.raises(ValueError):
+        StreamCachePolicy(idle_timeout=timedelta())
+    with pytest.raises(ValueError):
+        StreamCachePolicy(max_streams=0)
+
+
+async def test_stopped_streams_are_replaced() -> None:
+    """Test that stopped streams are not returned."""
+    cache = StreamCache()
+    stream = _new_stream("a")
+    cache.add("a", stream)
+    assert cache.get("a") is stream
+
+    await stream.stop()
+    assert cache.get("a") is None
+    assert len(cache) == 0
+
+
+async def test_idle_streams_are_stopped() -> None:
+    """Test that streams without receivers are stopped after the idle timeout."""
+    cache = StreamCache(StreamCachePolicy(idle_timeout=timedelta(milliseconds=40)))
+    used = _new_stream("used")
+    unused = _new_stream("unused")
+    cache.add("used", used)
+    cache.add("unused", unused)
+    receiver = used.new_receiver()
+
+    await asyncio.sleep(0.1)
+
+    assert cache.get("used") is used
+    assert cache.get("unused") is None
+    assert not unused.is_running
+    stats = cache.stats
+    assert (stats.streams, stats.receivers, stats.idle_evictions) == (1, 1, 1)
+    assert stats.buffered_messages == 1
+
+    del receiver
+    await asyncio.sleep(0.1)
+    assert cache.get("used") is None
+    assert not used.is_running
+    await cache.close()
+
+
+async def test_least_recently_used_streams_are_stopped() -> None:
+    """Test that the least recently used idle stream makes room for new ones."""
+    cache = StreamCache(StreamCachePolicy(max_streams=2))
+    first, second, third = _new_stream("1"), _new_stream("2"), _new_stream("3")
+    cache.add(1, first)
+    cache.add(2, second)
+    receiver = first.new_receiver()
+    assert cache.get(1) is first
+
+    cache.add(3, third)
+    await asyncio.sleep(0)
+
+    assert cache.get(2) is None
+    assert cache.get(1) is first
+    assert cache.get(3) is third
+    assert cache.stats.lru_evictions == 1
+    assert receiver is not None
+
+    await cache.close()
+    assert not first.is_running
+    assert not third.is_running
+
+
+async def test_client_stream_cache_policy() -> None:
+    """Test that the streams over the limit of the client are stopped."""
+    client = Client(
+        "grpc://streaming.host:50051?ssl=false",
+        connect=False,
+        stream_cache_policy=StreamCachePolicy(max_streams=1),
+    )
+    stub = MagicMock()
+    stub.ReceiveGridpoolOrdersStream.side_effect = _endless_stream
+    stub.ReceivePublicTradesStream.side_effect = _endless_stream
+    client._stub = stub  # pylint: disable=protected-access
+
+    first = client.gridpool_orders_stream(1)
+    assert client.gridpool_orders_stream(1) is first
+    client.public_trades_stream()
+    await asyncio.sleep(0.01)
+
+    stats = client.stream_cache_stats
+    assert (stats.streams, stats.lru_evictions) == (1, 1)
+    assert not first.is_running
+    await client.close()
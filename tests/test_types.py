@@ -3,6 +3,7 @@
 
 """Tests for the type conversions used with the client."""
 
+import pickle
 from datetime import datetime, timedelta, timezone
 from decimal import Decimal
 from typing import Any, Callable, TypeVar
@@ -24,6 +25,9 @@ from frequenz.client.electricity_trading import (
     DeliveryPeriod,
     EnergyMarketCodeType,
     GridpoolOrderFilter,
+    LazyOrderDetail,
+    LazyPublicTrade,
+    LazyTrade,
     MarketActor,
     MarketSide,
     Order,
@@ -653,3 +657,29 @@ def test_update_order_to_pb_with_empty_values() -> None:
     # Make sure all attributes are None
     non_none_attrs = converted_update_order.ListFields()
     assert len(non_none_attrs) == 0
+
+
+@pytest.mark.parametrize(
+    "value",
+    [
+        ORDER,
+        ORDER_DETAIL,
+        ORDER_DETAIL.state_detail,
+        TRADE,
+        PUBLIC_TRADE,
+        ORDER.price,
+        ORDER.quantity,
+        ORDER.delivery_area,
+        ORDER.delivery_period,
+        LazyOrderDetail.from_pb(ORDER_DETAIL_PB),
+        LazyTrade.from_pb(TRADE_PB),
+        LazyPublicTrade.from_pb(PUBLIC_TRADE_PB),
+    ],
+)
+def test_types_use_slots(value: Any) -> None:
+    """Test that the types store their fields in slots, keeping their semantics."""
+    assert not hasattr(value, "__dict__")
+    copy = pickle.loads(pickle.dumps(value))
+    assert copy == value
+    if type(value).__hash__ is not None:
+        assert hash(copy) == hash(value)